@@ -0,0 +1,69 @@
+# Copyright 2023 ⓒ Kakao Brain Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import torch
+import triton
+import util
+
+import trident
+
+
+@util.report(
+    "attention forward",
+    ["sz_seq"],
+    [256 * 2**i for i in range(0, 6)],
+    {"num_bt": 4, "num_hd": 16, "sz_d": 64},
+)
+def bench_attention_forward(num_bt, num_hd, sz_seq, sz_d, ctx):
+    ctor_args = {"device": "cuda", "dtype": torch.float16}
+    q = torch.randn(num_bt, num_hd, sz_seq, sz_d, **ctor_args)
+    k = torch.randn(num_bt, num_hd, sz_seq, sz_d, **ctor_args)
+    v = torch.randn(num_bt, num_hd, sz_seq, sz_d, **ctor_args)
+
+    if ctx == "torch":
+        return triton.testing.do_bench(
+            lambda: torch.softmax(q @ k.transpose(-2, -1) * sz_d**-0.5, -1) @ v
+        )
+    else:
+        return triton.testing.do_bench(lambda: trident.function.attention(q, k, v))
+
+
+@util.report(
+    "attention backward",
+    ["sz_seq"],
+    [256 * 2**i for i in range(0, 6)],
+    {"num_bt": 4, "num_hd": 16, "sz_d": 64},
+)
+def bench_attention_backward(num_bt, num_hd, sz_seq, sz_d, ctx):
+    ctor_args = {"device": "cuda", "dtype": torch.float16, "requires_grad": True}
+    q = torch.randn(num_bt, num_hd, sz_seq, sz_d, **ctor_args)
+    k = torch.randn(num_bt, num_hd, sz_seq, sz_d, **ctor_args)
+    v = torch.randn(num_bt, num_hd, sz_seq, sz_d, **ctor_args)
+
+    if ctx == "torch":
+        out = torch.softmax(q @ k.transpose(-2, -1) * sz_d**-0.5, -1) @ v
+    else:
+        out = trident.function.attention(q, k, v)
+
+    grad_out = torch.ones_like(out)
+
+    return triton.testing.do_bench(lambda: out.backward(grad_out, retain_graph=True))
+
+
+def run_benchmark(mode, show_plots):
+    if mode == "forward":
+        bench_attention_forward.run(print_data=True, show_plots=show_plots)
+    else:
+        bench_attention_backward.run(print_data=True, show_plots=show_plots)
@@ -35,8 +35,95 @@ def bench_conv2d_forward(num_bt, inp_ch, inp_sz, out_ch, wgt_sz, ctx):
         return triton.testing.do_bench(lambda: trident.function.conv2d(inp, wgt))
 
 
+@util.report(
+    "conv2d resnet forward",
+    ["ch"],
+    [64 * i for i in range(1, 9)],
+    {"num_bt": 16, "inp_sz": 28, "wgt_sz": 3},
+)
+def bench_conv2d_resnet_forward(num_bt, ch, inp_sz, wgt_sz, ctx):
+    inp = torch.randn(num_bt, ch, inp_sz, inp_sz, device="cuda")
+    wgt = torch.randn(ch, ch, wgt_sz, wgt_sz, device="cuda")
+
+    if ctx == "torch":
+        return triton.testing.do_bench(
+            lambda: torch.nn.functional.conv2d(inp, wgt, padding=1)
+        )
+    else:
+        return triton.testing.do_bench(
+            lambda: trident.function.conv2d(inp, wgt, padding=1)
+        )
+
+
+@util.report(
+    "conv2d resnet backward",
+    ["ch"],
+    [64 * i for i in range(1, 9)],
+    {"num_bt": 16, "inp_sz": 28, "wgt_sz": 3},
+)
+def bench_conv2d_resnet_backward(num_bt, ch, inp_sz, wgt_sz, ctx):
+    inp = torch.randn(num_bt, ch, inp_sz, inp_sz, device="cuda", requires_grad=True)
+    wgt = torch.randn(ch, ch, wgt_sz, wgt_sz, device="cuda", requires_grad=True)
+
+    if ctx == "torch":
+        out = torch.nn.functional.conv2d(inp, wgt, padding=1)
+    else:
+        out = trident.function.conv2d(inp, wgt, padding=1)
+
+    grad_out = torch.ones_like(out)
+
+    return triton.testing.do_bench(lambda: out.backward(grad_out, retain_graph=True))
+
+
+@util.report(
+    "conv2d resnet channels last forward",
+    ["ch"],
+    [64 * i for i in range(1, 9)],
+    {"num_bt": 16, "inp_sz": 28, "wgt_sz": 3},
+)
+def bench_conv2d_resnet_channels_last_forward(num_bt, ch, inp_sz, wgt_sz, ctx):
+    inp = torch.randn(num_bt, ch, inp_sz, inp_sz, device="cuda")
+    inp = inp.to(memory_format=torch.channels_last)
+    wgt = torch.randn(ch, ch, wgt_sz, wgt_sz, device="cuda")
+    wgt = wgt.to(memory_format=torch.channels_last)
+
+    if ctx == "torch":
+        return triton.testing.do_bench(
+            lambda: torch.nn.functional.conv2d(inp, wgt, padding=1)
+        )
+    else:
+        return triton.testing.do_bench(
+            lambda: trident.function.conv2d(inp, wgt, padding=1)
+        )
+
+
+@util.report(
+    "conv2d depthwise forward",
+    ["ch"],
+    [64 * i for i in range(1, 9)],
+    {"num_bt": 16, "inp_sz": 56, "wgt_sz": 3},
+)
+def bench_conv2d_depthwise_forward(num_bt, ch, inp_sz, wgt_sz, ctx):
+    inp = torch.randn(num_bt, ch, inp_sz, inp_sz, device="cuda")
+    wgt = torch.randn(ch, 1, wgt_sz, wgt_sz, device="cuda")
+
+    if ctx == "torch":
+        return triton.testing.do_bench(
+            lambda: torch.nn.functional.conv2d(inp, wgt, padding=1, groups=ch)
+        )
+    else:
+        return triton.testing.do_bench(
+            lambda: trident.function.conv2d(inp, wgt, padding=1, groups=ch)
+        )
+
+
 def run_benchmark(mode, show_plots):
     if mode == "forward":
         bench_conv2d_forward.run(print_data=True, show_plots=show_plots)
+        bench_conv2d_resnet_forward.run(print_data=True, show_plots=show_plots)
+        bench_conv2d_resnet_channels_last_forward.run(
+            print_data=True, show_plots=show_plots
+        )
+        bench_conv2d_depthwise_forward.run(print_data=True, show_plots=show_plots)
     elif mode == "backward":
-        raise NotImplementedError("The backward isn't implemented.")
+        bench_conv2d_resnet_backward.run(print_data=True, show_plots=show_plots)
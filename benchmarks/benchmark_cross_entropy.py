@@ -0,0 +1,65 @@
+# Copyright 2023 ⓒ Kakao Brain Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import torch
+import triton
+import util
+
+import trident
+
+
+@util.report(
+    "cross entropy forward",
+    ["vec_sz"],
+    [4096 * i for i in range(1, 21)],
+    {"num_bt": 32},
+)
+def bench_cross_entropy_forward(num_bt, vec_sz, ctx):
+    inp = torch.randn(num_bt, vec_sz, device="cuda")
+    tgt = torch.randint(0, vec_sz, (num_bt,), device="cuda")
+
+    if ctx == "torch":
+        return triton.testing.do_bench(
+            lambda: torch.nn.functional.cross_entropy(inp, tgt)
+        )
+    else:
+        return triton.testing.do_bench(lambda: trident.function.cross_entropy(inp, tgt))
+
+
+@util.report(
+    "cross entropy backward",
+    ["vec_sz"],
+    [4096 * i for i in range(1, 21)],
+    {"num_bt": 32},
+)
+def bench_cross_entropy_backward(num_bt, vec_sz, ctx):
+    inp = torch.randn(num_bt, vec_sz, device="cuda", requires_grad=True)
+    tgt = torch.randint(0, vec_sz, (num_bt,), device="cuda")
+
+    if ctx == "torch":
+        lyr = torch.nn.CrossEntropyLoss()
+    else:
+        lyr = trident.CrossEntropyLoss()
+
+    out = lyr.forward(inp, tgt)
+
+    return triton.testing.do_bench(lambda: out.backward(retain_graph=True))
+
+
+def run_benchmark(mode, show_plots):
+    if mode == "forward":
+        bench_cross_entropy_forward.run(print_data=True, show_plots=show_plots)
+    else:
+        bench_cross_entropy_backward.run(print_data=True, show_plots=show_plots)
@@ -0,0 +1,62 @@
+# Copyright 2023 ⓒ Kakao Brain Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import torch
+import triton
+import util
+
+import trident
+
+
+def gated_linear(inp, wgt):
+    gate, up = torch.nn.functional.linear(inp, wgt).chunk(2, -1)
+    return torch.nn.functional.silu(gate) * up
+
+
+@util.report(
+    "gated linear forward", ["k", "n"], [256 * i for i in range(1, 21)], {"m": 512}
+)
+def bench_gated_linear_forward(m, n, k, ctx):
+    inp = torch.randn(m, k, device="cuda")
+    wgt = torch.randn(2 * n, k, device="cuda")
+
+    if ctx == "torch":
+        return triton.testing.do_bench(lambda: gated_linear(inp, wgt))
+    else:
+        return triton.testing.do_bench(lambda: trident.function.gated_linear(inp, wgt))
+
+
+@util.report(
+    "gated linear backward", ["k", "n"], [256 * i for i in range(1, 21)], {"m": 512}
+)
+def bench_gated_linear_backward(m, n, k, ctx):
+    inp = torch.randn(m, k, device="cuda", requires_grad=True)
+    wgt = torch.randn(2 * n, k, device="cuda", requires_grad=True)
+
+    if ctx == "torch":
+        out = gated_linear(inp, wgt)
+    else:
+        out = trident.function.gated_linear(inp, wgt)
+
+    grad_out = torch.ones_like(out)
+
+    return triton.testing.do_bench(lambda: out.backward(grad_out, retain_graph=True))
+
+
+def run_benchmark(mode, show_plots):
+    if mode == "forward":
+        bench_gated_linear_forward.run(print_data=True, show_plots=show_plots)
+    else:
+        bench_gated_linear_backward.run(print_data=True, show_plots=show_plots)
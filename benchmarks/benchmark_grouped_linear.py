@@ -0,0 +1,74 @@
+# Copyright 2023 ⓒ Kakao Brain Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import torch
+import triton
+import util
+
+import trident
+
+
+@util.report(
+    "grouped linear forward",
+    ["num_grp"],
+    [8 * i for i in range(1, 17)],
+    {"m": 32, "k": 512, "n": 512},
+)
+def bench_grouped_linear_forward(num_grp, m, k, n, ctx):
+    inps = [torch.randn(m, k, device="cuda") for _ in range(num_grp)]
+    wgts = [torch.randn(n, k, device="cuda") for _ in range(num_grp)]
+    biss = [torch.randn(n, device="cuda") for _ in range(num_grp)]
+
+    if ctx == "torch":
+        return triton.testing.do_bench(
+            lambda: list(map(torch.nn.functional.linear, inps, wgts, biss))
+        )
+    else:
+        return triton.testing.do_bench(
+            lambda: trident.function.grouped_linear(inps, wgts, biss)
+        )
+
+
+@util.report(
+    "grouped linear backward",
+    ["num_grp"],
+    [8 * i for i in range(1, 17)],
+    {"m": 32, "k": 512, "n": 512},
+)
+def bench_grouped_linear_backward(num_grp, m, k, n, ctx):
+    inps = [
+        torch.randn(m, k, device="cuda", requires_grad=True) for _ in range(num_grp)
+    ]
+    wgts = [
+        torch.randn(n, k, device="cuda", requires_grad=True) for _ in range(num_grp)
+    ]
+
+    if ctx == "torch":
+        outs = list(map(torch.nn.functional.linear, inps, wgts))
+    else:
+        outs = trident.function.grouped_linear(inps, wgts)
+
+    grad_outs = [torch.ones_like(out) for out in outs]
+
+    return triton.testing.do_bench(
+        lambda: torch.autograd.backward(outs, grad_outs, retain_graph=True)
+    )
+
+
+def run_benchmark(mode, show_plots):
+    if mode == "forward":
+        bench_grouped_linear_forward.run(print_data=True, show_plots=show_plots)
+    else:
+        bench_grouped_linear_backward.run(print_data=True, show_plots=show_plots)
@@ -33,6 +33,42 @@ def bench_linear_forward(m, n, k, ctx):
         return triton.testing.do_bench(lambda: trident.function.linear(inp, wgt, bis))
 
 
+@util.report(
+    "linear skinny forward", ["k", "n"], [512 * i for i in range(1, 17)], {"m": 16}
+)
+def bench_linear_skinny_forward(m, n, k, ctx):
+    inp = torch.randn(m, k, device="cuda")
+    wgt = torch.randn(n, k, device="cuda")
+    bis = torch.randn(n, device="cuda")
+
+    if ctx == "torch":
+        return triton.testing.do_bench(
+            lambda: torch.nn.functional.linear(inp, wgt, bis)
+        )
+    else:
+        return triton.testing.do_bench(lambda: trident.function.linear(inp, wgt, bis))
+
+
+@util.report(
+    "linear gelu residual forward", ["m", "k", "n"], [64 * i for i in range(1, 21)]
+)
+def bench_linear_gelu_residual_forward(m, n, k, ctx):
+    inp = torch.randn(m, k, device="cuda")
+    wgt = torch.randn(n, k, device="cuda")
+    bis = torch.randn(n, device="cuda")
+    res = torch.randn(m, n, device="cuda")
+
+    if ctx == "torch":
+        return triton.testing.do_bench(
+            lambda: torch.nn.functional.gelu(torch.nn.functional.linear(inp, wgt, bis))
+            + res
+        )
+    else:
+        return triton.testing.do_bench(
+            lambda: trident.function.linear(inp, wgt, bis, "gelu", 1.0, res)
+        )
+
+
 @util.report("linear backward", ["m", "k", "n"], [64 * i for i in range(1, 21)])
 def bench_linear_backward(m, n, k, ctx):
     inp = torch.randn(m, k, device="cuda")
@@ -51,5 +87,7 @@ def bench_linear_backward(m, n, k, ctx):
 def run_benchmark(mode, show_plots):
     if mode == "forward":
         bench_linear_forward.run(print_data=True, show_plots=show_plots)
+        bench_linear_skinny_forward.run(print_data=True, show_plots=show_plots)
+        bench_linear_gelu_residual_forward.run(print_data=True, show_plots=show_plots)
     else:
         bench_linear_backward.run(print_data=True, show_plots=show_plots)
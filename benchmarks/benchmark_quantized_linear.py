@@ -0,0 +1,46 @@
+# Copyright 2023 ⓒ Kakao Brain Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import torch
+import triton
+import util
+
+import trident
+
+
+@util.report(
+    "quantized linear forward",
+    ["k", "n"],
+    [512 * i for i in range(1, 17)],
+    {"m": 16, "bits": 4},
+)
+def bench_quantized_linear_forward(m, n, k, bits, ctx):
+    inp = torch.randn(m, k, device="cuda", dtype=torch.float16)
+    wgt = torch.randn(n, k, device="cuda", dtype=torch.float16)
+
+    if ctx == "torch":
+        return triton.testing.do_bench(lambda: torch.nn.functional.linear(inp, wgt))
+    else:
+        qnt, scl = trident.util.quantize(wgt, bits, 128)
+        return triton.testing.do_bench(
+            lambda: trident.function.quantized_linear(inp, qnt, scl, None, "", bits)
+        )
+
+
+def run_benchmark(mode, show_plots):
+    if mode == "forward":
+        bench_quantized_linear_forward.run(print_data=True, show_plots=show_plots)
+    else:
+        raise NotImplementedError("The backward isn't implemented.")
@@ -15,18 +15,24 @@
 import argparse
 
 import benchmark_adaptive_avg_pool2d
+import benchmark_attention
 import benchmark_batch_norm
 import benchmark_conv2d
+import benchmark_cross_entropy
 import benchmark_dropout
+import benchmark_gated_linear
 import benchmark_gelu
 import benchmark_group_norm
+import benchmark_grouped_linear
 import benchmark_instance_norm
 import benchmark_layer_norm
 import benchmark_leaky_relu
 import benchmark_linear
 import benchmark_max_pool2d
 import benchmark_prelu
+import benchmark_quantized_linear
 import benchmark_relu
+import benchmark_rms_norm
 import benchmark_silu
 import benchmark_softmax
 
@@ -37,18 +43,24 @@ def print_scenarios():
         ", ".join(
             [
                 "adaptive-avg-pool2d",
+                "attention",
                 "batch-norm",
                 "conv2d",
+                "cross-entropy",
                 "dropout",
+                "gated-linear",
                 "gelu",
                 "group-norm",
+                "grouped-linear",
                 "instance-norm",
                 "layer-norm",
                 "leaky-relu",
                 "linear",
                 "max-pool2d",
                 "prelu",
+                "quantized-linear",
                 "relu",
+                "rms-norm",
                 "silu",
                 "softmax",
             ]
@@ -59,16 +71,24 @@ def print_scenarios():
 def run_benchmarks(scenario, mode, show_plots):
     if scenario == "adaptive-avg-pool2d":
         benchmark_adaptive_avg_pool2d.run_benchmark(mode, show_plots)
+    elif scenario == "attention":
+        benchmark_attention.run_benchmark(mode, show_plots)
     elif scenario == "batch-norm":
         benchmark_batch_norm.run_benchmark(mode, show_plots)
     elif scenario == "conv2d":
         benchmark_conv2d.run_benchmark(mode, show_plots)
+    elif scenario == "cross-entropy":
+        benchmark_cross_entropy.run_benchmark(mode, show_plots)
     elif scenario == "dropout":
         benchmark_dropout.run_benchmark(mode, show_plots)
+    elif scenario == "gated-linear":
+        benchmark_gated_linear.run_benchmark(mode, show_plots)
     elif scenario == "gelu":
         benchmark_gelu.run_benchmark(mode, show_plots)
     elif scenario == "group-norm":
         benchmark_group_norm.run_benchmark(mode, show_plots)
+    elif scenario == "grouped-linear":
+        benchmark_grouped_linear.run_benchmark(mode, show_plots)
     elif scenario == "instance-norm":
         benchmark_instance_norm.run_benchmark(mode, show_plots)
     elif scenario == "layer-norm":
@@ -81,26 +101,36 @@ def run_benchmarks(scenario, mode, show_plots):
         benchmark_max_pool2d.run_benchmark(mode, show_plots)
     elif scenario == "prelu":
         benchmark_prelu.run_benchmark(mode, show_plots)
+    elif scenario == "quantized-linear":
+        benchmark_quantized_linear.run_benchmark(mode, show_plots)
     elif scenario == "relu":
         benchmark_relu.run_benchmark(mode, show_plots)
+    elif scenario == "rms-norm":
+        benchmark_rms_norm.run_benchmark(mode, show_plots)
     elif scenario == "silu":
         benchmark_silu.run_benchmark(mode, show_plots)
     elif scenario == "softmax":
         benchmark_softmax.run_benchmark(mode, show_plots)
     elif not scenario:
         benchmark_adaptive_avg_pool2d.run_benchmark(mode, show_plots)
+        benchmark_attention.run_benchmark(mode, show_plots)
         benchmark_batch_norm.run_benchmark(mode, show_plots)
         benchmark_conv2d.run_benchmark(mode, show_plots)
+        benchmark_cross_entropy.run_benchmark(mode, show_plots)
         benchmark_dropout.run_benchmark(mode, show_plots)
+        benchmark_gated_linear.run_benchmark(mode, show_plots)
         benchmark_gelu.run_benchmark(mode, show_plots)
         benchmark_group_norm.run_benchmark(mode, show_plots)
+        benchmark_grouped_linear.run_benchmark(mode, show_plots)
         benchmark_instance_norm.run_benchmark(mode, show_plots)
         benchmark_layer_norm.run_benchmark(mode, show_plots)
         benchmark_leaky_relu.run_benchmark(mode, show_plots)
         benchmark_linear.run_benchmark(mode, show_plots)
         benchmark_max_pool2d.run_benchmark(mode, show_plots)
         benchmark_prelu.run_benchmark(mode, show_plots)
+        benchmark_quantized_linear.run_benchmark(mode, show_plots)
         benchmark_relu.run_benchmark(mode, show_plots)
+        benchmark_rms_norm.run_benchmark(mode, show_plots)
         benchmark_silu.run_benchmark(mode, show_plots)
         benchmark_softmax.run_benchmark(mode, show_plots)
     else:
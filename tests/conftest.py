@@ -12,15 +12,34 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import shutil
+import tempfile
+
 import pytest
 import torch
 
 
-@pytest.fixture(scope="session", params=[torch.float32, torch.float16])
+@pytest.fixture(
+    scope="session",
+    params=[torch.float32, torch.float16, torch.bfloat16, torch.float64],
+)
 def dtype(request):
     return request.param
 
 
+def pytest_configure(config):
+    if "TRIDENT_AUTOTUNE_CACHE" not in os.environ:
+        config.autotune_cache = tempfile.mkdtemp(prefix="trident-autotune-")
+        os.environ["TRIDENT_AUTOTUNE_CACHE"] = config.autotune_cache
+
+
+def pytest_unconfigure(config):
+    if hasattr(config, "autotune_cache"):
+        shutil.rmtree(config.autotune_cache, ignore_errors=True)
+        del os.environ["TRIDENT_AUTOTUNE_CACHE"]
+
+
 def pytest_addoption(parser):
     parser.addoption("--device", action="store", default="cuda")
 
@@ -37,3 +37,14 @@ def test_forward(tgt_sz, dtype, device):
         torch.nn.AdaptiveAvgPool2d(tgt_sz).forward(inp),
         trident.AdaptiveAvgPool2d(tgt_sz).forward(inp),
     )
+
+
+@pytest.mark.parametrize("tgt_sz", [2, 4])
+def test_channels_last(tgt_sz, device):
+    inp = torch.randn(4, 4, 64, 64, device=device)
+    inp = inp.to(memory_format=torch.channels_last)
+    out = trident.function.adaptive_avg_pool2d(inp, tgt_sz)
+
+    assert out.device == inp.device
+    assert out.is_contiguous(memory_format=torch.channels_last)
+    assert util.equal(torch.nn.functional.adaptive_avg_pool2d(inp, tgt_sz), out)
@@ -0,0 +1,64 @@
+# Copyright 2023 ⓒ Kakao Brain Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+import torch
+
+import trident
+from tests import util
+
+
+@pytest.mark.parametrize(
+    "num_bt, num_hd, sz_q, sz_k, sz_d", [(2, 3, 64, 64, 32), (1, 2, 100, 70, 40)]
+)
+@pytest.mark.parametrize("is_causal", [False, True])
+def test_forward(num_bt, num_hd, sz_q, sz_k, sz_d, is_causal, dtype, device):
+    ctor_args = {"device": device, "dtype": dtype}
+    q = torch.randn(num_bt, num_hd, sz_q, sz_d, **ctor_args)
+    k = torch.randn(num_bt, num_hd, sz_k, sz_d, **ctor_args)
+    v = torch.randn(num_bt, num_hd, sz_k, sz_d, **ctor_args)
+
+    assert util.equal(
+        torch.nn.functional.scaled_dot_product_attention(q, k, v, is_causal=is_causal),
+        trident.function.attention(q, k, v, is_causal),
+    )
+
+
+@pytest.mark.parametrize(
+    "num_bt, num_hd, sz_q, sz_k, sz_d", [(2, 3, 64, 64, 32), (1, 2, 100, 70, 40)]
+)
+@pytest.mark.parametrize("is_causal", [False, True])
+def test_backward(num_bt, num_hd, sz_q, sz_k, sz_d, is_causal, dtype, device):
+    ctor_args = {"device": device, "dtype": dtype}
+    q = torch.randn(num_bt, num_hd, sz_q, sz_d, **ctor_args)
+    k = torch.randn(num_bt, num_hd, sz_k, sz_d, **ctor_args)
+    v = torch.randn(num_bt, num_hd, sz_k, sz_d, **ctor_args)
+    tgt = torch.randn(num_bt, num_hd, sz_q, sz_d, **ctor_args)
+
+    def train(func):
+        inps = [q.clone(), k.clone(), v.clone()]
+
+        for inp in inps:
+            inp.requires_grad = True
+
+        func(*inps, is_causal=is_causal).backward(tgt)
+        return [inp.grad for inp in inps]
+
+    (x, y, z) = train(torch.nn.functional.scaled_dot_product_attention)
+    (a, b, c) = train(trident.function.attention)
+
+    assert util.equal(x, a)
+    assert util.equal(y, b)
+    assert util.equal(z, c)
@@ -0,0 +1,120 @@
+# Copyright 2023 ⓒ Kakao Brain Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import torch
+import triton
+
+import trident
+
+
+def test_autotune_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("TRIDENT_AUTOTUNE_CACHE", str(tmp_path / "autotune"))
+    configs = trident.kernel.get_configs_linear_io_bound_forward()
+    key = (64, 512, 512)
+
+    cache = trident.util.AutotuneCache("Linear.forward", configs)
+    assert key not in cache
+
+    cache[key] = configs[3]
+
+    cache = trident.util.AutotuneCache("Linear.forward", configs)
+    assert cache[key] is configs[3]
+
+    cache = trident.util.AutotuneCache("Linear.forward", configs[:3])
+    assert key not in cache
+
+    cache = trident.util.AutotuneCache("Linear.backward_input", configs)
+    assert key not in cache
+
+
+def test_autotune_cache_tag(tmp_path, monkeypatch):
+    monkeypatch.setenv("TRIDENT_AUTOTUNE_CACHE", str(tmp_path / "autotune"))
+    configs = trident.kernel.get_configs_linear_io_bound_forward()
+    tuner = trident.kernel.Linear.forward
+    key = (64, 512, 512)
+
+    trident.util.AutotuneCache("Linear.forward", configs, tuner)[key] = configs[3]
+
+    cache = trident.util.AutotuneCache("Linear.forward", configs, tuner)
+    assert cache[key] is configs[3]
+
+    cache = trident.util.AutotuneCache(
+        "Linear.forward", configs, trident.kernel.Linear.backward_input
+    )
+    assert key not in cache
+
+    monkeypatch.setattr(triton, "__version__", "0.0.0")
+    cache = trident.util.AutotuneCache("Linear.forward", configs, tuner)
+    assert key not in cache
+
+
+def test_autotune_cache_device(tmp_path, monkeypatch):
+    monkeypatch.setenv("TRIDENT_AUTOTUNE_CACHE", str(tmp_path / "autotune"))
+    configs = trident.kernel.get_configs_linear_io_bound_forward()
+    tuner = trident.kernel.Linear.forward
+    key = (64, 512, 512)
+
+    cache = trident.util.AutotuneCache("Linear.forward", configs, tuner)
+    nargs = {"x_ptr": torch.empty(1, device="meta")}
+    monkeypatch.setattr(tuner, "nargs", nargs, raising=False)
+    cache[key] = configs[3]
+    assert key in cache
+
+    monkeypatch.setattr(tuner, "nargs", None)
+    assert key not in cache
+
+    monkeypatch.setattr(tuner, "nargs", nargs)
+    cache = trident.util.AutotuneCache("Linear.forward", configs, tuner)
+    assert cache[key] is configs[3]
+
+
+def test_autotune_cache_invalidate(tmp_path, monkeypatch):
+    monkeypatch.setenv("TRIDENT_AUTOTUNE_CACHE", str(tmp_path / "autotune"))
+    configs = trident.kernel.get_configs_linear_io_bound_forward()
+    key = (64, 512, 512)
+
+    trident.util.AutotuneCache("Linear.forward", configs)[key] = configs[3]
+
+    monkeypatch.setenv("TRIDENT_AUTOTUNE_CACHE_INVALIDATE", "1")
+    cache = trident.util.AutotuneCache("Linear.forward", configs)
+    assert key not in cache
+
+    cache[key] = configs[4]
+    cache = trident.util.AutotuneCache("Linear.forward", configs)
+    assert cache[key] is configs[4]
+
+    monkeypatch.delenv("TRIDENT_AUTOTUNE_CACHE_INVALIDATE")
+    cache = trident.util.AutotuneCache("Linear.forward", configs)
+    assert cache[key] is configs[3]
+
+
+def test_load_autotune_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("TRIDENT_AUTOTUNE_CACHE", str(tmp_path / "autotune"))
+    tuner = trident.kernel.Linear.forward
+    cache = trident.util.AutotuneCache("Linear.forward", tuner.configs, tuner)
+    cache[(1, 2, 3)] = tuner.configs[0]
+
+    for cls in vars(trident.kernel).values():
+        for fn in vars(cls).values() if isinstance(cls, type) else []:
+            fn = fn.__func__ if isinstance(fn, staticmethod) else fn
+
+            if isinstance(fn, triton.runtime.Autotuner):
+                monkeypatch.setattr(fn, "cache", fn.cache)
+
+    trident.util.load_autotune_cache(trident.kernel)
+
+    assert isinstance(trident.kernel.Linear.forward, triton.runtime.Autotuner)
+    assert isinstance(trident.kernel.Linear.forward.cache, trident.util.AutotuneCache)
+    assert trident.kernel.Linear.forward.cache[(1, 2, 3)] is tuner.configs[0]
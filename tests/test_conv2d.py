@@ -19,8 +19,19 @@ import trident
 from tests import util
 
 
+def train(func, inp, wgt, bis):
+    i = inp.clone()
+    j = wgt.clone()
+    k = bis.clone()
+    i.requires_grad = j.requires_grad = k.requires_grad = True
+    out = func(i, j, k)
+    out.backward(torch.ones_like(out))
+    return i.grad, j.grad, k.grad
+
+
 @pytest.mark.parametrize(
-    "num_bt, inp_ch, out_ch", [(1, 3, 1), (5, 4, 8), (6, 3, 9), (10, 16, 36)]
+    "num_bt, inp_ch, out_ch",
+    [(1, 3, 1), (5, 4, 8), (6, 3, 9), (10, 16, 36), (2, 256, 64)],
 )
 def test_function(num_bt, inp_ch, out_ch, device):
     inp = torch.randn(num_bt, inp_ch, 5, 5, device=device)
@@ -42,8 +53,138 @@ def test_function(num_bt, inp_ch, out_ch, device):
 def test_forward(num_bt, inp_ch, wgt_sz, device):
     inp = torch.randn(4, num_bt, 64, 64, device=device)
 
-    lyr0 = torch.nn.Conv2d(num_bt, inp_ch, wgt_sz, dtype=torch.float, device="cuda")
-    lyr1 = trident.Conv2d(num_bt, inp_ch, wgt_sz)
+    lyr0 = torch.nn.Conv2d(num_bt, inp_ch, wgt_sz, device=device, dtype=torch.float)
+    lyr1 = trident.Conv2d(num_bt, inp_ch, wgt_sz, device=device, dtype=torch.float)
+    assert lyr1.weight.device == lyr0.weight.device
+    assert lyr1.weight.shape == lyr0.weight.shape
     lyr1.weight, lyr1.bias = lyr0.weight, lyr0.bias
 
     assert util.equal(lyr0.forward(inp), lyr1.forward(inp))
+
+
+@pytest.mark.parametrize(
+    "num_bt, inp_ch, out_ch, wgt_sz",
+    [(1, 3, 1, 2), (2, 4, 8, 3), (3, 16, 20, 1), (2, 5, 34, 4)],
+)
+def test_backward(num_bt, inp_ch, out_ch, wgt_sz, device):
+    inp = torch.randn(num_bt, inp_ch, 9, 11, device=device)
+    wgt = torch.randn(out_ch, inp_ch, wgt_sz, wgt_sz, device=device)
+    bis = torch.randn(out_ch, device=device)
+
+    x = train(torch.nn.functional.conv2d, inp, wgt, bis)
+    a = train(trident.function.conv2d, inp, wgt, bis)
+
+    for x, a in zip(x, a):
+        assert util.equal(x, a)
+
+
+@pytest.mark.parametrize(
+    "stride, padding, dilation, groups",
+    [
+        (2, 0, 1, 1),
+        (1, 1, 1, 1),
+        ((2, 1), (1, 2), 1, 1),
+        (1, 2, 2, 1),
+        (1, 1, 1, 2),
+        (2, 1, 1, 8),
+    ],
+)
+def test_forward_options(stride, padding, dilation, groups, device):
+    inp = torch.randn(2, 8, 13, 10, device=device)
+    wgt = torch.randn(16, 8 // groups, 3, 3, device=device)
+    bis = torch.randn(16, device=device)
+
+    assert util.equal(
+        torch.nn.functional.conv2d(inp, wgt, bis, stride, padding, dilation, groups),
+        trident.function.conv2d(inp, wgt, bis, stride, padding, dilation, groups),
+    )
+
+
+@pytest.mark.parametrize(
+    "stride, padding, dilation, groups",
+    [
+        (2, 0, 1, 1),
+        (1, 1, 1, 1),
+        ((2, 1), (1, 2), 1, 1),
+        (1, 2, 2, 1),
+        (1, 1, 1, 2),
+        (2, 1, 1, 8),
+    ],
+)
+def test_backward_options(stride, padding, dilation, groups, device):
+    inp = torch.randn(2, 8, 13, 10, device=device)
+    wgt = torch.randn(16, 8 // groups, 3, 3, device=device)
+    bis = torch.randn(16, device=device)
+
+    def func(i, j, k):
+        return torch.nn.functional.conv2d(i, j, k, stride, padding, dilation, groups)
+
+    x = train(func, inp, wgt, bis)
+    a = train(
+        lambda i, j, k: trident.function.conv2d(
+            i, j, k, stride, padding, dilation, groups
+        ),
+        inp,
+        wgt,
+        bis,
+    )
+
+    for x, a in zip(x, a):
+        assert util.equal(x, a)
+
+
+def test_forward_dtype(dtype, device):
+    inp = torch.randn(2, 4, 8, 8, dtype=dtype, device=device)
+    wgt = torch.randn(8, 4, 3, 3, dtype=dtype, device=device)
+    out = trident.function.conv2d(inp, wgt, padding=1)
+
+    assert out.dtype == dtype and out.device == inp.device
+    assert util.equal(torch.nn.functional.conv2d(inp, wgt, padding=1), out)
+
+
+@pytest.mark.parametrize("groups", [1, 4])
+def test_channels_last(groups, device):
+    inp = torch.randn(2, 8, 13, 10, device=device)
+    inp = inp.to(memory_format=torch.channels_last)
+    wgt = torch.randn(16, 8 // groups, 3, 3, device=device)
+    bis = torch.randn(16, device=device)
+
+    def func(i, j, k):
+        return torch.nn.functional.conv2d(i, j, k, padding=1, groups=groups)
+
+    assert trident.function.conv2d(
+        inp, wgt, bis, padding=1, groups=groups
+    ).is_contiguous(memory_format=torch.channels_last)
+
+    x = train(func, inp, wgt, bis)
+    a = train(
+        lambda i, j, k: trident.function.conv2d(i, j, k, padding=1, groups=groups),
+        inp,
+        wgt,
+        bis,
+    )
+
+    for x, a in zip(x, a):
+        assert util.equal(x, a)
+
+
+def test_unbatched(device):
+    inp = torch.randn(4, 9, 9, device=device)
+    wgt = torch.randn(8, 4, 3, 3, device=device)
+    bis = torch.randn(8, device=device)
+
+    def func(i, j, k):
+        return torch.nn.functional.conv2d(i, j, k, padding=1)
+
+    out = trident.function.conv2d(inp, wgt, bis, padding=1)
+
+    assert out.shape == (8, 9, 9)
+    assert util.equal(func(inp, wgt, bis), out)
+
+    x = train(func, inp, wgt, bis)
+    a = train(
+        lambda i, j, k: trident.function.conv2d(i, j, k, padding=1), inp, wgt, bis
+    )
+
+    for x, a in zip(x, a):
+        assert util.equal(x, a)
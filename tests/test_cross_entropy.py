@@ -0,0 +1,137 @@
+# Copyright 2023 ⓒ Kakao Brain Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+import torch
+
+import trident
+from tests import util
+
+
+@pytest.mark.parametrize("num_vec, vec_sz", [(5, 32), (4, 30000)])
+@pytest.mark.parametrize("reduction", ["none", "mean", "sum"])
+def test_forward(num_vec, vec_sz, reduction, dtype, device):
+    ctor_args = {"device": device, "dtype": dtype}
+    inp = torch.randn(num_vec, vec_sz, **ctor_args)
+    tgt = torch.randint(0, vec_sz, (num_vec,), device=device)
+    tgt[0] = -100
+
+    assert util.equal(
+        torch.nn.functional.cross_entropy(inp, tgt, reduction=reduction),
+        trident.function.cross_entropy(inp, tgt, reduction=reduction),
+    )
+
+
+@pytest.mark.parametrize("num_vec, vec_sz", [(5, 70), (4, 30000)])
+@pytest.mark.parametrize("reduction", ["none", "mean", "sum"])
+def test_backward(num_vec, vec_sz, reduction, dtype, device):
+    ctor_args = {"device": device, "dtype": dtype}
+    inp = torch.randn(num_vec, vec_sz, **ctor_args)
+    tgt = torch.randint(0, vec_sz, (num_vec,), device=device)
+    tgt[0] = -100
+
+    def train(func):
+        i = inp.clone()
+        i.requires_grad = True
+        func(i, tgt, reduction=reduction).sum().backward()
+        return [i.grad]
+
+    (x,) = train(torch.nn.functional.cross_entropy)
+    (a,) = train(trident.function.cross_entropy)
+
+    assert util.equal(x, a)
+
+
+def test_inplace(dtype, device):
+    ctor_args = {"device": device, "dtype": dtype}
+    inp = torch.randn(8, 100, **ctor_args, requires_grad=True)
+    tgt = torch.randint(0, 100, (8,), device=device)
+
+    x = torch.nn.functional.cross_entropy(inp, tgt)
+    x.backward()
+
+    i = inp.detach().clone().requires_grad_()
+    a = trident.function.cross_entropy(i, tgt, inplace=True)
+    a.backward()
+
+    assert util.equal(x, a)
+    assert util.equal(inp.grad, i.grad)
+    assert util.equal(i.grad, i)
+
+
+def test_inplace_storage(device):
+    inp = torch.randn(8, 100, device=device, requires_grad=True)
+    tgt = torch.randint(0, 100, (8,), device=device)
+    ptrs = []
+
+    x = inp * 1.0
+    x.register_hook(lambda grad: ptrs.append(grad.data_ptr()))
+    trident.function.cross_entropy(x, tgt, inplace=True).backward()
+
+    assert ptrs == [x.data_ptr()]
+
+    y = torch.nn.functional.cross_entropy(inp.detach(), tgt)
+    x = inp.detach().clone()
+    a = trident.function.cross_entropy(x, tgt, inplace=True)
+
+    assert util.equal(y, a)
+    assert torch.equal(x, inp.detach())
+
+
+def test_fp64(device):
+    inp = torch.randn(4, 30000, dtype=torch.float64, device=device) * 10
+    tgt = torch.randint(0, 30000, (4,), device=device)
+
+    def train(func):
+        i = inp.clone()
+        i.requires_grad = True
+        out = func(i, tgt)
+        out.backward()
+        return out, i.grad
+
+    x = train(torch.nn.functional.cross_entropy)
+    a = train(trident.function.cross_entropy)
+
+    for x, a in zip(x, a):
+        assert torch.allclose(x, a, rtol=1e-10, atol=1e-12)
+
+
+def test_out_of_range_target(device):
+    inp = torch.randn(3, 10, device=device)
+    tgt = torch.tensor([1, 10, -2], device=device)
+    loss = trident.function.cross_entropy(inp, tgt, reduction="none")
+
+    assert util.equal(torch.nn.functional.cross_entropy(inp[:1], tgt[:1]), loss[0])
+    assert loss[1:].isnan().all()
+
+
+@pytest.mark.parametrize("inplace", [False, True])
+def test_backward_twice(inplace, device):
+    inp = torch.randn(8, 100, device=device)
+    tgt = torch.randint(0, 100, (8,), device=device)
+
+    x = inp.clone().requires_grad_()
+    torch.nn.functional.cross_entropy(x, tgt).backward()
+
+    a = inp.clone().requires_grad_()
+    loss = trident.function.cross_entropy(a * 1.0, tgt, inplace=inplace) * 2.0
+    loss.backward(retain_graph=True)
+
+    if inplace:
+        with pytest.raises(RuntimeError):
+            loss.backward()
+    else:
+        loss.backward()
+        assert util.equal(x.grad * 4.0, a.grad)
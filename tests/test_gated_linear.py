@@ -0,0 +1,62 @@
+# Copyright 2023 ⓒ Kakao Brain Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+import torch
+
+import trident
+from tests import util
+
+
+def gated_linear(inp, wgt, act):
+    gate, up = torch.nn.functional.linear(inp, wgt).chunk(2, -1)
+    return util.activate(gate, act) * up
+
+
+@pytest.mark.parametrize(
+    "inp_sh, out_feat, act",
+    [((64, 48), 20, "silu"), ((2, 7, 40), 33, "gelu"), ((5, 128), 64, "gelu_tanh")],
+)
+def test_forward(inp_sh, out_feat, act, dtype, device):
+    ctor_args = {"device": device, "dtype": dtype}
+    inp = torch.randn(inp_sh, **ctor_args)
+    wgt = torch.randn(2 * out_feat, inp_sh[-1], **ctor_args)
+
+    assert util.equal(
+        gated_linear(inp, wgt, act), trident.function.gated_linear(inp, wgt, act)
+    )
+
+
+@pytest.mark.parametrize(
+    "inp_sh, out_feat, act", [((12, 34), 3, "silu"), ((2, 9, 16), 24, "gelu")]
+)
+def test_backward(inp_sh, out_feat, act, dtype, device):
+    ctor_args = {"device": device, "dtype": dtype}
+    inp = torch.randn(inp_sh, **ctor_args)
+    wgt = torch.randn(2 * out_feat, inp_sh[-1], **ctor_args)
+    grad_out = torch.randn(*inp_sh[:-1], out_feat, **ctor_args)
+
+    def train(func):
+        i = inp.clone()
+        j = wgt.clone()
+        i.requires_grad = j.requires_grad = True
+        func(i, j, act).backward(grad_out, retain_graph=True)
+        return i.grad, j.grad
+
+    (x, y) = train(gated_linear)
+    (a, b) = train(trident.function.gated_linear)
+
+    assert util.equal(x, a)
+    assert util.equal(y, b)
@@ -59,3 +59,34 @@ def test_backward(num_vec, vec_sz, num_grp, afn, device):
     if afn:
         assert util.equal(lyr0.weight.grad, lyr1.weight.grad)
         assert util.equal(lyr0.bias.grad, lyr1.bias.grad)
+
+
+def test_backward_deterministic(device):
+    ctor_args = {"device": device}
+    inp = torch.randn(300, 16, **ctor_args)
+    tgt = torch.randn(300, 16, **ctor_args)
+
+    def train(lyr):
+        i = inp.clone()
+        i.requires_grad = True
+        lyr.zero_grad(set_to_none=True)
+        util.train(i, tgt, lyr)
+        return i.grad, lyr.weight.grad, lyr.bias.grad
+
+    lyr0 = torch.nn.GroupNorm(4, 16, **ctor_args)
+    lyr1 = trident.GroupNorm(4, 16, **ctor_args)
+
+    x = train(lyr0)
+    torch.use_deterministic_algorithms(True)
+
+    try:
+        a = train(lyr1)
+        b = train(lyr1)
+    finally:
+        torch.use_deterministic_algorithms(False)
+
+    for grad_x, grad_a in zip(x, a):
+        assert util.equal(grad_x, grad_a)
+
+    assert torch.equal(a[1], b[1])
+    assert torch.equal(a[2], b[2])
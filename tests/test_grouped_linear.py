@@ -0,0 +1,66 @@
+# Copyright 2023 ⓒ Kakao Brain Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+import torch
+
+import trident
+from tests import util
+
+
+@pytest.mark.parametrize("num_bts, inp_feat, out_feat", [([1, 17, 0, 70], 40, 24)])
+def test_forward(num_bts, inp_feat, out_feat, dtype, device):
+    ctor_args = {"device": device, "dtype": dtype}
+    inps = [torch.randn(num_bt, inp_feat, **ctor_args) for num_bt in num_bts]
+    wgts = [torch.randn(out_feat, inp_feat, **ctor_args) for _ in num_bts]
+    biss = [torch.randn(out_feat, **ctor_args) for _ in num_bts]
+
+    for x, a in zip(
+        map(torch.nn.functional.linear, inps, wgts, biss),
+        trident.function.grouped_linear(inps, wgts, biss),
+    ):
+        assert util.equal(x, a)
+
+    for x, a in zip(
+        map(torch.nn.functional.linear, inps, wgts),
+        trident.function.grouped_linear(inps, wgts),
+    ):
+        assert util.equal(x, a)
+
+
+@pytest.mark.parametrize("num_bts, inp_feat, out_feat", [([5, 33, 2], 24, 12)])
+def test_backward(num_bts, inp_feat, out_feat, dtype, device):
+    ctor_args = {"device": device, "dtype": dtype}
+    inps = [torch.randn(num_bt, inp_feat, **ctor_args) for num_bt in num_bts]
+    wgts = [torch.randn(out_feat, inp_feat, **ctor_args) for _ in num_bts]
+    biss = [torch.randn(out_feat, **ctor_args) for _ in num_bts]
+    grad_outs = [torch.randn(num_bt, out_feat, **ctor_args) for num_bt in num_bts]
+
+    def train(func):
+        tensors = [x.clone() for x in inps + wgts + biss]
+
+        for x in tensors:
+            x.requires_grad = True
+
+        num_grp = len(num_bts)
+        outs = func(*[tensors[i : i + num_grp] for i in range(0, 3 * num_grp, num_grp)])
+        torch.autograd.backward(outs, grad_outs)
+        return [x.grad for x in tensors]
+
+    grads0 = train(lambda i, w, b: list(map(torch.nn.functional.linear, i, w, b)))
+    grads1 = train(trident.function.grouped_linear)
+
+    for x, a in zip(grads0, grads1):
+        assert util.equal(x, a)
@@ -147,3 +147,31 @@ def test_instance_norm2d(num_batches, num_channels, height, width, device, dtype
         num_channels, affine=False, track_running_stats=True, **factory_kwargs
     )
     assert operation.forward(input) is not None
+
+
+@pytest.mark.parametrize("num_batches, num_channels, height, width", [(2, 8, 16, 16)])
+def test_channels_last(num_batches, num_channels, height, width, device):
+    factory_kwargs = {"device": device}
+    input = torch.randn(num_batches, num_channels, height, width, **factory_kwargs)
+    input = input.to(memory_format=torch.channels_last)
+    input = input.view(num_batches, num_channels, -1)
+    target = torch.randn(num_batches, num_channels, height * width, **factory_kwargs)
+    weight = torch.randn(num_channels, **factory_kwargs)
+    bias = torch.randn(num_channels, **factory_kwargs)
+
+    def train(func):
+        i = input.clone()
+        j = weight.clone()
+        k = bias.clone()
+        i.requires_grad = j.requires_grad = k.requires_grad = True
+        out = func(i, weight=j, bias=k)
+        out.backward(target, retain_graph=True)
+        return [out, i.grad, j.grad, k.grad]
+
+    (x, y, z, w) = train(torch.nn.functional.instance_norm)
+    (a, b, c, d) = train(trident.function.instance_norm)
+
+    assert util.equal(x, a)
+    assert util.equal(y, b)
+    assert util.equal(z, c)
+    assert util.equal(w, d)
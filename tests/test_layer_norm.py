@@ -50,7 +50,9 @@ def test_forward(num_vec, vec_sz, dtype, device):
     )
 
 
-@pytest.mark.parametrize("num_vec, vec_sz, elem_afn", [(3, 10, False), (11, 40, True)])
+@pytest.mark.parametrize(
+    "num_vec, vec_sz, elem_afn", [(3, 10, False), (11, 40, True), (2, 20000, True)]
+)
 def test_backward(num_vec, vec_sz, elem_afn, dtype, device):
     inp = torch.randn(num_vec, vec_sz, dtype=dtype, device=device)
     tgt = torch.randn(num_vec, vec_sz, dtype=dtype, device=device)
@@ -75,3 +77,94 @@ def test_backward(num_vec, vec_sz, elem_afn, dtype, device):
     if elem_afn:
         assert util.equal(lyr0.weight.grad, lyr1.weight.grad)
         assert util.equal(lyr0.bias.grad, lyr1.bias.grad)
+
+
+@pytest.mark.parametrize("num_vec, vec_sz", [(300, 40), (2, 20000)])
+def test_backward_deterministic(num_vec, vec_sz, dtype, device):
+    inp = torch.randn(num_vec, vec_sz, dtype=dtype, device=device)
+    tgt = torch.randn(num_vec, vec_sz, dtype=dtype, device=device)
+    norm_sh = [inp.shape[-1]]
+
+    def train(lyr):
+        i = inp.clone()
+        i.requires_grad = True
+        lyr.zero_grad(set_to_none=True)
+        util.train(i, tgt, lyr)
+        return i.grad, lyr.weight.grad, lyr.bias.grad
+
+    lyr0 = torch.nn.LayerNorm(norm_sh, dtype=dtype, device=device)
+    lyr1 = trident.LayerNorm(norm_sh, dtype=dtype, device=device)
+
+    x = train(lyr0)
+    torch.use_deterministic_algorithms(True)
+
+    try:
+        a = train(lyr1)
+        b = train(lyr1)
+    finally:
+        torch.use_deterministic_algorithms(False)
+
+    for grad_x, grad_a in zip(x, a):
+        assert util.equal(grad_x, grad_a)
+
+    assert torch.equal(a[1], b[1])
+    assert torch.equal(a[2], b[2])
+
+
+@pytest.mark.parametrize("num_vec, vec_sz", [(3, 16), (2, 20000)])
+def test_add_forward(num_vec, vec_sz, dtype, device):
+    inp = torch.randn(num_vec, vec_sz, dtype=dtype, device=device)
+    res = torch.randn(num_vec, vec_sz, dtype=dtype, device=device)
+    wgt = torch.randn(vec_sz, dtype=dtype, device=device)
+    bis = torch.randn(vec_sz, dtype=dtype, device=device)
+    norm_sh = [vec_sz]
+
+    out, res_out = trident.function.add_layer_norm(inp, res, norm_sh, wgt, bis)
+
+    assert util.equal(inp + res, res_out)
+    assert util.equal(torch.nn.functional.layer_norm(inp + res, norm_sh, wgt, bis), out)
+
+
+@pytest.mark.parametrize("num_vec, vec_sz", [(11, 40), (2, 20000)])
+def test_add_backward(num_vec, vec_sz, dtype, device):
+    inp = torch.randn(num_vec, vec_sz, dtype=dtype, device=device)
+    res = torch.randn(num_vec, vec_sz, dtype=dtype, device=device)
+    wgt = torch.randn(vec_sz, dtype=dtype, device=device)
+    bis = torch.randn(vec_sz, dtype=dtype, device=device)
+    grad_out = torch.randn(num_vec, vec_sz, dtype=dtype, device=device)
+    grad_res = torch.randn(num_vec, vec_sz, dtype=dtype, device=device)
+    norm_sh = [vec_sz]
+
+    def torch_add_layer_norm(inp, res, norm_sh, wgt, bis):
+        res = inp + res
+        return torch.nn.functional.layer_norm(res, norm_sh, wgt, bis), res
+
+    def train(func):
+        x = [t.clone().requires_grad_() for t in (inp, res, wgt, bis)]
+        out, res_out = func(x[0], x[1], norm_sh, x[2], x[3])
+        torch.autograd.backward([out, res_out], [grad_out, grad_res])
+        return [t.grad for t in x]
+
+    for x, a in zip(
+        train(torch_add_layer_norm), train(trident.function.add_layer_norm)
+    ):
+        assert util.equal(x, a)
+
+
+def test_fp64(device):
+    inp = torch.randn(2, 20000, dtype=torch.float64, device=device) + 1000
+    grad_out = torch.randn_like(inp)
+    norm_sh = [inp.shape[-1]]
+
+    def train(func):
+        i = inp.clone()
+        i.requires_grad = True
+        out = func(i, norm_sh)
+        out.backward(grad_out)
+        return out, i.grad
+
+    x = train(torch.nn.functional.layer_norm)
+    a = train(trident.function.layer_norm)
+
+    for x, a in zip(x, a):
+        assert torch.allclose(x, a, rtol=1e-10, atol=1e-10)
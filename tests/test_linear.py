@@ -21,7 +21,7 @@ from tests import util
 
 @pytest.mark.parametrize(
     "num_bt, inp_feat, out_feat, act",
-    [(512, 512, 100, "relu"), (200, 120, 15, "leaky_relu")],
+    [(512, 512, 100, "relu"), (200, 120, 15, "leaky_relu"), (4, 4096, 96, "relu")],
 )
 def test_forward(num_bt, inp_feat, out_feat, act, device):
     inp = torch.randn(num_bt, inp_feat, device=device)
@@ -72,3 +72,188 @@ def test_backward(num_bt, inp_feat, out_feat, act, device):
     assert util.equal(x.grad, a.grad)
     assert util.equal(lyr0.weight.grad, lyr1.weight.grad)
     assert util.equal(lyr0.bias.grad, lyr1.bias.grad)
+
+
+@pytest.mark.parametrize(
+    "num_bt, act, scale",
+    [(64, "gelu", 1.0), (100, "gelu_tanh", 0.5), (16, "silu", 2.0), (16, "relu", 0.5)],
+)
+def test_forward_epilogue(num_bt, act, scale, device):
+    inp = torch.randn(num_bt, 48, device=device)
+    wgt = torch.randn(20, 48, device=device)
+    bis = torch.randn(20, device=device)
+    res = torch.randn(num_bt, 20, device=device)
+
+    assert util.equal(
+        util.activate(torch.nn.functional.linear(inp, wgt, bis), act) * scale + res,
+        trident.function.linear(inp, wgt, bis, act, scale, res),
+    )
+
+
+def test_forward_dropout(device):
+    inp = torch.randn(64, 48, device=device)
+    wgt = torch.randn(20, 48, device=device)
+    res = torch.randn(64, 20, device=device)
+
+    assert util.equal(
+        res, trident.function.linear(inp, wgt, None, "relu", 1.0, res, 1.0)
+    )
+    assert util.equal(
+        torch.nn.functional.linear(inp, wgt) + res,
+        trident.function.linear(inp, wgt, None, "", 1.0, res, 0.5, False),
+    )
+
+
+@pytest.mark.parametrize(
+    "act, scale, p", [("gelu", 1.0, 0.0), ("silu", 0.5, 0.0), ("relu", 2.0, 0.3)]
+)
+def test_backward_epilogue(act, scale, p, device):
+    inp = torch.randn(20, 24, device=device)
+    wgt = torch.randn(12, 24, device=device)
+    bis = torch.randn(12, device=device)
+    res = torch.randn(20, 12, device=device)
+    grad_out = torch.randn(20, 12, device=device)
+
+    def train(func):
+        i = inp.clone()
+        j = wgt.clone()
+        k = bis.clone()
+        l = res.clone()
+        i.requires_grad = j.requires_grad = k.requires_grad = l.requires_grad = True
+        out = func(i, j, k, l)
+        out.backward(grad_out, retain_graph=True)
+        return out, i.grad, j.grad, k.grad, l.grad
+
+    (out, *grads) = train(
+        lambda i, j, k, l: trident.function.linear(i, j, k, act, scale, l, p)
+    )
+    msk = (out - res) != 0
+
+    def func(i, j, k, l):
+        out = util.activate(torch.nn.functional.linear(i, j, k), act) * scale
+        return torch.where(msk, out / (1 - p), 0.0) + l
+
+    for x, a in zip(train(func)[1:], grads):
+        assert util.equal(x, a)
+
+
+@pytest.mark.parametrize("dtype", [torch.bfloat16, torch.float64])
+def test_forward_dtype(dtype, device):
+    inp = torch.randn(64, 48, dtype=dtype, device=device)
+    wgt = torch.randn(20, 48, dtype=dtype, device=device)
+    bis = torch.randn(20, dtype=dtype, device=device)
+    out = trident.function.linear(inp, wgt, bis)
+
+    assert out.dtype == dtype
+    assert util.equal(torch.nn.functional.linear(inp, wgt, bis), out)
+
+
+@pytest.mark.parametrize("num_bt", [1, 16])
+def test_forward_split_k(num_bt, monkeypatch, device):
+    inp = torch.randn(num_bt, 8192, device=device)
+    wgt = torch.randn(8192, 8192, device=device)
+    bis = torch.randn(8192, device=device)
+    res = torch.randn(num_bt, 8192, device=device)
+
+    def forward():
+        return trident.function.linear(inp, wgt, bis, "relu", 0.5, res)
+
+    tgt = util.activate(torch.nn.functional.linear(inp, wgt, bis), "relu") * 0.5 + res
+
+    assert util.equal(tgt, forward())
+
+    tuner = trident.kernel.Linear.forward
+    configs = [config for config in tuner.configs if config.kwargs["split_k"] > 1]
+
+    assert configs
+    assert not any(
+        config.kwargs["split_k"] > 1
+        for config in trident.kernel.prune_configs_linear_forward(
+            tuner.configs, {"wsp_ptr": None}
+        )
+    )
+
+    for config in configs[:: len(configs) // 4]:
+        monkeypatch.setattr(tuner, "configs", [config])
+        monkeypatch.setattr(tuner, "cache", {})
+
+        assert util.equal(tgt, forward())
+
+
+@pytest.mark.parametrize("inp_sh, out_feat", [((2, 5, 34), 10), ((3, 4, 2, 16), 7)])
+def test_forward_nd(inp_sh, out_feat, device):
+    inp = torch.randn(inp_sh, device=device)
+    wgt = torch.randn(out_feat, inp_sh[-1], device=device)
+    bis = torch.randn(out_feat, device=device)
+
+    assert util.equal(
+        torch.nn.functional.linear(inp, wgt, bis),
+        trident.function.linear(inp, wgt, bis),
+    )
+
+
+def test_forward_strided(device):
+    inp = torch.randn(64, 96, device=device)[:, :48]
+    wgt = torch.randn(48, 20, device=device).t()
+
+    assert util.equal(
+        torch.nn.functional.linear(inp, wgt), trident.function.linear(inp, wgt)
+    )
+
+    inp = torch.randn(128, 48, device=device)[::2]
+
+    assert util.equal(
+        torch.nn.functional.linear(inp, wgt), trident.function.linear(inp, wgt)
+    )
+
+
+def test_forward_strided_no_copy(device):
+    inp = torch.randn(4, 128, 4096, device=device)[:, ::2]
+    wgt = torch.randn(16, 4096, device=device)
+
+    assert util.equal(
+        torch.nn.functional.linear(inp, wgt), trident.function.linear(inp, wgt)
+    )
+
+    torch.cuda.synchronize()
+    torch.cuda.reset_peak_memory_stats()
+    mem = torch.cuda.memory_allocated()
+    trident.function.linear(inp, wgt)
+
+    assert torch.cuda.max_memory_allocated() - mem < inp.numel() * inp.element_size()
+
+
+def test_backward_nd(device):
+    inp = torch.randn(2, 8, 24, device=device)[:, ::2]
+    wgt = torch.randn(6, 24, device=device)
+    bis = torch.randn(6, device=device)
+    grad_out = torch.randn(2, 4, 6, device=device)
+
+    def train(func):
+        i = inp.clone()
+        j = wgt.clone()
+        k = bis.clone()
+        i.requires_grad = j.requires_grad = k.requires_grad = True
+        func(i, j, k).backward(grad_out, retain_graph=True)
+        return i.grad, j.grad, k.grad
+
+    (x, y, z) = train(torch.nn.functional.linear)
+    (a, b, c) = train(trident.function.linear)
+
+    assert util.equal(x, a)
+    assert util.equal(y, b)
+    assert util.equal(z, c)
+
+
+def test_autotune_bucket():
+    assert trident.util.autotune_bucket(1) == 1
+    assert trident.util.autotune_bucket(33) == 64
+
+    trident.util.set_autotune_buckets([96, 48])
+
+    try:
+        assert trident.util.autotune_bucket(33) == 48
+        assert trident.util.autotune_bucket(49) == 96
+        assert trident.util.autotune_bucket(97) == 128
+    finally:
+        trident.util.set_autotune_buckets([])
@@ -0,0 +1,51 @@
+# Copyright 2023 ⓒ Kakao Brain Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+import torch
+
+import trident
+from tests import util
+
+
+@pytest.mark.parametrize(
+    "shape, dim", [((5, 32), 1), ((2, 30000), 1), ((2, 4, 16, 16), 2)]
+)
+def test_forward(shape, dim, dtype, device):
+    ctor_args = {"device": device, "dtype": dtype}
+    inp = torch.randn(shape, **ctor_args)
+
+    assert util.equal(
+        torch.nn.functional.log_softmax(inp, dim),
+        trident.function.log_softmax(inp, dim),
+    )
+
+
+@pytest.mark.parametrize("shape, dim", [((5, 70), 1), ((2, 4, 16, 16), 2)])
+def test_backward(shape, dim, device, dtype):
+    ctor_args = {"device": device, "dtype": dtype}
+    inp = torch.randn(shape, **ctor_args)
+    tgt = torch.randn(shape, **ctor_args)
+
+    def train(func):
+        i = inp.clone()
+        i.requires_grad = True
+        func(i, dim).backward(tgt, retain_graph=True)
+        return [i.grad]
+
+    (x,) = train(torch.nn.functional.log_softmax)
+    (a,) = train(trident.function.log_softmax)
+
+    assert util.equal(x, a)
@@ -50,6 +50,47 @@ def test_sum(height, width, axis, device, dtype):
     assert util.equal(torch.sum(input, dim=axis), output)
 
 
+@pytest.mark.parametrize("axis", [0, 1])
+def test_sum_float64(axis, device):
+    input = torch.tensor([[2**25, 1, 1, 1]] * 4, device=device, dtype=torch.float64)
+    input = input.t().contiguous() if axis == 0 else input
+    output = torch.empty(4, device=device, dtype=torch.float64)
+
+    def grid(meta):
+        return [4]
+
+    trident.kernel.sum[grid](
+        output, input, 4, 4, axis, 4, trident.util.dtype(torch.float64)
+    )
+
+    assert torch.equal(torch.full_like(output, 2**25 + 3), output)
+
+
+@triton.jit
+def mean_var(x_ptr, mean_ptr, var_ptr, x_sz, blk_sz: triton.language.constexpr):
+    i = triton.language.program_id(0)
+    mean, var = trident.kernel.mean_var(x_ptr + i * x_sz, x_sz, blk_sz)
+    triton.language.store(mean_ptr + i, mean)
+    triton.language.store(var_ptr + i, var)
+
+
+@pytest.mark.parametrize("num_vec, vec_sz, blk_sz", [(4, 1000, 256), (3, 70, 64)])
+@pytest.mark.parametrize("offset", [0.0, 1e4])
+def test_mean_var(num_vec, vec_sz, blk_sz, offset, device):
+    inp = torch.randn(num_vec, vec_sz, device=device) + offset
+    mean = torch.empty(num_vec, device=device)
+    var = torch.empty(num_vec, device=device)
+
+    def grid(meta):
+        return [num_vec]
+
+    mean_var[grid](inp, mean, var, vec_sz, blk_sz)
+    tgt_var, tgt_mean = torch.var_mean(inp, 1, unbiased=False)
+
+    assert util.equal(tgt_mean, mean)
+    assert util.equal(tgt_var, var)
+
+
 @pytest.mark.parametrize("axis", [0, 1])
 def test_sum_issue1(axis, device):
     dtype = torch.float16
@@ -37,3 +37,13 @@ def test_forward(knl_sz, dtype, device):
         torch.nn.MaxPool2d(knl_sz).forward(inp),
         trident.MaxPool2d(knl_sz).forward(inp),
     )
+
+
+@pytest.mark.parametrize("knl_sz", [2, 3])
+def test_channels_last(knl_sz, device):
+    inp = torch.randn(2, 3, 64, 64, device=device)
+    inp = inp.to(memory_format=torch.channels_last)
+    out = trident.function.max_pool2d(inp, knl_sz)
+
+    assert out.is_contiguous(memory_format=torch.channels_last)
+    assert util.equal(torch.nn.functional.max_pool2d(inp, knl_sz), out)
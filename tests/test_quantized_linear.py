@@ -0,0 +1,78 @@
+# Copyright 2023 ⓒ Kakao Brain Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+import torch
+
+import trident
+from tests import util
+
+
+def dequantize(qnt, scl, bits):
+    if bits == 4:
+        lo = torch.where(qnt & 0xF < 8, qnt & 0xF, (qnt & 0xF) - 16)
+        qnt = torch.stack([lo, qnt >> 4], -1).flatten(1)
+
+    qnt = qnt.float().view(scl.shape[0], scl.shape[1], -1)
+
+    return (qnt * scl.float()[:, :, None]).flatten(1)
+
+
+@pytest.mark.parametrize(
+    "num_bt, inp_feat, out_feat, bits, grp_sz",
+    [
+        (4, 96, 40, 8, None),
+        (33, 128, 20, 8, 32),
+        (7, 96, 40, 4, None),
+        (1, 256, 64, 4, 64),
+    ],
+)
+def test_forward(num_bt, inp_feat, out_feat, bits, grp_sz, dtype, device):
+    ctor_args = {"device": device, "dtype": dtype}
+    inp = torch.randn(num_bt, inp_feat, **ctor_args)
+    wgt = torch.randn(out_feat, inp_feat, **ctor_args)
+    bis = torch.randn(out_feat, **ctor_args)
+    qnt, scl = trident.util.quantize(wgt, bits, grp_sz)
+
+    assert util.equal(
+        torch.nn.functional.linear(inp, dequantize(qnt, scl, bits).to(dtype), bis),
+        trident.function.quantized_linear(inp, qnt, scl, bis, "", bits),
+    )
+
+
+@pytest.mark.parametrize("bits", [8, 4])
+def test_quantize_model(bits, device):
+    model = torch.nn.Sequential(torch.nn.Linear(64, 32, device=device), torch.nn.ReLU())
+    inp = torch.randn(5, 64, device=device)
+    out = model(inp)
+
+    trident.util.quantize_model(model, bits)
+
+    assert isinstance(model[0], trident.QuantizedLinear)
+    assert torch.allclose(out, model(inp), rtol=0.2, atol=0.2)
+
+
+def test_quantize_module(device):
+    mod = trident.Linear(64, 32).to(device)
+    assert isinstance(trident.util.quantize_module(mod), trident.QuantizedLinear)
+
+    for kwargs in ({"scale": 0.5}, {"p": 0.1}):
+        mod = trident.Linear(64, 32, **kwargs).to(device)
+        assert trident.util.quantize_module(mod) is None
+
+    model = torch.nn.Sequential(trident.Linear(64, 32, scale=0.5).to(device))
+    trident.util.quantize_model(model)
+
+    assert isinstance(model[0], trident.Linear)
@@ -0,0 +1,114 @@
+# Copyright 2023 ⓒ Kakao Brain Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+import torch
+
+import trident
+from tests import util
+
+
+@pytest.mark.parametrize("num_vec, vec_sz", [(3, 16), (2, 20000)])
+def test_forward(num_vec, vec_sz, dtype, device):
+    inp = torch.randn(num_vec, vec_sz, dtype=dtype, device=device)
+    norm_sh = [vec_sz]
+
+    assert util.equal(
+        util.rms_norm(inp, norm_sh),
+        trident.function.rms_norm(inp, norm_sh),
+    )
+
+    wgt = torch.randn(norm_sh, dtype=dtype, device=device)
+
+    assert util.equal(
+        util.rms_norm(inp, norm_sh, wgt, 1e-05),
+        trident.function.rms_norm(inp, norm_sh, wgt, 1e-05),
+    )
+
+
+@pytest.mark.parametrize(
+    "num_vec, vec_sz, elem_afn", [(3, 10, False), (11, 40, True), (2, 20000, True)]
+)
+def test_backward(num_vec, vec_sz, elem_afn, dtype, device):
+    inp = torch.randn(num_vec, vec_sz, dtype=dtype, device=device)
+    tgt = torch.randn(num_vec, vec_sz, dtype=dtype, device=device)
+    norm_sh = [vec_sz]
+
+    x = inp.clone()
+    a = inp.clone()
+    x.requires_grad = a.requires_grad = True
+
+    lyr = trident.RMSNorm(
+        norm_sh, elementwise_affine=elem_afn, dtype=dtype, device=device
+    )
+    wgt = torch.nn.Parameter(lyr.weight.detach().clone()) if elem_afn else None
+
+    util.train(x, tgt, lambda i: util.rms_norm(i, norm_sh, wgt))
+    util.train(a, tgt, lyr)
+
+    assert util.equal(x.grad, a.grad)
+
+    if elem_afn:
+        assert util.equal(wgt.grad, lyr.weight.grad)
+
+
+@pytest.mark.parametrize("num_vec, vec_sz", [(300, 40), (2, 20000)])
+def test_backward_deterministic(num_vec, vec_sz, dtype, device):
+    inp = torch.randn(num_vec, vec_sz, dtype=dtype, device=device)
+    tgt = torch.randn(num_vec, vec_sz, dtype=dtype, device=device)
+    norm_sh = [inp.shape[-1]]
+    lyr = trident.RMSNorm(norm_sh, dtype=dtype, device=device)
+    wgt = torch.nn.Parameter(lyr.weight.detach().clone())
+
+    def train(func):
+        i = inp.clone()
+        i.requires_grad = True
+        lyr.zero_grad(set_to_none=True)
+        util.train(i, tgt, func)
+        return i.grad, lyr.weight.grad
+
+    x = train(lambda i: util.rms_norm(i, norm_sh, wgt))
+    x = (x[0], wgt.grad)
+    torch.use_deterministic_algorithms(True)
+
+    try:
+        a = train(lyr)
+        b = train(lyr)
+    finally:
+        torch.use_deterministic_algorithms(False)
+
+    for grad_x, grad_a in zip(x, a):
+        assert util.equal(grad_x, grad_a)
+
+    assert torch.equal(a[1], b[1])
+
+
+def test_fp64(device):
+    inp = torch.randn(2, 20000, dtype=torch.float64, device=device) + 100
+    grad_out = torch.randn_like(inp)
+    norm_sh = [inp.shape[-1]]
+
+    def train(func):
+        i = inp.clone()
+        i.requires_grad = True
+        out = func(i, norm_sh, eps=1e-05)
+        out.backward(grad_out)
+        return out, i.grad
+
+    x = train(util.rms_norm)
+    a = train(trident.function.rms_norm)
+
+    for x, a in zip(x, a):
+        assert torch.allclose(x, a, rtol=1e-10, atol=1e-10)
@@ -29,7 +29,25 @@ def test_forward(num_vec, vec_sz, dtype, device):
     )
 
 
-@pytest.mark.parametrize("num_vec, vec_sz", [(4, 64), (5, 70)])
+@pytest.mark.parametrize(
+    "shape, dim", [((2, 3, 40), 1), ((2, 4, 16, 16), -1), ((2, 4, 16, 16), 2)]
+)
+def test_forward_nd(shape, dim, dtype, device):
+    ctor_args = {"device": device, "dtype": dtype}
+    inp = torch.randn(shape, **ctor_args)
+
+    assert util.equal(
+        torch.nn.functional.softmax(inp, dim), trident.function.softmax(inp, dim)
+    )
+
+    inp = inp.transpose(0, -1)
+
+    assert util.equal(
+        torch.nn.functional.softmax(inp, dim), trident.function.softmax(inp, dim)
+    )
+
+
+@pytest.mark.parametrize("num_vec, vec_sz", [(4, 64), (5, 70), (2, 30000)])
 def test_backward(num_vec, vec_sz, device, dtype):
     ctor_args = {"device": device, "dtype": dtype}
     inp = torch.randn(num_vec, vec_sz, **ctor_args)
@@ -45,3 +63,114 @@ def test_backward(num_vec, vec_sz, device, dtype):
     (a,) = train(trident.function.softmax, 1)
 
     assert util.equal(x, a)
+
+
+@pytest.mark.parametrize("shape, dim", [((2, 3, 40), 1), ((2, 4, 16, 16), 2)])
+def test_backward_nd(shape, dim, device, dtype):
+    ctor_args = {"device": device, "dtype": dtype}
+    inp = torch.randn(shape, **ctor_args).transpose(0, -1)
+    tgt = torch.randn(shape, **ctor_args).transpose(0, -1)
+
+    def train(func):
+        i = inp.clone()
+        i.requires_grad = True
+        func(i, dim).backward(tgt, retain_graph=True)
+        return [i.grad]
+
+    (x,) = train(torch.nn.functional.softmax)
+    (a,) = train(trident.function.softmax)
+
+    assert util.equal(x, a)
+
+
+@pytest.mark.parametrize("num_bt, num_head, seq_len", [(2, 3, 16), (1, 2, 70)])
+def test_masked_forward(num_bt, num_head, seq_len, dtype, device):
+    ctor_args = {"device": device, "dtype": dtype}
+    inp = torch.randn(num_bt, num_head, seq_len, seq_len, **ctor_args)
+    mask = torch.randn(num_bt, 1, 1, seq_len, **ctor_args)
+    scale = seq_len**-0.5
+
+    assert util.equal(
+        torch.nn.functional.softmax(inp * scale + mask, -1),
+        trident.function.masked_softmax(inp, mask, scale),
+    )
+
+    mask = torch.rand(num_bt, 1, seq_len, seq_len, device=device) > 0.2
+    mask[..., 0] = True
+
+    assert util.equal(
+        torch.nn.functional.softmax(inp.masked_fill(~mask, -float("inf")), -1),
+        trident.function.masked_softmax(inp, mask),
+    )
+
+    causal = torch.ones(seq_len, seq_len, device=device, dtype=torch.bool).triu(1)
+
+    assert util.equal(
+        torch.nn.functional.softmax(
+            (inp * scale).masked_fill(causal, -float("inf")), -1
+        ),
+        trident.function.masked_softmax(inp, scale=scale, causal=True),
+    )
+
+
+@pytest.mark.parametrize("scale", [0.0, -0.5])
+def test_masked_non_positive_scale(scale, dtype, device):
+    inp = torch.randn(2, 3, 5, 70, device=device, dtype=dtype)
+
+    assert util.equal(
+        torch.nn.functional.softmax(inp * scale, -1),
+        trident.function.masked_softmax(inp, scale=scale),
+    )
+
+
+@pytest.mark.parametrize("num_bt, num_head, seq_len", [(2, 3, 16), (1, 2, 70)])
+def test_masked_backward(num_bt, num_head, seq_len, dtype, device):
+    ctor_args = {"device": device, "dtype": dtype}
+    inp = torch.randn(num_bt, num_head, seq_len, seq_len, **ctor_args)
+    tgt = torch.randn(num_bt, num_head, seq_len, seq_len, **ctor_args)
+    mask = torch.randn(num_bt, 1, 1, seq_len, **ctor_args)
+    causal = torch.ones(seq_len, seq_len, device=device, dtype=torch.bool).triu(1)
+    scale = seq_len**-0.5
+
+    def train(func):
+        i = inp.clone()
+        i.requires_grad = True
+        func(i).backward(tgt, retain_graph=True)
+        return [i.grad]
+
+    (x,) = train(
+        lambda i: torch.nn.functional.softmax(
+            (i * scale + mask).masked_fill(causal, -float("inf")), -1
+        )
+    )
+    (a,) = train(lambda i: trident.function.masked_softmax(i, mask, scale, True))
+
+    assert util.equal(x, a)
+
+
+def test_masked_leading_block(dtype, device):
+    elem_sz = torch.finfo(dtype).bits // 8
+    vec_sz = trident.util.shared_memory_size_per_block() // elem_sz * 2 + 3
+    inp = torch.randn(2, vec_sz, device=device, dtype=dtype)
+    mask = torch.ones_like(inp, dtype=torch.bool)
+    mask[:, : vec_sz - 5] = False
+
+    assert util.equal(
+        torch.nn.functional.softmax(inp.masked_fill(~mask, -float("inf")), -1),
+        trident.function.masked_softmax(inp, mask),
+    )
+
+
+def test_fp64(device):
+    inp = torch.randn(4, 5000, dtype=torch.float64, device=device) * 10
+    grad_out = torch.randn_like(inp)
+
+    def train(func):
+        i = inp.clone()
+        i.requires_grad = True
+        out = func(i, 1)
+        out.backward(grad_out)
+        return out, i.grad
+
+    for x, a in zip(train(torch.softmax), train(trident.function.softmax)):
+        assert torch.allclose(x, a, rtol=1e-10, atol=1e-12)
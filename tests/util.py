@@ -35,5 +35,23 @@ def activate(inp, act):
         return torch.relu(inp)
     elif act == "leaky_relu":
         return torch.nn.functional.leaky_relu(inp)
+    elif act == "gelu":
+        return torch.nn.functional.gelu(inp)
+    elif act == "gelu_tanh":
+        return torch.nn.functional.gelu(inp, approximate="tanh")
+    elif act == "silu":
+        return torch.nn.functional.silu(inp)
     else:
         raise ValueError(f"{act} is not supported.")
+
+
+def rms_norm(inp, norm_sh, wgt=None, eps=None):
+    eps = torch.finfo(inp.dtype).eps if eps is None else eps
+    dims = tuple(range(-len(norm_sh), 0))
+    x = inp.to(torch.promote_types(inp.dtype, torch.float32))
+    out = x * torch.rsqrt(x.pow(2).mean(dims, keepdim=True) + eps)
+
+    if wgt is not None:
+        out = out * wgt
+
+    return out.to(inp.dtype)
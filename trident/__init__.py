@@ -14,3 +14,5 @@
 
 from . import function, kernel, util
 from .module import *
+
+util.load_autotune_cache(kernel)
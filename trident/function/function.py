@@ -24,6 +24,31 @@ def adaptive_avg_pool2d(input, output_size):
     return operation.AdaptiveAvgPool2d.apply(input, output_size)
 
 
+def add_layer_norm(
+    input, residual, normalized_shape, weight=None, bias=None, eps=1e-05
+):
+    """
+    Adds a residual to an input and applies Layer Normalization to the sum in a single pass.
+
+    It returns the normalized output and the sum, which is the updated residual stream of a pre-norm block.
+
+    See LayerNorm for more details.
+    """
+    output, residual, _, _ = operation.LayerNorm.apply(
+        input, normalized_shape, weight, bias, eps, residual
+    )
+    return output, residual
+
+
+def attention(query, key, value, is_causal=False, scale=None):
+    """
+    Applies Scaled Dot Product Attention to a query, a key and a value.
+
+    See Attention for details.
+    """
+    return operation.Attention.apply(query, key, value, is_causal, scale)[0]
+
+
 def batch_norm(input, running_mean=None, running_var=None, eps=1e-05, training=False):
     """
     Applies Batch Normalization for last certain number of dimensions.
@@ -38,13 +63,29 @@ def batch_norm(input, running_mean=None, running_var=None, eps=1e-05, training=F
     return operation.BatchNorm.apply(input, None, None, eps, running_mean, running_var)
 
 
-def conv2d(input, weight, bias=None):
+def conv2d(input, weight, bias=None, stride=1, padding=0, dilation=1, groups=1):
     """
     Applies Convolution 2D to an input.
 
     See Conv2d for details.
     """
-    return operation.Conv2d.apply(input, weight, bias)
+    return operation.Conv2d.apply(
+        input, weight, bias, stride, padding, dilation, groups
+    )
+
+
+def cross_entropy(input, target, ignore_index=-100, reduction="mean", inplace=False):
+    """
+    Computes Cross Entropy between logits and class indices in a single pass over each row.
+
+    The gradient of the loss is computed together with the loss when input requires grad. If inplace is True, it is
+    written over input, so input must not be used after this call.
+
+    See CrossEntropyLoss for more details.
+    """
+    return operation.CrossEntropy.apply(
+        input, target, ignore_index, reduction, inplace
+    )[0]
 
 
 def dropout(input, p=0.5, training=True):
@@ -56,6 +97,15 @@ def dropout(input, p=0.5, training=True):
     return operation.Dropout.apply(input, p) if training else input.clone()
 
 
+def gated_linear(input, weight, activation="silu"):
+    """
+    Applies Gated Linear Transformation to an input.
+
+    See GatedLinear for more details.
+    """
+    return operation.GatedLinear.apply(input, weight, activation)
+
+
 def gelu(input, approximate="none"):
     """
     Applies the Gaussian Error Linear Units to an input.
@@ -71,7 +121,21 @@ def group_norm(input, num_groups, weight=None, bias=None, eps=1e-05):
 
     See GroupNorm for details.
     """
-    return operation.GroupNorm.apply(input, num_groups, weight, bias, eps)
+    return operation.GroupNorm.apply(input, num_groups, weight, bias, eps)[0]
+
+
+def grouped_linear(inputs, weights, biases=None):
+    """
+    Applies Linear Transformation to each input of a group in a single launch.
+
+    See GroupedLinear for more details.
+    """
+    if biases is None:
+        biases = [None] * len(inputs)
+
+    assert len(inputs) == len(weights) == len(biases)
+
+    return list(operation.GroupedLinear.apply(len(inputs), *inputs, *weights, *biases))
 
 
 def instance_norm(
@@ -107,7 +171,9 @@ def layer_norm(input, normalized_shape, weight=None, bias=None, eps=1e-05):
 
     See LayerNorm for details.
     """
-    return operation.LayerNorm.apply(input, normalized_shape, weight, bias, eps)
+    return operation.LayerNorm.apply(input, normalized_shape, weight, bias, eps, None)[
+        0
+    ]
 
 
 def leaky_relu(input, negative_slope=0.01):
@@ -119,13 +185,46 @@ def leaky_relu(input, negative_slope=0.01):
     return operation.LeakyReLU.apply(input, negative_slope)
 
 
-def linear(input, weight, bias=None, activation=""):
+def linear(
+    input,
+    weight,
+    bias=None,
+    activation="",
+    scale=1.0,
+    residual=None,
+    p=0.0,
+    training=True,
+):
     """
     Applies Linear Transformation to an input.
 
     See Linear for more details.
     """
-    return operation.Linear.apply(input, weight, bias, activation)
+    return operation.Linear.apply(
+        input, weight, bias, activation, scale, residual, p if training else 0.0
+    )[0]
+
+
+def log_softmax(input, dim=None):
+    """
+    Applies the logarithm of Softmax to an input.
+
+    See LogSoftmax for more details.
+    """
+    return operation.Softmax.apply(input, dim, 1.0, None, False, True)
+
+
+def masked_softmax(input, mask=None, scale=1.0, causal=False, dim=-1):
+    """
+    Applies Softmax to a scaled and masked input in a single pass.
+
+    It computes softmax(input * scale + mask) along dim. A floating point mask is added to the scaled input and a
+    boolean mask keeps the elements where it is True, which follows scaled_dot_product_attention. If causal is True,
+    the element (..., i, j) is masked out when j > i and dim must be the last dimension.
+
+    See Softmax for more details.
+    """
+    return operation.Softmax.apply(input, dim, scale, mask, causal, False)
 
 
 def max_pool2d(input, kernel_size):
@@ -137,6 +236,15 @@ def max_pool2d(input, kernel_size):
     return operation.MaxPool2d.apply(input, kernel_size)
 
 
+def quantized_linear(input, weight, scale, bias=None, activation="", bits=8):
+    """
+    Applies Linear Transformation with a quantized weight to an input.
+
+    See QuantizedLinear for more details.
+    """
+    return operation.QuantizedLinear.apply(input, weight, scale, bias, activation, bits)
+
+
 def relu(input):
     """
     Applies ReLU to an input.
@@ -146,6 +254,15 @@ def relu(input):
     return operation.ReLU.apply(input)
 
 
+def rms_norm(input, normalized_shape, weight=None, eps=None):
+    """
+    Applies Root Mean Square Layer Normalization to an input.
+
+    See RMSNorm for more details.
+    """
+    return operation.RMSNorm.apply(input, normalized_shape, weight, eps)[0]
+
+
 def silu(input):
     """
     Applies the Sigmoid Linear Unit to an input.
@@ -170,4 +287,4 @@ def softmax(input, dim=None):
 
     See Softmax for more details.
     """
-    return operation.Softmax.apply(input, dim)
+    return operation.Softmax.apply(input, dim, 1.0, None, False, False)
@@ -13,10 +13,14 @@
 # limitations under the License.
 
 from .adaptive_avg_pool2d import *
+from .attention import *
 from .batch_norm import *
 from .conv2d import *
+from .cross_entropy import *
 from .dropout import *
+from .gated_linear import *
 from .gelu import *
+from .grouped_linear import *
 from .instance_norm import *
 from .layer_group_norm import *
 from .leaky_relu import *
@@ -24,6 +28,8 @@ from .linear import *
 from .math import *
 from .max_pool2d import *
 from .prelu import *
+from .quantized_linear import *
 from .relu import *
+from .rms_norm import *
 from .silu import *
 from .softmax import *
@@ -25,10 +25,12 @@ class AdaptiveAvgPool2d:
         x_batch_stride,
         x_channel_stride,
         x_row_stride,
+        x_col_stride,
         y_ptr,
         y_batch_stride,
         y_channel_stride,
         y_row_stride,
+        y_col_stride,
         num_channels,
         num_rows,
         num_cols,
@@ -55,16 +57,16 @@ class AdaptiveAvgPool2d:
         x_ptr += batch * x_batch_stride + channel * x_channel_stride
         x_ptr += row_offset * x_row_stride
         y_ptr += batch * y_batch_stride + channel * y_channel_stride
-        y_ptr += row * y_row_stride + col
+        y_ptr += row * y_row_stride + col * y_col_stride
 
         kernel_block = triton.language.arange(0, kernel_size)
         kernel_block = triton.language.ravel(
-            kernel_block[:, None] * x_row_stride + kernel_block[None, :]
+            kernel_block[:, None] * x_row_stride + kernel_block[None, :] * x_col_stride
         )
-        x_block = kernel_block[:, None] + col_offsets[None, :]
+        x_block = kernel_block[:, None] + (col_offsets * x_col_stride)[None, :]
 
-        x = triton.language.load(x_ptr + x_block)
+        x = language.upcast(triton.language.load(x_ptr + x_block))
         y = triton.language.sum(x, axis=0) / (kernel_size * kernel_size)
-        y_block = triton.language.arange(0, block_size)
+        y_block = triton.language.arange(0, block_size) * y_col_stride
 
         triton.language.store(y_ptr + y_block, y)
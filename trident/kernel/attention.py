@@ -0,0 +1,467 @@
+# Copyright 2023 ⓒ Kakao Brain Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import triton
+
+from trident import language
+
+
+class Attention:
+    @staticmethod
+    @triton.jit
+    def forward(
+        q_ptr,
+        q_bt_st,
+        q_hd_st,
+        q_seq_st,
+        q_dim_st,
+        k_ptr,
+        k_bt_st,
+        k_hd_st,
+        k_seq_st,
+        k_dim_st,
+        v_ptr,
+        v_bt_st,
+        v_hd_st,
+        v_seq_st,
+        v_dim_st,
+        out_ptr,
+        out_bt_st,
+        out_hd_st,
+        out_seq_st,
+        out_dim_st,
+        lse_ptr,
+        num_hd,
+        sz_q,
+        sz_k,
+        sz_d,
+        scale,
+        causal: triton.language.constexpr,
+        blk_sz_m: triton.language.constexpr,
+        blk_sz_n: triton.language.constexpr,
+        blk_sz_d: triton.language.constexpr,
+    ):
+        i = triton.language.program_id(0)
+        j = triton.language.program_id(1)
+        bt = j // num_hd
+        hd = language.col(j, num_hd)
+
+        q_blk_ptr = triton.language.make_block_ptr(
+            base=q_ptr + bt * q_bt_st + hd * q_hd_st,
+            shape=(sz_q, sz_d),
+            strides=(q_seq_st, q_dim_st),
+            offsets=(i * blk_sz_m, 0),
+            block_shape=(blk_sz_m, blk_sz_d),
+            order=(1, 0),
+        )
+
+        k_blk_ptr = triton.language.make_block_ptr(
+            base=k_ptr + bt * k_bt_st + hd * k_hd_st,
+            shape=(sz_d, sz_k),
+            strides=(k_dim_st, k_seq_st),
+            offsets=(0, 0),
+            block_shape=(blk_sz_d, blk_sz_n),
+            order=(0, 1),
+        )
+
+        v_blk_ptr = triton.language.make_block_ptr(
+            base=v_ptr + bt * v_bt_st + hd * v_hd_st,
+            shape=(sz_k, sz_d),
+            strides=(v_seq_st, v_dim_st),
+            offsets=(0, 0),
+            block_shape=(blk_sz_n, blk_sz_d),
+            order=(1, 0),
+        )
+
+        range_m, msk_m = language.make_block(sz_q, blk_sz_m, i * blk_sz_m)
+        max = language.acc_zeros((blk_sz_m,), q_ptr.dtype.element_ty) - float("inf")
+        exp_sum = language.acc_zeros((blk_sz_m,), q_ptr.dtype.element_ty)
+        acc = language.acc_zeros((blk_sz_m, blk_sz_d), q_ptr.dtype.element_ty)
+
+        q = triton.language.load(
+            q_blk_ptr, boundary_check=(0, 1), padding_option="zero"
+        )
+        end_n = sz_k
+
+        if causal:
+            end_n = triton.language.minimum((i + 1) * blk_sz_m, sz_k)
+
+        for n_off in range(0, end_n, blk_sz_n):
+            k = triton.language.load(
+                k_blk_ptr, boundary_check=(0, 1), padding_option="zero"
+            )
+            qk = triton.language.dot(q, k, False) * scale
+            range_n, msk_n = language.make_block(sz_k, blk_sz_n, n_off)
+            qk = triton.language.where(msk_n[None, :], qk, -float("inf"))
+
+            if causal:
+                qk = triton.language.where(
+                    range_m[:, None] >= range_n[None, :], qk, -float("inf")
+                )
+
+            blk_max = triton.language.maximum(max, triton.language.max(qk, 1))
+            alpha = language.exp(max - blk_max)
+            p = language.exp(qk - blk_max[:, None])
+            exp_sum = exp_sum * alpha + triton.language.sum(p, 1)
+
+            v = triton.language.load(
+                v_blk_ptr, boundary_check=(0, 1), padding_option="zero"
+            )
+            acc = acc * alpha[:, None] + triton.language.dot(p.to(v.dtype), v, False)
+            max = blk_max
+
+            k_blk_ptr = triton.language.advance(k_blk_ptr, (0, blk_sz_n))
+            v_blk_ptr = triton.language.advance(v_blk_ptr, (blk_sz_n, 0))
+
+        out_blk_ptr = triton.language.make_block_ptr(
+            base=out_ptr + bt * out_bt_st + hd * out_hd_st,
+            shape=(sz_q, sz_d),
+            strides=(out_seq_st, out_dim_st),
+            offsets=(i * blk_sz_m, 0),
+            block_shape=(blk_sz_m, blk_sz_d),
+            order=(1, 0),
+        )
+
+        out = acc / exp_sum[:, None]
+        lse = max + triton.language.log(exp_sum)
+
+        triton.language.store(out_blk_ptr, out.to(q.dtype), boundary_check=(0, 1))
+        triton.language.store(lse_ptr + j * sz_q + range_m, lse, msk_m)
+
+    @staticmethod
+    @triton.jit
+    def backward_delta(
+        grad_out_ptr,
+        grad_out_bt_st,
+        grad_out_hd_st,
+        grad_out_seq_st,
+        grad_out_dim_st,
+        out_ptr,
+        out_bt_st,
+        out_hd_st,
+        out_seq_st,
+        out_dim_st,
+        delta_ptr,
+        num_hd,
+        sz_q,
+        sz_d,
+        blk_sz_m: triton.language.constexpr,
+        blk_sz_d: triton.language.constexpr,
+    ):
+        i = triton.language.program_id(0)
+        j = triton.language.program_id(1)
+        bt = j // num_hd
+        hd = language.col(j, num_hd)
+
+        grad_out_blk_ptr = triton.language.make_block_ptr(
+            base=grad_out_ptr + bt * grad_out_bt_st + hd * grad_out_hd_st,
+            shape=(sz_q, sz_d),
+            strides=(grad_out_seq_st, grad_out_dim_st),
+            offsets=(i * blk_sz_m, 0),
+            block_shape=(blk_sz_m, blk_sz_d),
+            order=(1, 0),
+        )
+
+        out_blk_ptr = triton.language.make_block_ptr(
+            base=out_ptr + bt * out_bt_st + hd * out_hd_st,
+            shape=(sz_q, sz_d),
+            strides=(out_seq_st, out_dim_st),
+            offsets=(i * blk_sz_m, 0),
+            block_shape=(blk_sz_m, blk_sz_d),
+            order=(1, 0),
+        )
+
+        grad_out = triton.language.load(
+            grad_out_blk_ptr, boundary_check=(0, 1), padding_option="zero"
+        )
+        out = triton.language.load(
+            out_blk_ptr, boundary_check=(0, 1), padding_option="zero"
+        )
+        delta = triton.language.sum(language.upcast(grad_out) * language.upcast(out), 1)
+        range_m, msk_m = language.make_block(sz_q, blk_sz_m, i * blk_sz_m)
+
+        triton.language.store(delta_ptr + j * sz_q + range_m, delta, msk_m)
+
+    @staticmethod
+    @triton.jit
+    def backward_key_value(
+        q_ptr,
+        q_bt_st,
+        q_hd_st,
+        q_seq_st,
+        q_dim_st,
+        k_ptr,
+        k_bt_st,
+        k_hd_st,
+        k_seq_st,
+        k_dim_st,
+        v_ptr,
+        v_bt_st,
+        v_hd_st,
+        v_seq_st,
+        v_dim_st,
+        grad_out_ptr,
+        grad_out_bt_st,
+        grad_out_hd_st,
+        grad_out_seq_st,
+        grad_out_dim_st,
+        lse_ptr,
+        delta_ptr,
+        grad_k_ptr,
+        grad_v_ptr,
+        num_hd,
+        sz_q,
+        sz_k,
+        sz_d,
+        scale,
+        causal: triton.language.constexpr,
+        blk_sz_m: triton.language.constexpr,
+        blk_sz_n: triton.language.constexpr,
+        blk_sz_d: triton.language.constexpr,
+    ):
+        i = triton.language.program_id(0)
+        j = triton.language.program_id(1)
+        bt = j // num_hd
+        hd = language.col(j, num_hd)
+        start_m = 0
+
+        if causal:
+            start_m = i * blk_sz_n
+
+        q_blk_ptr = triton.language.make_block_ptr(
+            base=q_ptr + bt * q_bt_st + hd * q_hd_st,
+            shape=(sz_q, sz_d),
+            strides=(q_seq_st, q_dim_st),
+            offsets=(start_m, 0),
+            block_shape=(blk_sz_m, blk_sz_d),
+            order=(1, 0),
+        )
+
+        k_blk_ptr = triton.language.make_block_ptr(
+            base=k_ptr + bt * k_bt_st + hd * k_hd_st,
+            shape=(sz_k, sz_d),
+            strides=(k_seq_st, k_dim_st),
+            offsets=(i * blk_sz_n, 0),
+            block_shape=(blk_sz_n, blk_sz_d),
+            order=(1, 0),
+        )
+
+        v_blk_ptr = triton.language.make_block_ptr(
+            base=v_ptr + bt * v_bt_st + hd * v_hd_st,
+            shape=(sz_k, sz_d),
+            strides=(v_seq_st, v_dim_st),
+            offsets=(i * blk_sz_n, 0),
+            block_shape=(blk_sz_n, blk_sz_d),
+            order=(1, 0),
+        )
+
+        grad_out_blk_ptr = triton.language.make_block_ptr(
+            base=grad_out_ptr + bt * grad_out_bt_st + hd * grad_out_hd_st,
+            shape=(sz_q, sz_d),
+            strides=(grad_out_seq_st, grad_out_dim_st),
+            offsets=(start_m, 0),
+            block_shape=(blk_sz_m, blk_sz_d),
+            order=(1, 0),
+        )
+
+        range_n, msk_n = language.make_block(sz_k, blk_sz_n, i * blk_sz_n)
+        k = triton.language.load(
+            k_blk_ptr, boundary_check=(0, 1), padding_option="zero"
+        )
+        v = triton.language.load(
+            v_blk_ptr, boundary_check=(0, 1), padding_option="zero"
+        )
+        grad_k = language.acc_zeros((blk_sz_n, blk_sz_d), q_ptr.dtype.element_ty)
+        grad_v = language.acc_zeros((blk_sz_n, blk_sz_d), q_ptr.dtype.element_ty)
+
+        for m_off in range(start_m, sz_q, blk_sz_m):
+            q = triton.language.load(
+                q_blk_ptr, boundary_check=(0, 1), padding_option="zero"
+            )
+            grad_out = triton.language.load(
+                grad_out_blk_ptr, boundary_check=(0, 1), padding_option="zero"
+            )
+            range_m, msk_m = language.make_block(sz_q, blk_sz_m, m_off)
+            lse = triton.language.load(lse_ptr + j * sz_q + range_m, msk_m, 0)
+            delta = triton.language.load(delta_ptr + j * sz_q + range_m, msk_m, 0)
+
+            qk = triton.language.dot(q, triton.language.trans(k), False) * scale
+            p = language.exp(qk - lse[:, None])
+            msk = msk_m[:, None] & msk_n[None, :]
+
+            if causal:
+                msk = msk & (range_m[:, None] >= range_n[None, :])
+
+            p = triton.language.where(msk, p, 0.0)
+            grad_v += triton.language.dot(
+                triton.language.trans(p.to(grad_out.dtype)), grad_out, False
+            )
+
+            grad_p = triton.language.dot(grad_out, triton.language.trans(v), False)
+            grad_s = p * (grad_p - delta[:, None]) * scale
+            grad_k += triton.language.dot(
+                triton.language.trans(grad_s.to(q.dtype)), q, False
+            )
+
+            q_blk_ptr = triton.language.advance(q_blk_ptr, (blk_sz_m, 0))
+            grad_out_blk_ptr = triton.language.advance(grad_out_blk_ptr, (blk_sz_m, 0))
+
+        grad_k_blk_ptr = triton.language.make_block_ptr(
+            base=grad_k_ptr + j * sz_k * sz_d,
+            shape=(sz_k, sz_d),
+            strides=(sz_d, 1),
+            offsets=(i * blk_sz_n, 0),
+            block_shape=(blk_sz_n, blk_sz_d),
+            order=(1, 0),
+        )
+
+        grad_v_blk_ptr = triton.language.make_block_ptr(
+            base=grad_v_ptr + j * sz_k * sz_d,
+            shape=(sz_k, sz_d),
+            strides=(sz_d, 1),
+            offsets=(i * blk_sz_n, 0),
+            block_shape=(blk_sz_n, blk_sz_d),
+            order=(1, 0),
+        )
+
+        triton.language.store(grad_k_blk_ptr, grad_k.to(k.dtype), boundary_check=(0, 1))
+        triton.language.store(grad_v_blk_ptr, grad_v.to(v.dtype), boundary_check=(0, 1))
+
+    @staticmethod
+    @triton.jit
+    def backward_query(
+        q_ptr,
+        q_bt_st,
+        q_hd_st,
+        q_seq_st,
+        q_dim_st,
+        k_ptr,
+        k_bt_st,
+        k_hd_st,
+        k_seq_st,
+        k_dim_st,
+        v_ptr,
+        v_bt_st,
+        v_hd_st,
+        v_seq_st,
+        v_dim_st,
+        grad_out_ptr,
+        grad_out_bt_st,
+        grad_out_hd_st,
+        grad_out_seq_st,
+        grad_out_dim_st,
+        lse_ptr,
+        delta_ptr,
+        grad_q_ptr,
+        num_hd,
+        sz_q,
+        sz_k,
+        sz_d,
+        scale,
+        causal: triton.language.constexpr,
+        blk_sz_m: triton.language.constexpr,
+        blk_sz_n: triton.language.constexpr,
+        blk_sz_d: triton.language.constexpr,
+    ):
+        i = triton.language.program_id(0)
+        j = triton.language.program_id(1)
+        bt = j // num_hd
+        hd = language.col(j, num_hd)
+
+        q_blk_ptr = triton.language.make_block_ptr(
+            base=q_ptr + bt * q_bt_st + hd * q_hd_st,
+            shape=(sz_q, sz_d),
+            strides=(q_seq_st, q_dim_st),
+            offsets=(i * blk_sz_m, 0),
+            block_shape=(blk_sz_m, blk_sz_d),
+            order=(1, 0),
+        )
+
+        k_blk_ptr = triton.language.make_block_ptr(
+            base=k_ptr + bt * k_bt_st + hd * k_hd_st,
+            shape=(sz_k, sz_d),
+            strides=(k_seq_st, k_dim_st),
+            offsets=(0, 0),
+            block_shape=(blk_sz_n, blk_sz_d),
+            order=(1, 0),
+        )
+
+        v_blk_ptr = triton.language.make_block_ptr(
+            base=v_ptr + bt * v_bt_st + hd * v_hd_st,
+            shape=(sz_k, sz_d),
+            strides=(v_seq_st, v_dim_st),
+            offsets=(0, 0),
+            block_shape=(blk_sz_n, blk_sz_d),
+            order=(1, 0),
+        )
+
+        grad_out_blk_ptr = triton.language.make_block_ptr(
+            base=grad_out_ptr + bt * grad_out_bt_st + hd * grad_out_hd_st,
+            shape=(sz_q, sz_d),
+            strides=(grad_out_seq_st, grad_out_dim_st),
+            offsets=(i * blk_sz_m, 0),
+            block_shape=(blk_sz_m, blk_sz_d),
+            order=(1, 0),
+        )
+
+        range_m, msk_m = language.make_block(sz_q, blk_sz_m, i * blk_sz_m)
+        q = triton.language.load(
+            q_blk_ptr, boundary_check=(0, 1), padding_option="zero"
+        )
+        grad_out = triton.language.load(
+            grad_out_blk_ptr, boundary_check=(0, 1), padding_option="zero"
+        )
+        lse = triton.language.load(lse_ptr + j * sz_q + range_m, msk_m, 0)
+        delta = triton.language.load(delta_ptr + j * sz_q + range_m, msk_m, 0)
+        grad_q = language.acc_zeros((blk_sz_m, blk_sz_d), q_ptr.dtype.element_ty)
+        end_n = sz_k
+
+        if causal:
+            end_n = triton.language.minimum((i + 1) * blk_sz_m, sz_k)
+
+        for n_off in range(0, end_n, blk_sz_n):
+            k = triton.language.load(
+                k_blk_ptr, boundary_check=(0, 1), padding_option="zero"
+            )
+            v = triton.language.load(
+                v_blk_ptr, boundary_check=(0, 1), padding_option="zero"
+            )
+            range_n, msk_n = language.make_block(sz_k, blk_sz_n, n_off)
+
+            qk = triton.language.dot(q, triton.language.trans(k), False) * scale
+            p = language.exp(qk - lse[:, None])
+            msk = msk_m[:, None] & msk_n[None, :]
+
+            if causal:
+                msk = msk & (range_m[:, None] >= range_n[None, :])
+
+            p = triton.language.where(msk, p, 0.0)
+            grad_p = triton.language.dot(grad_out, triton.language.trans(v), False)
+            grad_s = p * (grad_p - delta[:, None]) * scale
+            grad_q += triton.language.dot(grad_s.to(k.dtype), k, False)
+
+            k_blk_ptr = triton.language.advance(k_blk_ptr, (blk_sz_n, 0))
+            v_blk_ptr = triton.language.advance(v_blk_ptr, (blk_sz_n, 0))
+
+        grad_q_blk_ptr = triton.language.make_block_ptr(
+            base=grad_q_ptr + j * sz_q * sz_d,
+            shape=(sz_q, sz_d),
+            strides=(sz_d, 1),
+            offsets=(i * blk_sz_m, 0),
+            block_shape=(blk_sz_m, blk_sz_d),
+            order=(1, 0),
+        )
+
+        triton.language.store(grad_q_blk_ptr, grad_q.to(q.dtype), boundary_check=(0, 1))
@@ -14,7 +14,7 @@
 
 import triton
 
-from trident import language
+from trident import kernel, language
 
 
 class BatchNorm:
@@ -33,31 +33,32 @@ class BatchNorm:
         blk_sz: triton.language.constexpr,
     ):
         pid = triton.language.program_id(0)
-        blk = triton.language.arange(0, blk_sz)
-        inp_blk = blk * vec_sz + pid
-        msk = blk < bt_sz
-
-        inp = triton.language.load(inp_ptr + inp_blk, msk, 0)
+        inp_ptr += pid
+        out_ptr += pid
 
         if running_mean_ptr is not None and running_var_ptr is not None:
             mean = triton.language.load(running_mean_ptr + pid)
             var = triton.language.load(running_var_ptr + pid)
         else:
-            mean = language.sum(inp) / bt_sz
-            var = language.var(msk, inp, bt_sz, mean, corr=0)
+            mean, var = kernel.mean_var(inp_ptr, bt_sz, blk_sz, vec_sz)
 
         std = language.std(var, eps)
-        out = (inp - mean) / std
 
-        if wgt_ptr is not None:
-            wgt = triton.language.load(wgt_ptr + pid)
-            out = out * wgt
+        for blk_off in range(0, bt_sz, blk_sz):
+            blk, msk = language.make_block(bt_sz, blk_sz, blk_off)
+            inp_blk = blk * vec_sz
+            inp = triton.language.load(inp_ptr + inp_blk, msk, 0)
+            out = (inp - mean) / std
+
+            if wgt_ptr is not None:
+                wgt = triton.language.load(wgt_ptr + pid)
+                out = out * wgt
 
-        if bis_ptr is not None:
-            bis = triton.language.load(bis_ptr + pid)
-            out = out + bis
+            if bis_ptr is not None:
+                bis = triton.language.load(bis_ptr + pid)
+                out = out + bis
 
-        triton.language.store(out_ptr + inp_blk, out, msk)
+            triton.language.store(out_ptr + inp_blk, out, msk)
 
     @staticmethod
     @triton.jit
@@ -78,8 +79,8 @@ class BatchNorm:
         inp_blk = blk * vec_sz + pid
         msk = blk < bt_sz
 
-        grad_out = triton.language.load(grad_out_ptr + inp_blk, msk, 0)
-        inp = triton.language.load(inp_ptr + inp_blk, msk, 0)
+        grad_out = language.upcast(triton.language.load(grad_out_ptr + inp_blk, msk, 0))
+        inp = language.upcast(triton.language.load(inp_ptr + inp_blk, msk, 0))
         wgt = triton.language.load(wgt_ptr + pid) if wgt_ptr is not None else 1
 
         mean = language.sum(inp) / bt_sz
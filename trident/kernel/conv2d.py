@@ -12,79 +12,327 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+
 import triton
 
 from trident import language
 
 
+def get_configs_conv2d_forward():
+    configs = []
+    for blk_sz_m in [32, 64, 128]:
+        for blk_sz_k in [16, 32]:
+            for blk_sz_n in [32, 64]:
+                for num_stages in [2, 3]:
+                    configs.append(
+                        triton.Config(
+                            {
+                                "blk_sz_m": blk_sz_m,
+                                "blk_sz_k": blk_sz_k,
+                                "blk_sz_n": blk_sz_n,
+                            },
+                            num_stages=num_stages,
+                            num_warps=4,
+                        )
+                    )
+    return configs
+
+
+def get_configs_conv2d_backward():
+    configs = []
+    for blk_sz_m in [32, 64]:
+        for blk_sz_k in [32, 64]:
+            for blk_sz_n in [32, 64]:
+                configs.append(
+                    triton.Config(
+                        {
+                            "blk_sz_m": blk_sz_m,
+                            "blk_sz_k": blk_sz_k,
+                            "blk_sz_n": blk_sz_n,
+                        },
+                        num_stages=2,
+                        num_warps=4,
+                    )
+                )
+    return configs
+
+
 class Conv2d:
     @staticmethod
+    @triton.autotune(
+        configs=get_configs_conv2d_forward(),
+        key=["sz_m_bkt", "sz_k", "sz_n", "ch_last"],
+    )
     @triton.jit
     def forward(
         inp_ptr,
-        inp_ch,
         inp_h,
         inp_w,
         inp_bt_st,
         inp_ch_st,
         inp_h_st,
+        inp_w_st,
         wgt_ptr,
         wgt_ch,
         wgt_h,
         wgt_w,
         wgt_bt_st,
         wgt_ch_st,
+        wgt_h_st,
+        wgt_w_st,
         bis_ptr,
         out_ptr,
-        out_ch,
         out_h,
         out_w,
         out_bt_st,
         out_ch_st,
         out_h_st,
-        wgt_c_bs: triton.language.constexpr,
-        wgt_h_bs: triton.language.constexpr,
-        wgt_w_bs: triton.language.constexpr,
-        grp_sz: triton.language.constexpr,
+        out_w_st,
+        str_h,
+        str_w,
+        pad_h,
+        pad_w,
+        dil_h,
+        dil_w,
+        sz_m,
+        sz_k,
+        sz_n,
+        sz_m_bkt,
+        blk_sz_m: triton.language.constexpr,
+        blk_sz_k: triton.language.constexpr,
+        blk_sz_n: triton.language.constexpr,
+        ch_last: triton.language.constexpr,
+        dtype: triton.language.constexpr,
+    ):
+        i = triton.language.program_id(0)
+        j = triton.language.program_id(1)
+        grp = triton.language.program_id(2)
+
+        range_m, msk_m = language.make_block(sz_m, blk_sz_m, i * blk_sz_m)
+        range_n, msk_n = language.make_block(sz_n, blk_sz_n, j * blk_sz_n)
+        range_n += grp * sz_n
+        bt = range_m // (out_h * out_w)
+        h = range_m // out_w % out_h
+        w = range_m % out_w
+
+        inp_ptr += (bt * inp_bt_st + grp * wgt_ch * inp_ch_st)[:, None]
+        wgt_ptr += (range_n * wgt_bt_st)[None, :]
+
+        acc = language.acc_zeros((blk_sz_m, blk_sz_n), dtype)
+
+        for k in range(0, sz_k, blk_sz_k):
+            range_k, msk_k = language.make_block(sz_k, blk_sz_k, k)
+            ch, kh, kw = language.make_conv2d_idx(
+                range_k, wgt_ch, wgt_h, wgt_w, ch_last
+            )
+
+            ih = (h * str_h - pad_h)[:, None] + (kh * dil_h)[None, :]
+            iw = (w * str_w - pad_w)[:, None] + (kw * dil_w)[None, :]
+            inp_off = ch[None, :] * inp_ch_st + ih * inp_h_st + iw * inp_w_st
+            inp_msk = msk_m[:, None] & msk_k[None, :]
+            inp_msk &= (ih >= 0) & (ih < inp_h) & (iw >= 0) & (iw < inp_w)
+            inp = triton.language.load(inp_ptr + inp_off, inp_msk, 0.0)
+
+            wgt_off = ch * wgt_ch_st + kh * wgt_h_st + kw * wgt_w_st
+            wgt_msk = msk_k[:, None] & msk_n[None, :]
+            wgt = triton.language.load(wgt_ptr + wgt_off[:, None], wgt_msk, 0.0)
+
+            acc += triton.language.dot(inp, wgt, False)
+
+        if bis_ptr is not None:
+            bis = triton.language.load(bis_ptr + range_n, msk_n, 0.0)
+            acc += bis[None, :]
+
+        out_off = bt * out_bt_st + h * out_h_st + w * out_w_st
+        out_ptr += out_off[:, None] + (range_n * out_ch_st)[None, :]
+        msk = msk_m[:, None] & msk_n[None, :]
+
+        triton.language.store(out_ptr, acc.to(dtype), msk)
+
+    @staticmethod
+    @triton.autotune(
+        configs=get_configs_conv2d_backward(),
+        key=["sz_m_bkt", "sz_k", "sz_n", "ch_last"],
+    )
+    @triton.jit
+    def backward_input(
+        grad_out_ptr,
+        out_h,
+        out_w,
+        grad_out_bt_st,
+        grad_out_ch_st,
+        grad_out_h_st,
+        grad_out_w_st,
+        wgt_ptr,
+        wgt_h,
+        wgt_w,
+        wgt_bt_st,
+        wgt_ch_st,
+        wgt_h_st,
+        wgt_w_st,
+        grad_inp_ptr,
+        inp_h,
+        inp_w,
+        grad_inp_bt_st,
+        grad_inp_ch_st,
+        grad_inp_h_st,
+        grad_inp_w_st,
+        str_h,
+        str_w,
+        pad_h,
+        pad_w,
+        dil_h,
+        dil_w,
+        sz_m,
+        sz_k,
+        sz_n,
+        sz_m_bkt,
+        blk_sz_m: triton.language.constexpr,
+        blk_sz_k: triton.language.constexpr,
+        blk_sz_n: triton.language.constexpr,
+        ch_last: triton.language.constexpr,
+        dtype: triton.language.constexpr,
+    ):
+        i = triton.language.program_id(0)
+        j = triton.language.program_id(1)
+        grp = triton.language.program_id(2)
+
+        range_m, msk_m = language.make_block(sz_m, blk_sz_m, i * blk_sz_m)
+        range_n, msk_n = language.make_block(sz_n, blk_sz_n, j * blk_sz_n)
+        bt = range_m // (inp_h * inp_w)
+        h = range_m // inp_w % inp_h
+        w = range_m % inp_w
+        out_ch = sz_k // (wgt_h * wgt_w)
+
+        grad_out_ptr += (bt * grad_out_bt_st + grp * out_ch * grad_out_ch_st)[:, None]
+        wgt_ptr += grp * out_ch * wgt_bt_st + (range_n * wgt_ch_st)[None, :]
+
+        acc = language.acc_zeros((blk_sz_m, blk_sz_n), dtype)
+
+        for k in range(0, sz_k, blk_sz_k):
+            range_k, msk_k = language.make_block(sz_k, blk_sz_k, k)
+            ch, kh, kw = language.make_conv2d_idx(
+                range_k, out_ch, wgt_h, wgt_w, ch_last
+            )
+
+            oh = h[:, None] + pad_h - (kh * dil_h)[None, :]
+            ow = w[:, None] + pad_w - (kw * dil_w)[None, :]
+            grad_out_msk = msk_m[:, None] & msk_k[None, :]
+            grad_out_msk &= (oh >= 0) & (oh % str_h == 0) & (oh < out_h * str_h)
+            grad_out_msk &= (ow >= 0) & (ow % str_w == 0) & (ow < out_w * str_w)
+            oh = oh // str_h
+            ow = ow // str_w
+            grad_out_off = (
+                ch[None, :] * grad_out_ch_st + oh * grad_out_h_st + ow * grad_out_w_st
+            )
+            grad_out = triton.language.load(
+                grad_out_ptr + grad_out_off, grad_out_msk, 0.0
+            )
+
+            wgt_off = ch * wgt_bt_st + kh * wgt_h_st + kw * wgt_w_st
+            wgt_msk = msk_k[:, None] & msk_n[None, :]
+            wgt = triton.language.load(wgt_ptr + wgt_off[:, None], wgt_msk, 0.0)
+
+            acc += triton.language.dot(grad_out, wgt, False)
+
+        range_n += grp * sz_n
+        grad_inp_off = bt * grad_inp_bt_st + h * grad_inp_h_st + w * grad_inp_w_st
+        grad_inp_ptr += grad_inp_off[:, None] + (range_n * grad_inp_ch_st)[None, :]
+        msk = msk_m[:, None] & msk_n[None, :]
+
+        triton.language.store(grad_inp_ptr, acc.to(dtype), msk)
+
+    @staticmethod
+    @triton.autotune(
+        configs=get_configs_conv2d_backward(),
+        key=["sz_m_bkt", "sz_k", "sz_n", "ch_last"],
+    )
+    @triton.jit
+    def backward_weight(
+        grad_out_ptr,
+        out_h,
+        out_w,
+        grad_out_bt_st,
+        grad_out_ch_st,
+        grad_out_h_st,
+        grad_out_w_st,
+        inp_ptr,
+        inp_h,
+        inp_w,
+        inp_bt_st,
+        inp_ch_st,
+        inp_h_st,
+        inp_w_st,
+        grad_wgt_ptr,
+        wgt_h,
+        wgt_w,
+        grad_wgt_bt_st,
+        grad_wgt_ch_st,
+        grad_wgt_h_st,
+        grad_wgt_w_st,
+        grad_bis_ptr,
+        str_h,
+        str_w,
+        pad_h,
+        pad_w,
+        dil_h,
+        dil_w,
+        sz_m,
+        sz_k,
+        sz_n,
+        sz_m_bkt,
+        blk_sz_m: triton.language.constexpr,
+        blk_sz_k: triton.language.constexpr,
+        blk_sz_n: triton.language.constexpr,
+        ch_last: triton.language.constexpr,
+        dtype: triton.language.constexpr,
     ):
-        pid = triton.language.program_id(0)
-        num_grp = language.cdiv(out_w, grp_sz)
-        bt = language.batch(pid, out_ch, num_grp, out_w)
-        ch = language.channel(pid, out_ch, num_grp, out_w)
-        grp = language.row(pid, num_grp, out_w)
-        h = grp * grp_sz
-        w = language.col(pid, out_w)
-
-        inp_ptr += bt * inp_bt_st + h * inp_h_st + w
-        wgt_ptr += ch * wgt_bt_st
-        out_ptr += bt * out_bt_st + ch * out_ch_st + h * out_h_st + w
-
-        inp_blk = language.make_conv2d_blk(
-            inp_ch_st, inp_w, wgt_c_bs, wgt_h_bs, wgt_w_bs
-        )
-        inp_blk = triton.language.ravel(inp_blk)
-        inp_blk = language.make_group_blk(inp_blk, grp_sz, inp_w)
-        inp_msk = language.make_conv2d_msk(
-            inp_ch, inp_h, inp_w, wgt_c_bs, wgt_h_bs, wgt_w_bs
-        )
-        inp_msk = triton.language.ravel(inp_msk)
-        inp_msk = language.make_group_msk(inp_msk, grp_sz, h, out_h)
-        wgt_blk = language.make_conv2d_blk(
-            wgt_ch_st, wgt_w, wgt_c_bs, wgt_h_bs, wgt_w_bs
-        )
-        wgt_blk = triton.language.ravel(wgt_blk)
-        wgt_msk = language.make_conv2d_msk(
-            wgt_ch, wgt_h, wgt_w, wgt_c_bs, wgt_h_bs, wgt_w_bs
-        )
-        wgt_msk = triton.language.ravel(wgt_msk)
-        out_blk = triton.language.arange(0, grp_sz) * out_w
-        out_msk = triton.language.arange(0, grp_sz) + h < out_h
-
-        inp = triton.language.load(inp_ptr + inp_blk, inp_msk, 0.0)
-        wgt = triton.language.load(wgt_ptr + wgt_blk, wgt_msk, 0.0)
-        out = triton.language.sum(inp * wgt[:, None], 0)
-
-        if bis_ptr:
-            out += triton.language.load(bis_ptr + ch)
-
-        triton.language.store(out_ptr + out_blk, out, out_msk)
+        i = triton.language.program_id(0)
+        j = triton.language.program_id(1)
+        grp = triton.language.program_id(2)
+
+        range_n, msk_n = language.make_block(sz_n, blk_sz_n, i * blk_sz_n)
+        range_k, msk_k = language.make_block(sz_k, blk_sz_k, j * blk_sz_k)
+        range_n += grp * sz_n
+        wgt_ch = sz_k // (wgt_h * wgt_w)
+        ch, kh, kw = language.make_conv2d_idx(range_k, wgt_ch, wgt_h, wgt_w, ch_last)
+
+        grad_out_ptr += (range_n * grad_out_ch_st)[:, None]
+        inp_ptr += ((ch + grp * wgt_ch) * inp_ch_st)[None, :]
+
+        acc = language.acc_zeros((blk_sz_n, blk_sz_k), dtype)
+        acc_bis = language.acc_zeros((blk_sz_n,), dtype)
+
+        for m in range(0, sz_m, blk_sz_m):
+            range_m, msk_m = language.make_block(sz_m, blk_sz_m, m)
+            bt = range_m // (out_h * out_w)
+            h = range_m // out_w % out_h
+            w = range_m % out_w
+
+            grad_out_off = bt * grad_out_bt_st + h * grad_out_h_st + w * grad_out_w_st
+            grad_out_msk = msk_n[:, None] & msk_m[None, :]
+            grad_out = triton.language.load(
+                grad_out_ptr + grad_out_off[None, :], grad_out_msk, 0.0
+            )
+
+            ih = (h * str_h - pad_h)[:, None] + (kh * dil_h)[None, :]
+            iw = (w * str_w - pad_w)[:, None] + (kw * dil_w)[None, :]
+            inp_off = (bt * inp_bt_st)[:, None] + ih * inp_h_st + iw * inp_w_st
+            inp_msk = msk_m[:, None] & msk_k[None, :]
+            inp_msk &= (ih >= 0) & (ih < inp_h) & (iw >= 0) & (iw < inp_w)
+            inp = triton.language.load(inp_ptr + inp_off, inp_msk, 0.0)
+
+            acc += triton.language.dot(grad_out, inp, False)
+
+            if grad_bis_ptr is not None:
+                acc_bis += triton.language.sum(grad_out.to(acc_bis.dtype), 1)
+
+        grad_wgt_off = ch * grad_wgt_ch_st + kh * grad_wgt_h_st + kw * grad_wgt_w_st
+        grad_wgt_ptr += (range_n * grad_wgt_bt_st)[:, None] + grad_wgt_off[None, :]
+        msk = msk_n[:, None] & msk_k[None, :]
+
+        triton.language.store(grad_wgt_ptr, acc.to(dtype), msk)
+
+        if grad_bis_ptr is not None:
+            if j == 0:
+                triton.language.store(grad_bis_ptr + range_n, acc_bis.to(dtype), msk_n)
@@ -0,0 +1,82 @@
+# Copyright 2023 ⓒ Kakao Brain Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import triton
+
+from trident import language
+
+
+class CrossEntropy:
+    @staticmethod
+    @triton.jit
+    def forward(
+        inp_ptr,
+        inp_st,
+        vec_sz,
+        tgt_ptr,
+        ignore_index,
+        num_valid_ptr,
+        loss_ptr,
+        grad_ptr,
+        grad_st,
+        blk_sz: triton.language.constexpr,
+    ):
+        pid = triton.language.program_id(0)
+        inp_ptr += pid * inp_st
+        tgt = triton.language.load(tgt_ptr + pid)
+
+        if tgt == ignore_index:
+            if grad_ptr is not None:
+                for blk_off in range(0, vec_sz, blk_sz):
+                    blk, msk = language.make_block(vec_sz, blk_sz, blk_off)
+                    triton.language.store(grad_ptr + pid * grad_st + blk, 0.0, msk)
+
+            triton.language.store(loss_ptr + pid, 0.0)
+        else:
+            if num_valid_ptr is not None:
+                scale = 1.0 / triton.language.load(num_valid_ptr).to(
+                    triton.language.float32
+                )
+            else:
+                scale = 1.0
+
+            max = language.acc_scalar(inp_ptr, -float("inf"))
+            acc = language.acc_scalar(inp_ptr, 0.0)
+
+            for blk_off in range(0, vec_sz, blk_sz):
+                blk, msk = language.make_block(vec_sz, blk_sz, blk_off)
+                inp = triton.language.load(inp_ptr + blk, msk, -float("inf"))
+                inp = language.upcast(inp)
+                blk_max = triton.language.maximum(max, triton.language.max(inp, 0))
+                num = language.exp(inp - blk_max)
+                acc = acc * language.exp(max - blk_max) + triton.language.sum(num, 0)
+                max = blk_max
+
+            vld = (tgt >= 0) & (tgt < vec_sz)
+            triton.language.device_assert(vld, "target is out of bounds")
+            inp_tgt = triton.language.load(inp_ptr + tgt, vld, float("nan"))
+            inp_tgt = language.upcast(inp_tgt)
+            loss = max + triton.language.log(acc) - inp_tgt
+
+            if grad_ptr is not None:
+                for blk_off in range(0, vec_sz, blk_sz):
+                    blk, msk = language.make_block(vec_sz, blk_sz, blk_off)
+                    inp = triton.language.load(inp_ptr + blk, msk, -float("inf"))
+                    inp = language.upcast(inp)
+                    grad = language.exp(inp - max) / acc
+                    grad = triton.language.where(blk == tgt, grad - 1.0, grad) * scale
+                    triton.language.store(grad_ptr + pid * grad_st + blk, grad, msk)
+
+            triton.language.store(loss_ptr + pid, loss)
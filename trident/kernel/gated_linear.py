@@ -0,0 +1,150 @@
+# Copyright 2023 ⓒ Kakao Brain Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import triton
+
+from trident import language
+
+
+def get_configs_gated_linear():
+    configs = []
+    for blk_sz_m in [32, 64]:
+        for blk_sz_k in [32, 64]:
+            for blk_sz_n in [32, 64]:
+                for num_stages in [2, 3]:
+                    configs.append(
+                        triton.Config(
+                            {
+                                "blk_sz_m": blk_sz_m,
+                                "blk_sz_k": blk_sz_k,
+                                "blk_sz_n": blk_sz_n,
+                            },
+                            num_stages=num_stages,
+                            num_warps=4,
+                        )
+                    )
+    return configs
+
+
+class GatedLinear:
+    @staticmethod
+    @triton.autotune(
+        configs=get_configs_gated_linear(), key=["sz_m_bkt", "sz_k", "sz_n"]
+    )
+    @triton.jit
+    def forward(
+        x_ptr,
+        x_st_m,
+        x_st_k,
+        y_ptr,
+        w_ptr,
+        w_st_n,
+        w_st_k,
+        grad_y_ptr,
+        grad_gu_ptr,
+        sz_m,
+        sz_k,
+        sz_n,
+        sz_m_bkt,
+        act: triton.language.constexpr,
+        blk_sz_m: triton.language.constexpr,
+        blk_sz_k: triton.language.constexpr,
+        blk_sz_n: triton.language.constexpr,
+        dtype: triton.language.constexpr,
+    ):
+        i = triton.language.program_id(0)
+        j = triton.language.program_id(1)
+
+        x_blk_ptr = triton.language.make_block_ptr(
+            base=x_ptr,
+            shape=(sz_m, sz_k),
+            strides=(x_st_m, x_st_k),
+            offsets=(i * blk_sz_m, 0),
+            block_shape=(blk_sz_m, blk_sz_k),
+            order=(1, 0),
+        )
+
+        w_g_blk_ptr = triton.language.make_block_ptr(
+            base=w_ptr,
+            shape=(sz_k, sz_n),
+            strides=(w_st_k, w_st_n),
+            offsets=(0, j * blk_sz_n),
+            block_shape=(blk_sz_k, blk_sz_n),
+            order=(1, 0),
+        )
+
+        w_u_blk_ptr = triton.language.make_block_ptr(
+            base=w_ptr + sz_n * w_st_n,
+            shape=(sz_k, sz_n),
+            strides=(w_st_k, w_st_n),
+            offsets=(0, j * blk_sz_n),
+            block_shape=(blk_sz_k, blk_sz_n),
+            order=(1, 0),
+        )
+
+        g = language.acc_zeros((blk_sz_m, blk_sz_n), dtype)
+        u = language.acc_zeros((blk_sz_m, blk_sz_n), dtype)
+
+        for _ in range(0, sz_k, blk_sz_k):
+            x = triton.language.load(x_blk_ptr, boundary_check=(0, 1))
+            w_g = triton.language.load(w_g_blk_ptr, boundary_check=(0, 1))
+            w_u = triton.language.load(w_u_blk_ptr, boundary_check=(0, 1))
+            g += triton.language.dot(x, w_g, False)
+            u += triton.language.dot(x, w_u, False)
+
+            x_blk_ptr = triton.language.advance(x_blk_ptr, (0, blk_sz_k))
+            w_g_blk_ptr = triton.language.advance(w_g_blk_ptr, (blk_sz_k, 0))
+            w_u_blk_ptr = triton.language.advance(w_u_blk_ptr, (blk_sz_k, 0))
+
+        if act == "silu":
+            sig = language.sigmoid(g, g.dtype)
+            a = g * sig
+        elif act == "gelu":
+            cdf = 0.5 * (1 + language.erf(0.707106781187 * g))
+            a = g * cdf
+        else:
+            c = 0.797884560802865
+            b = language.tanh(c * (g + 0.044715 * language.pow3(g)))
+            a = 0.5 * g * (1 + b)
+
+        range_m, msk_m = language.make_block(sz_m, blk_sz_m, i * blk_sz_m)
+        range_n, msk_n = language.make_block(sz_n, blk_sz_n, j * blk_sz_n)
+        msk = msk_m[:, None] & msk_n[None, :]
+
+        if grad_y_ptr is None:
+            y_ptr += range_m[:, None] * sz_n + range_n[None, :]
+            triton.language.store(y_ptr, (a * u).to(dtype), msk)
+        else:
+            grad_y_ptr += range_m[:, None] * sz_n + range_n[None, :]
+            grad_y = triton.language.load(grad_y_ptr, msk, 0.0).to(g.dtype)
+
+            if act == "silu":
+                grad_a = sig + g * sig * (1 - sig)
+            elif act == "gelu":
+                pdf = 0.398942280401 * language.exp(-0.5 * language.pow2(g))
+                grad_a = cdf + g * pdf
+            else:
+                grad_a = 0.5 * (
+                    1
+                    + b
+                    + g
+                    * (1.0 - language.pow2(b))
+                    * c
+                    * (1 + 0.134145 * language.pow2(g))
+                )
+
+            grad_gu_ptr += range_m[:, None] * sz_n * 2 + range_n[None, :]
+            triton.language.store(grad_gu_ptr, (grad_y * u * grad_a).to(dtype), msk)
+            triton.language.store(grad_gu_ptr + sz_n, (grad_y * a).to(dtype), msk)
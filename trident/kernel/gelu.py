@@ -25,7 +25,7 @@ class GELU:
         blk = triton.language.arange(0, blk_sz) + pid * blk_sz
         msk = blk < inp_sz
 
-        inp = triton.language.load(inp_ptr + blk, msk, 0)
+        inp = language.upcast(triton.language.load(inp_ptr + blk, msk, 0))
         out = language.gelu(inp)
 
         triton.language.store(out_ptr + blk, out, msk)
@@ -43,12 +43,12 @@ class GELU:
         blk = triton.language.arange(0, blk_sz) + pid * blk_sz
         msk = blk < inp_sz
 
-        inp = triton.language.load(inp_ptr + blk, msk, 0)
+        inp = language.upcast(triton.language.load(inp_ptr + blk, msk, 0))
         a = 0.797884560802865
         b = language.tanh(a * (inp + 0.044715 * language.pow3(inp)))
         c = 1.0 + b
         d = inp * (1.0 - language.pow2(b)) * a * (1 + 0.134145 * language.pow2(inp))
-        grad_out = triton.language.load(grad_out_ptr + blk, msk, 0)
+        grad_out = language.upcast(triton.language.load(grad_out_ptr + blk, msk, 0))
         grad_inp = 0.5 * (c + d)
 
         triton.language.store(grad_inp_ptr + blk, grad_out * grad_inp, msk)
@@ -0,0 +1,134 @@
+# Copyright 2023 ⓒ Kakao Brain Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import triton
+
+from trident import language
+
+
+def get_configs_grouped_linear():
+    configs = []
+    for blk_sz_m in [32, 64]:
+        for blk_sz_k in [32, 64]:
+            for blk_sz_n in [32, 64, 128]:
+                configs.append(
+                    triton.Config(
+                        {
+                            "blk_sz_m": blk_sz_m,
+                            "blk_sz_k": blk_sz_k,
+                            "blk_sz_n": blk_sz_n,
+                        },
+                        num_stages=3,
+                        num_warps=4,
+                    )
+                )
+    return configs
+
+
+class GroupedLinear:
+    @staticmethod
+    @triton.autotune(
+        configs=get_configs_grouped_linear(),
+        key=["num_grp", "sz_m_bkt", "sz_k_max", "sz_n_max"],
+    )
+    @triton.jit
+    def forward(
+        args_ptr,
+        num_grp,
+        sz_m_bkt,
+        sz_k_max,
+        sz_n_max,
+        blk_sz_m: triton.language.constexpr,
+        blk_sz_k: triton.language.constexpr,
+        blk_sz_n: triton.language.constexpr,
+        dtype: triton.language.constexpr,
+    ):
+        pid = triton.language.program_id(0)
+        num_pid = triton.language.num_programs(0)
+        ptr_ty = triton.language.pointer_type(dtype)
+
+        tile = pid
+        tile_end = 0
+
+        for g in range(0, num_grp):
+            grp_args_ptr = args_ptr + g * 11
+            sz_m = triton.language.load(grp_args_ptr + 4)
+            sz_k = triton.language.load(grp_args_ptr + 5)
+            sz_n = triton.language.load(grp_args_ptr + 6)
+            num_tile_n = triton.language.cdiv(sz_n, blk_sz_n)
+            tile_begin = tile_end
+            tile_end += triton.language.cdiv(sz_m, blk_sz_m) * num_tile_n
+
+            while tile < tile_end:
+                x_ptr = triton.language.load(grp_args_ptr).to(ptr_ty)
+                w_ptr = triton.language.load(grp_args_ptr + 1).to(ptr_ty)
+                b_addr = triton.language.load(grp_args_ptr + 2)
+                y_ptr = triton.language.load(grp_args_ptr + 3).to(ptr_ty)
+                x_st_m = triton.language.load(grp_args_ptr + 7)
+                x_st_k = triton.language.load(grp_args_ptr + 8)
+                w_st_n = triton.language.load(grp_args_ptr + 9)
+                w_st_k = triton.language.load(grp_args_ptr + 10)
+                i = (tile - tile_begin) // num_tile_n
+                j = (tile - tile_begin) % num_tile_n
+
+                x_blk_ptr = triton.language.make_block_ptr(
+                    base=x_ptr,
+                    shape=(sz_m, sz_k),
+                    strides=(x_st_m, x_st_k),
+                    offsets=(i * blk_sz_m, 0),
+                    block_shape=(blk_sz_m, blk_sz_k),
+                    order=(1, 0),
+                )
+
+                w_blk_ptr = triton.language.make_block_ptr(
+                    base=w_ptr,
+                    shape=(sz_k, sz_n),
+                    strides=(w_st_k, w_st_n),
+                    offsets=(0, j * blk_sz_n),
+                    block_shape=(blk_sz_k, blk_sz_n),
+                    order=(1, 0),
+                )
+
+                acc = language.acc_zeros((blk_sz_m, blk_sz_n), dtype)
+
+                for _ in range(0, sz_k, blk_sz_k):
+                    x = triton.language.load(x_blk_ptr, boundary_check=(0, 1))
+                    w = triton.language.load(w_blk_ptr, boundary_check=(0, 1))
+                    acc += triton.language.dot(x, w, False)
+
+                    x_blk_ptr = triton.language.advance(x_blk_ptr, (0, blk_sz_k))
+                    w_blk_ptr = triton.language.advance(w_blk_ptr, (blk_sz_k, 0))
+
+                range_n, msk_n = language.make_block(sz_n, blk_sz_n, j * blk_sz_n)
+
+                if b_addr != 0:
+                    b_ptr = b_addr.to(ptr_ty) + range_n
+                    b = triton.language.load(b_ptr, msk_n, 0.0)
+                    acc += b[None, :]
+
+                y_blk_ptr = triton.language.make_block_ptr(
+                    base=y_ptr,
+                    shape=(sz_m, sz_n),
+                    strides=(sz_n, 1),
+                    offsets=(i * blk_sz_m, j * blk_sz_n),
+                    block_shape=(blk_sz_m, blk_sz_n),
+                    order=(1, 0),
+                )
+
+                triton.language.store(
+                    y_blk_ptr, acc.to(dtype), mask=None, boundary_check=(0, 1)
+                )
+
+                tile += num_pid
@@ -22,6 +22,9 @@ class InstanceNorm:
     @triton.jit
     def forward(
         p_inp,
+        inp_bt_st,
+        inp_ch_st,
+        inp_vec_st,
         num_ch,
         vec_sz,
         p_run_mean,
@@ -30,32 +33,29 @@ class InstanceNorm:
         p_bis,
         eps,
         p_out,
+        out_bt_st,
+        out_ch_st,
+        out_vec_st,
         blk_sz: triton.language.constexpr,
-        dtype: triton.language.constexpr,
     ):
         pid = triton.language.program_id(0)
         bt = pid // num_ch
         ch = language.col(pid, num_ch)
 
-        ptr_off = bt * num_ch * vec_sz + ch * vec_sz
-        p_inp += ptr_off
-        p_out += ptr_off
+        p_inp += bt * inp_bt_st + ch * inp_ch_st
+        p_out += bt * out_bt_st + ch * out_ch_st
 
-        if p_run_mean is None:
-            mean = kernel.mean(p_inp, vec_sz, blk_sz, dtype)
+        if p_run_mean is None or p_run_var is None:
+            mean, var = kernel.mean_var(p_inp, vec_sz, blk_sz, inp_vec_st)
         else:
             mean = triton.language.load(p_run_mean + ch)
-
-        if p_run_var is None:
-            var = kernel.var(p_inp, vec_sz, mean, blk_sz, dtype)
-        else:
             var = triton.language.load(p_run_var + ch)
 
         std = language.std(var, eps)
 
         for blk_off in range(0, vec_sz, blk_sz):
             blk, msk = language.make_block(vec_sz, blk_sz, blk_off)
-            inp = triton.language.load(p_inp + blk, msk, 0)
+            inp = triton.language.load(p_inp + blk * inp_vec_st, msk, 0)
             out = language.norm(inp, mean, std)
 
             if p_wgt is not None:
@@ -64,14 +64,23 @@ class InstanceNorm:
             if p_bis is not None:
                 out += triton.language.load(p_bis + ch)
 
-            triton.language.store(p_out + blk, out, msk)
+            triton.language.store(p_out + blk * out_vec_st, out, msk)
 
     @staticmethod
     @triton.jit
     def backward(
         p_grad_out,
+        grad_out_bt_st,
+        grad_out_ch_st,
+        grad_out_vec_st,
         p_inp,
+        inp_bt_st,
+        inp_ch_st,
+        inp_vec_st,
         p_grad_inp,
+        grad_inp_bt_st,
+        grad_inp_ch_st,
+        grad_inp_vec_st,
         num_ch,
         vec_sz,
         wgt_ptr,
@@ -84,13 +93,12 @@ class InstanceNorm:
         bt = pid // num_ch
         ch = language.col(pid, num_ch)
 
-        ptr_off = bt * num_ch * vec_sz + ch * vec_sz
-        p_grad_out += ptr_off
-        p_inp += ptr_off
-        p_grad_inp += ptr_off
+        p_grad_out += bt * grad_out_bt_st + ch * grad_out_ch_st
+        p_inp += bt * inp_bt_st + ch * inp_ch_st
+        p_grad_inp += bt * grad_inp_bt_st + ch * grad_inp_ch_st
 
         blk, msk = language.make_block(vec_sz, blk_sz)
-        inp = triton.language.load(p_inp + blk, msk, 0)
+        inp = language.upcast(triton.language.load(p_inp + blk * inp_vec_st, msk, 0))
         wgt = triton.language.load(wgt_ptr + ch) if wgt_ptr is not None else 1
         mean = language.mean(inp, vec_sz)
         var = language.var(msk, inp, vec_sz, mean, corr=0)
@@ -98,7 +106,8 @@ class InstanceNorm:
         mean_ctr = triton.language.where(msk, inp - mean, 0)
         norm = mean_ctr / std
 
-        grad_out = triton.language.load(p_grad_out + blk, msk, 0)
+        grad_out = triton.language.load(p_grad_out + blk * grad_out_vec_st, msk, 0)
+        grad_out = language.upcast(grad_out)
         grad_norm = wgt * grad_out
         grad_std = ((grad_norm * mean_ctr) / -language.pow2(std)) / (2 * std)
         grad_var = language.mean(grad_std, vec_sz)
@@ -106,7 +115,7 @@ class InstanceNorm:
         grad_mean_ctr = triton.language.where(msk, (grad_norm / std) + grad_dist, 0)
         grad_mean = -language.mean(grad_mean_ctr, vec_sz)
         grad_inp = grad_mean_ctr + grad_mean
-        triton.language.store(p_grad_inp + blk, grad_inp, msk)
+        triton.language.store(p_grad_inp + blk * grad_inp_vec_st, grad_inp, msk)
 
         if p_stg_grad_wgt is not None:
             grad_wgt = triton.language.sum(norm * grad_out, 0)
@@ -122,23 +131,23 @@ class InstanceNorm:
     @triton.jit
     def mean_var(
         p_inp,
+        inp_bt_st,
+        inp_ch_st,
+        inp_vec_st,
         num_bt,
         num_ch,
         vec_sz,
         p_mean,
         p_var,
         blk_sz: triton.language.constexpr,
-        dtype: triton.language.constexpr,
     ):
         pid = triton.language.program_id(0)
         bt = pid // num_ch
         ch = language.col(pid, num_ch)
 
-        ptr_off = bt * num_ch * vec_sz + ch * vec_sz
-        p_inp += ptr_off
+        p_inp += bt * inp_bt_st + ch * inp_ch_st
 
-        mean = kernel.mean(p_inp, vec_sz, blk_sz, dtype)
-        var = kernel.var(p_inp, vec_sz, mean, blk_sz, dtype)
+        mean, var = kernel.mean_var(p_inp, vec_sz, blk_sz, inp_vec_st)
 
         triton.language.atomic_add(p_mean + ch, mean / num_bt)
         triton.language.atomic_add(p_var + ch, var / num_bt)
@@ -22,14 +22,17 @@ class LayerGroupNorm:
     @triton.jit
     def forward(
         inp_ptr,
+        res_ptr,
         vec_sz,
         wgt_ptr,
         bis_ptr,
         eps,
         out_ptr,
+        res_out_ptr,
+        mean_ptr,
+        rstd_ptr,
         num_grp,
         blk_sz: triton.language.constexpr,
-        dtype: triton.language.constexpr,
     ):
         pid = triton.language.program_id(0)
         ptr_off = pid * vec_sz
@@ -45,14 +48,32 @@ class LayerGroupNorm:
         if bis_ptr:
             bis_ptr += grp_off
 
-        mean = kernel.mean(inp_ptr, vec_sz, blk_sz, dtype)
-        var = kernel.var(inp_ptr, vec_sz, mean, blk_sz, dtype)
-        std = language.std(var, eps)
+        if res_ptr is not None:
+            res_ptr += ptr_off
+            res_out_ptr += ptr_off
+            mean = language.acc_scalar(inp_ptr, 0.0)
+            m2 = language.acc_scalar(inp_ptr, 0.0)
+            cnt = 0.0
+
+            for blk_off in range(0, vec_sz, blk_sz):
+                blk, msk = language.make_block(vec_sz, blk_sz, blk_off)
+                inp = triton.language.load(inp_ptr + blk, msk, 0)
+                inp += triton.language.load(res_ptr + blk, msk, 0)
+                triton.language.store(res_out_ptr + blk, inp, msk)
+                inp = language.upcast(inp)
+                mean, m2, cnt = language.welford(mean, m2, cnt, inp, msk)
+
+            var = m2 / vec_sz
+            inp_ptr = res_out_ptr
+        else:
+            mean, var = kernel.mean_var(inp_ptr, vec_sz, blk_sz)
+
+        rstd = 1.0 / language.std(var, eps)
 
         for blk_off in range(0, vec_sz, blk_sz):
             blk, msk = language.make_block(vec_sz, blk_sz, blk_off)
             inp = triton.language.load(inp_ptr + blk, msk, 0)
-            out = language.norm(inp, mean, std)
+            out = (inp - mean) * rstd
 
             if wgt_ptr:
                 wgt = triton.language.load(wgt_ptr + blk, msk, 0)
@@ -64,57 +85,103 @@ class LayerGroupNorm:
 
             triton.language.store(out_ptr + blk, out, msk)
 
+        triton.language.store(mean_ptr + pid, mean)
+        triton.language.store(rstd_ptr + pid, rstd)
+
     @staticmethod
     @triton.jit
     def backward(
         grad_out_ptr,
         inp_ptr,
         grad_inp_ptr,
+        num_vec,
         vec_sz,
         wgt_ptr,
         grad_wgt_ptr,
         grad_bis_ptr,
-        eps,
+        grad_res_ptr,
+        mean_ptr,
+        rstd_ptr,
         num_grp,
+        vec_per_pid,
         blk_sz: triton.language.constexpr,
-        dtype: triton.language.constexpr,
+        deterministic: triton.language.constexpr,
     ):
         pid = triton.language.program_id(0)
-        blk_off = pid * vec_sz
-        grp = pid % num_grp
-        grp_off = grp * vec_sz
-
-        grad_out_ptr += blk_off
-        inp_ptr += blk_off
-        grad_inp_ptr += blk_off
-
-        if grad_wgt_ptr:
-            grad_wgt_ptr += grp_off
-
-        if grad_bis_ptr:
-            grad_bis_ptr += grp_off
-
-        mean = kernel.mean(inp_ptr, vec_sz, blk_sz, dtype)
-        var = kernel.var(inp_ptr, vec_sz, mean, blk_sz, dtype)
-        std = language.std(var, eps)
-
-        for blk_off in range(0, vec_sz, blk_sz):
-            blk, msk = language.make_block(vec_sz, blk_sz, blk_off)
-            grad_out = triton.language.load(grad_out_ptr + blk, msk, 0)
-            inp = triton.language.load(inp_ptr + blk, msk, 0)
-            wgt = triton.language.load(wgt_ptr + blk, msk, 0)
-
-            a = grad_out * wgt
-            b = (inp - mean) / std
-            b = triton.language.where(msk, b, 0)
-            c = language.gemv(b, a) / vec_sz
-            d = language.gemv(grad_out, wgt) / vec_sz
-            grad_inp = (a - c * b - d) / std
+        vec_beg = pid * vec_per_pid
+        vec_end = triton.language.minimum(vec_beg + vec_per_pid, num_vec)
 
-            triton.language.store(grad_inp_ptr + blk, grad_inp, msk)
+        if deterministic:
+            stg_off = pid * num_grp * vec_sz
 
             if grad_wgt_ptr:
-                triton.language.atomic_add(grad_wgt_ptr + blk, grad_out * b, msk)
+                grad_wgt_ptr += stg_off
 
             if grad_bis_ptr:
-                triton.language.atomic_add(grad_bis_ptr + blk, grad_out, msk)
+                grad_bis_ptr += stg_off
+
+        for vec in range(vec_beg, vec_end):
+            ptr_off = vec * vec_sz
+            grp_off = (vec % num_grp) * vec_sz
+
+            mean = triton.language.load(mean_ptr + vec)
+            rstd = triton.language.load(rstd_ptr + vec)
+            c = language.acc_scalar(inp_ptr, 0.0)
+            d = language.acc_scalar(inp_ptr, 0.0)
+
+            for blk_off in range(0, vec_sz, blk_sz):
+                blk, msk = language.make_block(vec_sz, blk_sz, blk_off)
+                grad_out = triton.language.load(grad_out_ptr + ptr_off + blk, msk, 0)
+                inp = triton.language.load(inp_ptr + ptr_off + blk, msk, 0)
+                wgt = triton.language.load(wgt_ptr + grp_off + blk, msk, 0)
+
+                a = language.upcast(grad_out) * wgt
+                b = (language.upcast(inp) - mean) * rstd
+                b = triton.language.where(msk, b, 0)
+                c += triton.language.sum(a * b, 0)
+                d += triton.language.sum(a, 0)
+
+            c /= vec_sz
+            d /= vec_sz
+
+            for blk_off in range(0, vec_sz, blk_sz):
+                blk, msk = language.make_block(vec_sz, blk_sz, blk_off)
+                grad_out = triton.language.load(grad_out_ptr + ptr_off + blk, msk, 0)
+                inp = triton.language.load(inp_ptr + ptr_off + blk, msk, 0)
+                wgt = triton.language.load(wgt_ptr + grp_off + blk, msk, 0)
+
+                grad_out = language.upcast(grad_out)
+                a = grad_out * wgt
+                b = (language.upcast(inp) - mean) * rstd
+                grad_inp = (a - c * b - d) * rstd
+
+                if grad_res_ptr is not None:
+                    grad_res = triton.language.load(
+                        grad_res_ptr + ptr_off + blk, msk, 0
+                    )
+                    grad_inp += grad_res
+
+                triton.language.store(grad_inp_ptr + ptr_off + blk, grad_inp, msk)
+                grp_blk = grp_off + blk
+
+                if grad_wgt_ptr:
+                    grad_wgt = grad_out * b
+
+                    if deterministic:
+                        grad_wgt += triton.language.load(grad_wgt_ptr + grp_blk, msk, 0)
+                        triton.language.store(grad_wgt_ptr + grp_blk, grad_wgt, msk)
+                    else:
+                        triton.language.atomic_add(
+                            grad_wgt_ptr + grp_blk, grad_wgt, msk
+                        )
+
+                if grad_bis_ptr:
+                    grad_bis = grad_out
+
+                    if deterministic:
+                        grad_bis += triton.language.load(grad_bis_ptr + grp_blk, msk, 0)
+                        triton.language.store(grad_bis_ptr + grp_blk, grad_bis, msk)
+                    else:
+                        triton.language.atomic_add(
+                            grad_bis_ptr + grp_blk, grad_bis, msk
+                        )
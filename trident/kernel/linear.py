@@ -30,63 +30,182 @@ def get_configs_linear_io_bound_forward():
                                 "blk_sz_m": 64,
                                 "blk_sz_k": blk_sz_k,
                                 "blk_sz_n": blk_sz_n,
+                                "split_k": 1,
                             },
                             num_stages=num_stages,
                             num_warps=num_warps,
                         )
                     )
+    for blk_sz_k in [64, 128]:
+        for blk_sz_n in [64, 128]:
+            for split_k in [2, 4, 8, 16]:
+                configs.append(
+                    triton.Config(
+                        {
+                            "blk_sz_m": 16,
+                            "blk_sz_k": blk_sz_k,
+                            "blk_sz_n": blk_sz_n,
+                            "split_k": split_k,
+                        },
+                        num_stages=3,
+                        num_warps=4,
+                        pre_hook=zero_linear_split_k_workspace,
+                    )
+                )
+    return configs
+
+
+def prune_configs_linear_forward(configs, nargs, **kwargs):
+    if nargs["wsp_ptr"] is None:
+        return [config for config in configs if config.kwargs["split_k"] == 1]
+
     return configs
 
 
+def zero_linear_split_k_workspace(nargs):
+    nargs["wsp_ptr"].zero_()
+    nargs["lck_ptr"].zero_()
+
+
+@triton.jit
+def linear_epilogue(
+    acc,
+    i,
+    j,
+    y_ptr,
+    b_ptr,
+    st_n,
+    r_ptr,
+    r_st_m,
+    r_st_n,
+    z_ptr,
+    scale,
+    p,
+    seed,
+    sz_m,
+    sz_n,
+    act: triton.language.constexpr,
+    blk_sz_m: triton.language.constexpr,
+    blk_sz_n: triton.language.constexpr,
+    dtype: triton.language.constexpr,
+):
+    range_m, msk_m = language.make_block(sz_m, blk_sz_m, i * blk_sz_m)
+    range_n, msk_n = language.make_block(sz_n, blk_sz_n, j * blk_sz_n)
+    msk = msk_m[:, None] & msk_n[None, :]
+
+    if b_ptr is not None:
+        b_ptr += range_n * st_n
+        b = triton.language.load(b_ptr, msk_n, 0.0)
+        acc += b[None, :]
+
+    if z_ptr is not None:
+        z_ptr += range_m[:, None] * sz_n + range_n[None, :]
+        triton.language.store(z_ptr, acc, msk)
+
+    if act == "relu":
+        acc = language.relu(acc)
+    elif act == "leaky_relu":
+        acc = language.leaky_relu(acc, 1e-2)
+    elif act == "gelu":
+        acc = language.gelu_erf(acc)
+    elif act == "gelu_tanh":
+        acc = language.gelu(acc)
+    elif act == "silu":
+        acc = language.silu(acc)
+
+    acc *= scale
+
+    if p > 0:
+        rnd = triton.language.rand(seed, range_m[:, None] * sz_n + range_n[None, :])
+        acc = triton.language.where(rnd > p, acc / (1.0 - p), 0.0)
+
+    if r_ptr is not None:
+        r_ptr += range_m[:, None] * r_st_m + range_n[None, :] * r_st_n
+        acc += triton.language.load(r_ptr, msk, 0.0)
+
+    y_blk_ptr = triton.language.make_block_ptr(
+        base=y_ptr,
+        shape=(sz_m, sz_n),
+        strides=(sz_n, 1),
+        offsets=(i * blk_sz_m, j * blk_sz_n),
+        block_shape=(blk_sz_m, blk_sz_n),
+        order=(1, 0),
+    )
+
+    triton.language.store(y_blk_ptr, acc.to(dtype), mask=None, boundary_check=(0, 1))
+
+
 def get_configs_linear_io_bound_backward():
     configs = []
     for blk_sz_k in [32, 64]:
-        for blk_sz_n_m in [32, 64]:
-            for num_stages in [2, 3, 5]:
-                for num_warps in [2, 4, 8]:
-                    configs.append(
-                        triton.Config(
-                            {
-                                "blk_sz_m": blk_sz_n_m,
-                                "blk_sz_k": blk_sz_k,
-                                "blk_sz_n": blk_sz_n_m,
-                            },
-                            num_stages=num_stages,
-                            num_warps=num_warps,
+        for blk_sz_m in [32, 64]:
+            for blk_sz_n in [32, 64]:
+                for num_stages in [2, 3]:
+                    for num_warps in [2, 4]:
+                        configs.append(
+                            triton.Config(
+                                {
+                                    "blk_sz_m": blk_sz_m,
+                                    "blk_sz_k": blk_sz_k,
+                                    "blk_sz_n": blk_sz_n,
+                                },
+                                num_stages=num_stages,
+                                num_warps=num_warps,
+                            )
                         )
-                    )
     return configs
 
 
 class Linear:
     @staticmethod
     @triton.autotune(
-        configs=get_configs_linear_io_bound_forward(), key=["sz_m", "sz_k", "sz_n"]
+        configs=get_configs_linear_io_bound_forward(),
+        key=["sz_m_bkt", "sz_k", "sz_n"],
+        prune_configs_by={"early_config_prune": prune_configs_linear_forward},
     )
     @triton.jit
     def forward(
         x_ptr,
+        x_st_m,
+        x_st_k,
         y_ptr,
         w_ptr,
+        w_st_n,
+        w_st_k,
         b_ptr,
         st_n,
+        r_ptr,
+        r_st_m,
+        r_st_n,
+        z_ptr,
+        wsp_ptr,
+        lck_ptr,
+        scale,
+        p,
+        seed,
         sz_m,
         sz_k,
         sz_n,
+        sz_m_bkt,
         act: triton.language.constexpr,
         blk_sz_m: triton.language.constexpr,
         blk_sz_k: triton.language.constexpr,
         blk_sz_n: triton.language.constexpr,
+        split_k: triton.language.constexpr,
         dtype: triton.language.constexpr,
     ):
         i = triton.language.program_id(0)
         j = triton.language.program_id(1)
+        k = triton.language.program_id(2)
+
+        sz_k_per_split = triton.language.cdiv(sz_k, blk_sz_k * split_k) * blk_sz_k
+        k_off = k * sz_k_per_split
 
         x_blk_ptr = triton.language.make_block_ptr(
             base=x_ptr,
             shape=(sz_m, sz_k),
-            strides=(sz_k, 1),
-            offsets=(i * blk_sz_m, 0),
+            strides=(x_st_m, x_st_k),
+            offsets=(i * blk_sz_m, k_off),
             block_shape=(blk_sz_m, blk_sz_k),
             order=(1, 0),
         )
@@ -94,15 +213,17 @@ class Linear:
         w_blk_ptr = triton.language.make_block_ptr(
             base=w_ptr,
             shape=(sz_k, sz_n),
-            strides=(1, sz_k),
-            offsets=(0, j * blk_sz_n),
+            strides=(w_st_k, w_st_n),
+            offsets=(k_off, j * blk_sz_n),
             block_shape=(blk_sz_k, blk_sz_n),
             order=(1, 0),
         )
 
-        acc = triton.language.zeros((blk_sz_m, blk_sz_n), dtype=dtype)
+        acc = language.acc_zeros((blk_sz_m, blk_sz_n), dtype)
 
-        for _ in range(0, sz_k, blk_sz_k):
+        for _ in range(
+            k_off, triton.language.minimum(k_off + sz_k_per_split, sz_k), blk_sz_k
+        ):
             x = triton.language.load(x_blk_ptr, boundary_check=(0, 1))
             w = triton.language.load(w_blk_ptr, boundary_check=(0, 1))
             acc += triton.language.dot(x, w, False)
@@ -110,27 +231,63 @@ class Linear:
             x_blk_ptr = triton.language.advance(x_blk_ptr, (0, blk_sz_k))
             w_blk_ptr = triton.language.advance(w_blk_ptr, (blk_sz_k, 0))
 
-        if b_ptr is not None:
+        if split_k == 1:
+            linear_epilogue(
+                acc,
+                i,
+                j,
+                y_ptr,
+                b_ptr,
+                st_n,
+                r_ptr,
+                r_st_m,
+                r_st_n,
+                z_ptr,
+                scale,
+                p,
+                seed,
+                sz_m,
+                sz_n,
+                act,
+                blk_sz_m,
+                blk_sz_n,
+                dtype,
+            )
+        else:
+            # Partial sums are accumulated into the workspace, and the last program to finish a tile applies the
+            # epilogue to it, so the whole split-K product runs in one launch the autotuner can benchmark.
+            range_m, msk_m = language.make_block(sz_m, blk_sz_m, i * blk_sz_m)
             range_n, msk_n = language.make_block(sz_n, blk_sz_n, j * blk_sz_n)
-            b_ptr += range_n * st_n
-            b = triton.language.load(b_ptr, msk_n, 0.0)
-            acc += b[None, :]
-
-        if act == "relu":
-            acc = language.relu(acc)
-        elif act == "leaky_relu":
-            acc = language.leaky_relu(acc, 1e-2)
-
-        y_blk_ptr = triton.language.make_block_ptr(
-            base=y_ptr,
-            shape=(sz_m, sz_n),
-            strides=(sz_n, 1),
-            offsets=(i * blk_sz_m, j * blk_sz_n),
-            block_shape=(blk_sz_m, blk_sz_n),
-            order=(1, 0),
-        )
-
-        triton.language.store(y_blk_ptr, acc, mask=None, boundary_check=(0, 1))
+            wsp_ptr += range_m[:, None] * sz_n + range_n[None, :]
+            msk = msk_m[:, None] & msk_n[None, :]
+
+            triton.language.atomic_add(wsp_ptr, acc, msk)
+
+            lck_ptr += i * triton.language.cdiv(sz_n, blk_sz_n) + j
+
+            if triton.language.atomic_add(lck_ptr, 1) == split_k - 1:
+                acc = triton.language.load(wsp_ptr, msk, 0.0, cache_modifier=".cg")
+                linear_epilogue(
+                    acc,
+                    i,
+                    j,
+                    y_ptr,
+                    b_ptr,
+                    st_n,
+                    r_ptr,
+                    r_st_m,
+                    r_st_n,
+                    z_ptr,
+                    scale,
+                    p,
+                    seed,
+                    sz_m,
+                    sz_n,
+                    act,
+                    blk_sz_m,
+                    blk_sz_n,
+                    dtype,
+                )
 
     @staticmethod
     @triton.jit
@@ -141,8 +298,12 @@ class Linear:
         p_grad_bis,
         sz_m,
         sz_n,
+        scale,
+        p,
+        seed,
         act: triton.language.constexpr,
         blk_sz: triton.language.constexpr,
+        dtype: triton.language.constexpr,
     ):
         n = triton.language.program_id(0)
 
@@ -179,13 +340,40 @@ class Linear:
             grad_act = triton.language.load(ptrs_grad_out, boundary_check=(0,))
             out = triton.language.load(ptrs_out, boundary_check=(0,))
 
-            if act is not None:
-                grad_act *= triton.language.where(
-                    out > 0, 1, 0 if act == "relu" else 1e-2
+            if p > 0:
+                range_m = m * blk_sz + triton.language.arange(0, blk_sz)
+                rnd = triton.language.rand(seed, range_m[:, None] * sz_n + n)
+                grad_act = triton.language.where(rnd > p, grad_act / (1.0 - p), 0.0)
+
+            grad_act *= scale
+
+            if act == "relu":
+                grad_act *= triton.language.where(out > 0, 1, 0)
+            elif act == "leaky_relu":
+                grad_act *= triton.language.where(out > 0, 1, 1e-2)
+            elif act == "gelu":
+                out = out.to(triton.language.float32)
+                cdf = 0.5 * (1 + language.erf(0.707106781187 * out))
+                pdf = 0.398942280401 * language.exp(-0.5 * language.pow2(out))
+                grad_act *= cdf + out * pdf
+            elif act == "gelu_tanh":
+                out = out.to(triton.language.float32)
+                a = 0.797884560802865
+                b = language.tanh(a * (out + 0.044715 * language.pow3(out)))
+                c = 1.0 + b
+                d = (
+                    out
+                    * (1.0 - language.pow2(b))
+                    * a
+                    * (1 + 0.134145 * language.pow2(out))
                 )
+                grad_act *= 0.5 * (c + d)
+            elif act == "silu":
+                sig = language.sigmoid(out, dtype)
+                grad_act *= sig + out * sig * (1 - sig)
 
             triton.language.store(
-                ptrs_grad_act, grad_act, mask=None, boundary_check=(0,)
+                ptrs_grad_act, grad_act.to(dtype), mask=None, boundary_check=(0,)
             )
 
             if p_grad_bis is not None:
@@ -200,18 +388,19 @@ class Linear:
 
     @staticmethod
     @triton.autotune(
-        configs=get_configs_linear_io_bound_backward(), key=["sz_m", "sz_k", "sz_n"]
+        configs=get_configs_linear_io_bound_backward(), key=["sz_m_bkt", "sz_k", "sz_n"]
     )
     @triton.jit
-    def backward(
+    def backward_input(
         p_grad_out,
         p_wgt,
-        p_inp,
+        wgt_st_n,
+        wgt_st_k,
         p_grad_inp,
-        p_grad_wgt,
         sz_m,
         sz_n,
         sz_k,
+        sz_m_bkt,
         blk_sz_m: triton.language.constexpr,
         blk_sz_k: triton.language.constexpr,
         blk_sz_n: triton.language.constexpr,
@@ -232,13 +421,13 @@ class Linear:
         ptrs_wgt = triton.language.make_block_ptr(
             base=p_wgt,
             shape=(sz_n, sz_k),
-            strides=(sz_k, 1),
+            strides=(wgt_st_n, wgt_st_k),
             offsets=(0, j * blk_sz_k),
             block_shape=(blk_sz_n, blk_sz_k),
             order=(1, 0),
         )
 
-        acc_mk = triton.language.zeros((blk_sz_m, blk_sz_k), dtype)
+        acc_mk = language.acc_zeros((blk_sz_m, blk_sz_k), dtype)
 
         for _ in range(0, sz_n, blk_sz_n):
             grad = triton.language.load(ptrs_grad_out, boundary_check=(0, 1))
@@ -257,7 +446,32 @@ class Linear:
             order=(1, 0),
         )
 
-        triton.language.store(ptrs_grad_inp, acc_mk, mask=None, boundary_check=(0, 1))
+        triton.language.store(
+            ptrs_grad_inp, acc_mk.to(dtype), mask=None, boundary_check=(0, 1)
+        )
+
+    @staticmethod
+    @triton.autotune(
+        configs=get_configs_linear_io_bound_backward(), key=["sz_m_bkt", "sz_k", "sz_n"]
+    )
+    @triton.jit
+    def backward_weight(
+        p_grad_out,
+        p_inp,
+        inp_st_m,
+        inp_st_k,
+        p_grad_wgt,
+        sz_m,
+        sz_n,
+        sz_k,
+        sz_m_bkt,
+        blk_sz_m: triton.language.constexpr,
+        blk_sz_k: triton.language.constexpr,
+        blk_sz_n: triton.language.constexpr,
+        dtype: triton.language.constexpr,
+    ):
+        i = triton.language.program_id(0)
+        j = triton.language.program_id(1)
 
         ptrs_grad_out_t = triton.language.make_block_ptr(
             base=p_grad_out,
@@ -265,19 +479,19 @@ class Linear:
             strides=(1, sz_n),
             offsets=(i * blk_sz_n, 0),
             block_shape=(blk_sz_n, blk_sz_m),
-            order=(1, 0),
+            order=(0, 1),
         )
 
         ptrs_inp = triton.language.make_block_ptr(
             base=p_inp,
             shape=(sz_m, sz_k),
-            strides=(sz_k, 1),
+            strides=(inp_st_m, inp_st_k),
             offsets=(0, j * blk_sz_k),
             block_shape=(blk_sz_m, blk_sz_k),
             order=(1, 0),
         )
 
-        acc_nk = triton.language.zeros((blk_sz_n, blk_sz_k), dtype)
+        acc_nk = language.acc_zeros((blk_sz_n, blk_sz_k), dtype)
 
         for _ in range(0, sz_m, blk_sz_m):
             grad_t = triton.language.load(ptrs_grad_out_t, boundary_check=(0, 1))
@@ -296,4 +510,6 @@ class Linear:
             order=(1, 0),
         )
 
-        triton.language.store(ptrs_grad_wgt, acc_nk, mask=None, boundary_check=(0, 1))
+        triton.language.store(
+            ptrs_grad_wgt, acc_nk.to(dtype), mask=None, boundary_check=(0, 1)
+        )
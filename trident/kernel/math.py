@@ -17,25 +17,6 @@ import triton
 from trident import language
 
 
-@triton.jit
-def mean(
-    x_ptr,
-    x_sz,
-    blk_sz: triton.language.constexpr,
-    dtype: triton.language.constexpr,
-):
-    res = triton.language.zeros([blk_sz], dtype)
-
-    for off in range(0, x_sz, blk_sz):
-        blk = triton.language.arange(0, blk_sz) + off
-        msk = blk < x_sz
-
-        num = triton.language.load(x_ptr + blk, msk, 0)
-        res += num
-
-    return triton.language.sum(res, 0) / x_sz
-
-
 @triton.jit
 def max(inp_ptr, inp_sz, blk_sz: triton.language.constexpr):
     blk, msk = language.make_block(inp_sz, blk_sz, 0)
@@ -51,6 +32,20 @@ def max(inp_ptr, inp_sz, blk_sz: triton.language.constexpr):
     return res
 
 
+@triton.jit
+def mean_var(x_ptr, x_sz, blk_sz: triton.language.constexpr, x_st=1):
+    mean = language.acc_scalar(x_ptr, 0.0)
+    m2 = language.acc_scalar(x_ptr, 0.0)
+    cnt = 0.0
+
+    for blk_off in range(0, x_sz, blk_sz):
+        blk, msk = language.make_block(x_sz, blk_sz, blk_off)
+        num = language.upcast(triton.language.load(x_ptr + blk * x_st, msk, 0))
+        mean, m2, cnt = language.welford(mean, m2, cnt, num, msk)
+
+    return mean, m2 / x_sz
+
+
 @triton.jit
 def sum(
     output_ptr,
@@ -86,12 +81,14 @@ def sum(
         )
         size_along_axis = width
 
-    accumulation = triton.language.zeros((1,), triton.language.float32)
+    accumulation = language.acc_zeros((1,), input_ptr.dtype.element_ty)
 
     for _ in range(0, size_along_axis, block_size):
-        input = triton.language.load(
-            input_block_ptr, boundary_check=(axis,), padding_option="zero"
-        ).to(triton.language.float32)
+        input = language.upcast(
+            triton.language.load(
+                input_block_ptr, boundary_check=(axis,), padding_option="zero"
+            )
+        )
         accumulation += triton.language.sum(input, axis)
         input_block_ptr = triton.language.advance(
             input_block_ptr, (block_size, 0) if axis == 0 else (0, block_size)
@@ -107,22 +104,3 @@ def sum(
     )
     output = accumulation.to(dtype)
     triton.language.store(output_block_ptr, output)
-
-
-@triton.jit
-def var(
-    x_ptr,
-    x_sz,
-    mean,
-    blk_sz: triton.language.constexpr,
-    dtype: triton.language.constexpr,
-):
-    res = triton.language.zeros([blk_sz], triton.language.float32)
-
-    for blk_off in range(0, x_sz, blk_sz):
-        blk, msk = language.make_block(x_sz, blk_sz, blk_off)
-        num = triton.language.load(x_ptr + blk, msk, 0).to(triton.language.float32)
-        num = triton.language.where(msk, num - mean, 0)
-        res += language.pow2(num)
-
-    return (triton.language.sum(res, axis=0) / x_sz).to(dtype)
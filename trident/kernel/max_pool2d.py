@@ -27,12 +27,14 @@ class MaxPool2d:
         inp_bt_st,
         inp_ch_st,
         inp_h_st,
+        inp_w_st,
         out_ptr,
         out_h,
         out_w,
         out_bt_st,
         out_ch_st,
         out_h_st,
+        out_w_st,
         knl_sz,
         knl_bs: triton.language.constexpr,
         grp_sz: triton.language.constexpr,
@@ -46,17 +48,20 @@ class MaxPool2d:
         w = grp * grp_sz
 
         inp_ptr += (
-            bt * inp_bt_st + ch * inp_ch_st + h * (knl_sz * inp_h_st) + w * knl_sz
+            bt * inp_bt_st
+            + ch * inp_ch_st
+            + h * (knl_sz * inp_h_st)
+            + w * (knl_sz * inp_w_st)
         )
-        out_ptr += bt * out_bt_st + ch * out_ch_st + h * out_h_st + w
+        out_ptr += bt * out_bt_st + ch * out_ch_st + h * out_h_st + w * out_w_st
 
-        inp_blk = language.make_conv2d_blk(1, inp_h_st, 1, knl_bs, knl_bs)
+        inp_blk = language.make_conv2d_blk(1, inp_h_st, 1, knl_bs, knl_bs, inp_w_st)
         inp_blk = triton.language.ravel(inp_blk)
-        inp_blk = language.make_group_blk(inp_blk, grp_sz, knl_sz)
+        inp_blk = language.make_group_blk(inp_blk, grp_sz, knl_sz * inp_w_st)
         inp_msk = language.make_conv2d_msk(1, knl_sz, knl_sz, 1, knl_bs, knl_bs)
         inp_msk = triton.language.ravel(inp_msk)
         inp_msk = language.make_group_msk(inp_msk, grp_sz, w, out_h)
-        out_blk = triton.language.arange(0, grp_sz)
+        out_blk = triton.language.arange(0, grp_sz) * out_w_st
         out_msk = triton.language.arange(0, grp_sz) + w < out_w
 
         inp = triton.language.load(inp_ptr + inp_blk, inp_msk, -float("inf"))
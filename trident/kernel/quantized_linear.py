@@ -0,0 +1,131 @@
+# Copyright 2023 ⓒ Kakao Brain Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import triton
+
+from trident import language
+
+
+def get_configs_quantized_linear():
+    configs = []
+    for blk_sz_m in [16, 64]:
+        for blk_sz_k in [32, 64, 128]:
+            for blk_sz_n in [64, 128]:
+                for num_stages in [2, 3]:
+                    configs.append(
+                        triton.Config(
+                            {
+                                "blk_sz_m": blk_sz_m,
+                                "blk_sz_k": blk_sz_k,
+                                "blk_sz_n": blk_sz_n,
+                            },
+                            num_stages=num_stages,
+                            num_warps=4,
+                        )
+                    )
+    return configs
+
+
+class QuantizedLinear:
+    @staticmethod
+    @triton.autotune(
+        configs=get_configs_quantized_linear(), key=["sz_m_bkt", "sz_k", "sz_n"]
+    )
+    @triton.jit
+    def forward(
+        x_ptr,
+        x_st_m,
+        x_st_k,
+        y_ptr,
+        w_ptr,
+        s_ptr,
+        b_ptr,
+        sz_m,
+        sz_k,
+        sz_n,
+        sz_m_bkt,
+        grp_sz,
+        act: triton.language.constexpr,
+        bits: triton.language.constexpr,
+        blk_sz_m: triton.language.constexpr,
+        blk_sz_k: triton.language.constexpr,
+        blk_sz_n: triton.language.constexpr,
+        dtype: triton.language.constexpr,
+    ):
+        i = triton.language.program_id(0)
+        j = triton.language.program_id(1)
+
+        x_blk_ptr = triton.language.make_block_ptr(
+            base=x_ptr,
+            shape=(sz_m, sz_k),
+            strides=(x_st_m, x_st_k),
+            offsets=(i * blk_sz_m, 0),
+            block_shape=(blk_sz_m, blk_sz_k),
+            order=(1, 0),
+        )
+
+        range_n, msk_n = language.make_block(sz_n, blk_sz_n, j * blk_sz_n)
+        num_grp = triton.language.cdiv(sz_k, grp_sz)
+        acc = language.acc_zeros((blk_sz_m, blk_sz_n), dtype)
+
+        for k in range(0, sz_k, blk_sz_k):
+            range_k, msk_k = language.make_block(sz_k, blk_sz_k, k)
+            msk = msk_k[:, None] & msk_n[None, :]
+
+            if bits == 8:
+                w_off = range_n[None, :] * sz_k + range_k[:, None]
+                q = triton.language.load(w_ptr + w_off, msk, 0)
+            else:
+                w_off = range_n[None, :] * (sz_k // 2) + (range_k // 2)[:, None]
+                q = triton.language.load(w_ptr + w_off, msk, 0)
+                q = (q >> ((range_k % 2) * 4)[:, None]) & 0xF
+                q = triton.language.where(q < 8, q, q - 16)
+
+            s_off = range_n[None, :] * num_grp + (range_k // grp_sz)[:, None]
+            s = triton.language.load(s_ptr + s_off, msk, 0)
+            w = q.to(triton.language.float32) * s.to(triton.language.float32)
+
+            x = triton.language.load(x_blk_ptr, boundary_check=(0, 1))
+            acc += triton.language.dot(x, w.to(dtype), False)
+
+            x_blk_ptr = triton.language.advance(x_blk_ptr, (0, blk_sz_k))
+
+        if b_ptr is not None:
+            b = triton.language.load(b_ptr + range_n, msk_n, 0.0)
+            acc += b[None, :]
+
+        if act == "relu":
+            acc = language.relu(acc)
+        elif act == "leaky_relu":
+            acc = language.leaky_relu(acc, 1e-2)
+        elif act == "gelu":
+            acc = language.gelu_erf(acc)
+        elif act == "gelu_tanh":
+            acc = language.gelu(acc)
+        elif act == "silu":
+            acc = language.silu(acc)
+
+        y_blk_ptr = triton.language.make_block_ptr(
+            base=y_ptr,
+            shape=(sz_m, sz_n),
+            strides=(sz_n, 1),
+            offsets=(i * blk_sz_m, j * blk_sz_n),
+            block_shape=(blk_sz_m, blk_sz_n),
+            order=(1, 0),
+        )
+
+        triton.language.store(
+            y_blk_ptr, acc.to(dtype), mask=None, boundary_check=(0, 1)
+        )
@@ -0,0 +1,143 @@
+# Copyright 2023 ⓒ Kakao Brain Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import triton
+
+from trident import language
+
+
+class RMSNorm:
+    @staticmethod
+    @triton.jit
+    def forward(
+        inp_ptr,
+        vec_sz,
+        wgt_ptr,
+        eps,
+        out_ptr,
+        rstd_ptr,
+        blk_sz: triton.language.constexpr,
+    ):
+        pid = triton.language.program_id(0)
+        ptr_off = pid * vec_sz
+
+        inp_ptr += ptr_off
+        out_ptr += ptr_off
+
+        # A row that fits in one block is loaded once and kept in registers.
+        if vec_sz <= blk_sz:
+            blk, msk = language.make_block(vec_sz, blk_sz)
+            inp = language.upcast(triton.language.load(inp_ptr + blk, msk, 0))
+            rstd = 1.0 / language.std(
+                triton.language.sum(language.pow2(inp), 0) / vec_sz, eps
+            )
+            out = inp * rstd
+
+            if wgt_ptr is not None:
+                wgt = triton.language.load(wgt_ptr + blk, msk, 0)
+                out *= wgt
+
+            triton.language.store(out_ptr + blk, out, msk)
+        else:
+            acc = language.acc_scalar(inp_ptr, 0.0)
+
+            for blk_off in range(0, vec_sz, blk_sz):
+                blk, msk = language.make_block(vec_sz, blk_sz, blk_off)
+                inp = triton.language.load(inp_ptr + blk, msk, 0)
+                inp = language.upcast(inp)
+                acc += triton.language.sum(language.pow2(inp), 0)
+
+            rstd = 1.0 / language.std(acc / vec_sz, eps)
+
+            for blk_off in range(0, vec_sz, blk_sz):
+                blk, msk = language.make_block(vec_sz, blk_sz, blk_off)
+                inp = triton.language.load(inp_ptr + blk, msk, 0)
+                out = language.upcast(inp) * rstd
+
+                if wgt_ptr is not None:
+                    wgt = triton.language.load(wgt_ptr + blk, msk, 0)
+                    out *= wgt
+
+                triton.language.store(out_ptr + blk, out, msk)
+
+        triton.language.store(rstd_ptr + pid, rstd)
+
+    @staticmethod
+    @triton.jit
+    def backward(
+        grad_out_ptr,
+        inp_ptr,
+        grad_inp_ptr,
+        num_vec,
+        vec_sz,
+        wgt_ptr,
+        grad_wgt_ptr,
+        rstd_ptr,
+        vec_per_pid,
+        blk_sz: triton.language.constexpr,
+        deterministic: triton.language.constexpr,
+    ):
+        pid = triton.language.program_id(0)
+        vec_beg = pid * vec_per_pid
+        vec_end = triton.language.minimum(vec_beg + vec_per_pid, num_vec)
+
+        if deterministic:
+            if grad_wgt_ptr is not None:
+                grad_wgt_ptr += pid * vec_sz
+
+        for vec in range(vec_beg, vec_end):
+            ptr_off = vec * vec_sz
+            rstd = triton.language.load(rstd_ptr + vec)
+            acc = language.acc_scalar(inp_ptr, 0.0)
+
+            for blk_off in range(0, vec_sz, blk_sz):
+                blk, msk = language.make_block(vec_sz, blk_sz, blk_off)
+                grad_out = triton.language.load(grad_out_ptr + ptr_off + blk, msk, 0)
+                inp = triton.language.load(inp_ptr + ptr_off + blk, msk, 0)
+                grad_norm = language.upcast(grad_out)
+
+                if wgt_ptr is not None:
+                    wgt = triton.language.load(wgt_ptr + blk, msk, 0)
+                    grad_norm *= wgt
+
+                norm = language.upcast(inp) * rstd
+                acc += triton.language.sum(grad_norm * norm, 0)
+
+            acc /= vec_sz
+
+            for blk_off in range(0, vec_sz, blk_sz):
+                blk, msk = language.make_block(vec_sz, blk_sz, blk_off)
+                grad_out = triton.language.load(grad_out_ptr + ptr_off + blk, msk, 0)
+                inp = triton.language.load(inp_ptr + ptr_off + blk, msk, 0)
+                grad_out = language.upcast(grad_out)
+                grad_norm = grad_out
+
+                if wgt_ptr is not None:
+                    wgt = triton.language.load(wgt_ptr + blk, msk, 0)
+                    grad_norm *= wgt
+
+                norm = language.upcast(inp) * rstd
+                grad_inp = (grad_norm - norm * acc) * rstd
+
+                triton.language.store(grad_inp_ptr + ptr_off + blk, grad_inp, msk)
+
+                if grad_wgt_ptr is not None:
+                    grad_wgt = grad_out * norm
+
+                    if deterministic:
+                        grad_wgt += triton.language.load(grad_wgt_ptr + blk, msk, 0)
+                        triton.language.store(grad_wgt_ptr + blk, grad_wgt, msk)
+                    else:
+                        triton.language.atomic_add(grad_wgt_ptr + blk, grad_wgt, msk)
@@ -14,48 +14,156 @@
 
 import triton
 
-from trident import kernel, language
+from trident import language
 
 
 class Softmax:
     @staticmethod
     @triton.jit
-    def forward(inp_ptr, vec_sz, out_ptr, blk_sz: triton.language.constexpr):
+    def forward(
+        inp_ptr,
+        inp_st0,
+        inp_st1,
+        inp_st2,
+        inp_st3,
+        sz1,
+        sz2,
+        vec_sz,
+        out_ptr,
+        out_st0,
+        out_st1,
+        out_st2,
+        out_st3,
+        scale,
+        mask_ptr,
+        mask_st0,
+        mask_st1,
+        mask_st2,
+        mask_st3,
+        mask_bool: triton.language.constexpr,
+        causal: triton.language.constexpr,
+        log: triton.language.constexpr,
+        blk_sz: triton.language.constexpr,
+    ):
         pid = triton.language.program_id(0)
-        off = pid * vec_sz
-        inp_ptr += off
-        out_ptr += off
-        max = kernel.max(inp_ptr, vec_sz, blk_sz)
-        acc = 0.0
+        i0 = pid // (sz1 * sz2)
+        i1 = language.row(pid, sz1, sz2)
+        i2 = language.col(pid, sz2)
+        inp_ptr += i0 * inp_st0 + i1 * inp_st1 + i2 * inp_st2
+        out_ptr += i0 * out_st0 + i1 * out_st1 + i2 * out_st2
+
+        if mask_ptr is not None:
+            mask_ptr += i0 * mask_st0 + i1 * mask_st1 + i2 * mask_st2
+
+        max = language.acc_scalar(inp_ptr, -float("inf"))
+        acc = language.acc_scalar(inp_ptr, 0.0)
 
         for blk_off in range(0, vec_sz, blk_sz):
             blk, msk = language.make_block(vec_sz, blk_sz, blk_off)
-            inp = triton.language.load(inp_ptr + blk, msk, -float("inf"))
-            num = language.exp(inp - max)
-            acc += triton.language.sum(num, 0)
+            inp = triton.language.load(inp_ptr + blk * inp_st3, msk, 0)
+            inp = triton.language.where(
+                msk, language.upcast(inp) * scale, -float("inf")
+            )
+
+            if mask_ptr is not None:
+                mask = triton.language.load(mask_ptr + blk * mask_st3, msk, 0)
+
+                if mask_bool:
+                    inp = triton.language.where(mask != 0, inp, -float("inf"))
+                else:
+                    inp += language.upcast(mask)
+
+            if causal:
+                inp = triton.language.where(blk > i2, -float("inf"), inp)
+
+            blk_max = triton.language.maximum(max, triton.language.max(inp, 0))
+            num = triton.language.where(
+                blk_max == -float("inf"), 0, language.exp(inp - blk_max)
+            )
+            alpha = triton.language.where(
+                blk_max == -float("inf"), 0, language.exp(max - blk_max)
+            )
+            acc = acc * alpha + triton.language.sum(num, 0)
+            max = blk_max
 
         for blk_off in range(0, vec_sz, blk_sz):
             blk, msk = language.make_block(vec_sz, blk_sz, blk_off)
-            inp = triton.language.load(inp_ptr + blk, msk, -float("inf"))
-            out = language.exp(inp - max) / acc
-            triton.language.store(out_ptr + blk, out, msk)
+            inp = triton.language.load(inp_ptr + blk * inp_st3, msk, 0)
+            inp = triton.language.where(
+                msk, language.upcast(inp) * scale, -float("inf")
+            )
+
+            if mask_ptr is not None:
+                mask = triton.language.load(mask_ptr + blk * mask_st3, msk, 0)
+
+                if mask_bool:
+                    inp = triton.language.where(mask != 0, inp, -float("inf"))
+                else:
+                    inp += language.upcast(mask)
+
+            if causal:
+                inp = triton.language.where(blk > i2, -float("inf"), inp)
+
+            if log:
+                out = inp - max - triton.language.log(acc)
+            else:
+                out = language.exp(inp - max) / acc
+
+            triton.language.store(out_ptr + blk * out_st3, out, msk)
 
     @staticmethod
     @triton.jit
     def backward(
         grad_out_ptr,
+        grad_out_st0,
+        grad_out_st1,
+        grad_out_st2,
+        grad_out_st3,
         out_ptr,
+        out_st0,
+        out_st1,
+        out_st2,
+        out_st3,
+        sz1,
+        sz2,
         vec_sz,
         grad_inp_ptr,
+        grad_inp_st0,
+        grad_inp_st1,
+        grad_inp_st2,
+        grad_inp_st3,
+        scale,
+        log: triton.language.constexpr,
         blk_sz: triton.language.constexpr,
     ):
         pid = triton.language.program_id(0)
-        blk, msk = language.make_block(vec_sz, blk_sz, 0)
-        blk = blk + pid * vec_sz
+        i0 = pid // (sz1 * sz2)
+        i1 = language.row(pid, sz1, sz2)
+        i2 = language.col(pid, sz2)
+        grad_out_ptr += i0 * grad_out_st0 + i1 * grad_out_st1 + i2 * grad_out_st2
+        out_ptr += i0 * out_st0 + i1 * out_st1 + i2 * out_st2
+        grad_inp_ptr += i0 * grad_inp_st0 + i1 * grad_inp_st1 + i2 * grad_inp_st2
+        acc = language.acc_scalar(grad_out_ptr, 0.0)
+
+        for blk_off in range(0, vec_sz, blk_sz):
+            blk, msk = language.make_block(vec_sz, blk_sz, blk_off)
+            grad_out = triton.language.load(grad_out_ptr + blk * grad_out_st3, msk, 0)
+            grad_out = language.upcast(grad_out)
+
+            if log:
+                acc += triton.language.sum(grad_out, 0)
+            else:
+                out = triton.language.load(out_ptr + blk * out_st3, msk, 0)
+                acc += triton.language.sum(grad_out * out, 0)
+
+        for blk_off in range(0, vec_sz, blk_sz):
+            blk, msk = language.make_block(vec_sz, blk_sz, blk_off)
+            grad_out = triton.language.load(grad_out_ptr + blk * grad_out_st3, msk, 0)
+            out = triton.language.load(out_ptr + blk * out_st3, msk, 0)
 
-        grad_out = triton.language.load(grad_out_ptr + blk, msk, 0)
-        out = triton.language.load(out_ptr + blk, msk, 0)
-        grad_inp = language.diagflat(out, blk_sz) - (out[:, None] * out[None, :])
-        grad_inp = language.gemv(grad_inp, grad_out)
+            if log:
+                grad_inp = scale * (grad_out - language.exp(out) * acc)
+            else:
+                grad_inp = scale * out * (grad_out - acc)
 
-        triton.language.store(grad_inp_ptr + blk, grad_inp, msk)
+            triton.language.store(grad_inp_ptr + blk * grad_inp_st3, grad_inp, msk)
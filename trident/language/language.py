@@ -15,6 +15,22 @@
 import triton
 
 
+@triton.jit
+def acc_scalar(ptr, val):
+    if ptr.dtype.element_ty is triton.language.float64:
+        return triton.language.cast(val, triton.language.float64)
+    else:
+        return triton.language.cast(val, triton.language.float32)
+
+
+@triton.jit
+def acc_zeros(shape, dtype):
+    if dtype is triton.language.float64:
+        return triton.language.zeros(shape, triton.language.float64)
+    else:
+        return triton.language.zeros(shape, triton.language.float32)
+
+
 @triton.jit
 def batch(index, num_channels, num_rows, num_cols):
     return index // (num_channels * num_rows * num_cols)
@@ -42,6 +58,14 @@ def diagflat(x, sz):
     return dig * triton.language.ravel(x)
 
 
+@triton.jit
+def erf(x):
+    if x.dtype is triton.language.float32 or x.dtype is triton.language.float64:
+        return triton.language.erf(x)
+    else:
+        return triton.language.erf(x.to(triton.language.float32))
+
+
 @triton.jit
 def exp(x):
     if x.dtype is triton.language.float32 or x.dtype is triton.language.float64:
@@ -55,20 +79,32 @@ def gelu(x):
     return 0.5 * x * (1 + tanh(0.797884560803 * (x + 0.044715 * pow3(x))))
 
 
+@triton.jit
+def gelu_erf(x):
+    return 0.5 * x * (1 + erf(0.707106781187 * x))
+
+
 @triton.jit
 def gemv(a, x):
     return triton.language.sum(a * triton.language.trans(x[:, None]), 1)
 
 
 @triton.jit
-def make_conv2d_blk(ch_st, w_st, ch_bs, h_bs, w_bs):
-    blk = (
-        triton.language.arange(0, w_bs)[:, None]
-        + (triton.language.arange(0, h_bs) * w_st)[None, :]
-    )
+def make_conv2d_blk(ch_st, w_st, ch_bs, h_bs, w_bs, col_st=1):
+    blk = (triton.language.arange(0, w_bs) * col_st)[:, None] + (
+        triton.language.arange(0, h_bs) * w_st
+    )[None, :]
     return blk[:, :, None] + (triton.language.arange(0, ch_bs) * ch_st)[None, None, :]
 
 
+@triton.jit
+def make_conv2d_idx(k, ch, h, w, ch_last: triton.language.constexpr):
+    if ch_last:
+        return k % ch, k // (w * ch), k // ch % w
+    else:
+        return k // (h * w), k // w % h, k % w
+
+
 @triton.jit
 def make_conv2d_msk(ch, h, w, ch_bs, h_bs, w_bs):
     msk = (triton.language.arange(0, w_bs) < w)[:, None] & (
@@ -143,7 +179,15 @@ def std(var, eps=1e-05):
 
 @triton.jit
 def tanh(x):
-    return (exp(x) - exp(-x)) / (exp(x) + exp(-x))
+    return 1 - 2 / (exp(2 * x) + 1)
+
+
+@triton.jit
+def upcast(x):
+    if x.dtype is triton.language.float64:
+        return x
+    else:
+        return x.to(triton.language.float32)
 
 
 @triton.jit
@@ -153,6 +197,18 @@ def var(msk, x, sz, mean, axis=0, corr=1):
     ) / (sz - corr)
 
 
+@triton.jit
+def welford(mean, m2, cnt, x, msk):
+    blk_cnt = triton.language.sum(msk.to(triton.language.float32), 0)
+    blk_mean = triton.language.sum(triton.language.where(msk, x, 0.0), 0) / blk_cnt
+    blk_m2 = triton.language.sum(pow2(triton.language.where(msk, x - blk_mean, 0.0)), 0)
+    delta = blk_mean - mean
+    new_cnt = cnt + blk_cnt
+    mean += delta * blk_cnt / new_cnt
+    m2 += blk_m2 + pow2(delta) * cnt * blk_cnt / new_cnt
+    return mean, m2, new_cnt
+
+
 @triton.jit
 def relu(x):
     return triton.language.where(x > 0, x, 0)
@@ -161,3 +217,8 @@ def relu(x):
 @triton.jit
 def leaky_relu(x, a):
     return triton.language.where(x > 0, x, 0) + a * triton.language.where(x > 0, 0, x)
+
+
+@triton.jit
+def silu(x):
+    return x * sigmoid(x, x.dtype)
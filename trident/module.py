@@ -59,6 +59,37 @@ class AdaptiveAvgPool2d(torch.nn.Module):
         return x.view(num_batches, num_channels, height, width)
 
 
+class Attention(torch.nn.Module):
+    def __init__(self, is_causal=False, scale=None):
+        """
+        Applies Scaled Dot Product Attention to a query, a key and a value.
+
+        The attention is computed by tiles with an online softmax so that the score matrix is never stored.
+
+        Args:
+            is_causal: If True, a query attends only to the keys at the same or an earlier position
+            scale: a scaling factor applied to scores, 1 / sqrt(E) if None
+        """
+        super().__init__()
+
+        self.is_causal = is_causal
+        self.scale = scale
+
+    def forward(self, query, key, value):
+        """
+        Applies Scaled Dot Product Attention to a query, a key and a value.
+
+        Args:
+            query: a query (N, H, L, E)
+            key: a key (N, H, S, E)
+            value: a value (N, H, S, E)
+
+        Returns:
+            an output (N, H, L, E)
+        """
+        return function.attention(query, key, value, self.is_causal, self.scale)
+
+
 class BatchNorm1d(torch.nn.Module):
     def __init__(
         self,
@@ -133,7 +164,19 @@ class BatchNorm1d(torch.nn.Module):
 
 
 class Conv2d(torch.nn.Module):
-    def __init__(self, in_channels, out_channels, kernel_size, bias=True):
+    def __init__(
+        self,
+        in_channels,
+        out_channels,
+        kernel_size,
+        stride=1,
+        padding=0,
+        dilation=1,
+        groups=1,
+        bias=True,
+        device=None,
+        dtype=None,
+    ):
         """
         Applies Convolution 2D to an input.
 
@@ -141,21 +184,37 @@ class Conv2d(torch.nn.Module):
             in_channels: number of channels in the input image
             out_channels: number of channels produced by the convolution
             kernel_size: size of the convolution kernel
+            stride: stride of the convolution
+            padding: zero padding added to both sides of the input
+            dilation: spacing between kernel elements
+            groups: number of blocked connections from input channels to output channels
             bias: If True, adds a learnable bias to the output.
+            device: the desired device of returned tensor
+            dtype: the desired data type of returned tensor
         """
         super().__init__()
 
+        knl_h, knl_w = (
+            (kernel_size, kernel_size) if isinstance(kernel_size, int) else kernel_size
+        )
+
         self.in_channels = in_channels
-        self.weight = torch.empty(
-            out_channels,
-            in_channels,
-            kernel_size,
-            kernel_size,
-            device="cuda",
-            dtype=torch.float,
+        self.stride = stride
+        self.padding = padding
+        self.dilation = dilation
+        self.groups = groups
+        self.weight = torch.nn.Parameter(
+            torch.empty(
+                out_channels,
+                in_channels // groups,
+                knl_h,
+                knl_w,
+                device=device,
+                dtype=dtype,
+            )
         )
         self.bias = (
-            torch.empty(out_channels, device="cuda", dtype=torch.float)
+            torch.nn.Parameter(torch.empty(out_channels, device=device, dtype=dtype))
             if bias
             else None
         )
@@ -170,7 +229,50 @@ class Conv2d(torch.nn.Module):
         Returns:
             an output (N, C, R, C) or (C, R, C)
         """
-        return operation.Conv2d.apply(input, self.weight, self.bias)
+        return operation.Conv2d.apply(
+            input,
+            self.weight,
+            self.bias,
+            self.stride,
+            self.padding,
+            self.dilation,
+            self.groups,
+        )
+
+
+class CrossEntropyLoss(torch.nn.Module):
+    def __init__(self, ignore_index=-100, reduction="mean", inplace=False):
+        """
+        Computes Cross Entropy between logits and class indices.
+
+        The loss and its gradient are computed from the logits in a single pass, so the softmax probabilities are
+        never materialized.
+
+        Args:
+            ignore_index: a target value that is ignored and does not contribute to the input gradient
+            reduction: the reduction to apply to the output: 'none', 'mean' or 'sum'
+            inplace: If set to True, the gradient is written over the input when the input requires grad
+        """
+        super().__init__()
+
+        self.ignore_index = ignore_index
+        self.reduction = reduction
+        self.inplace = inplace
+
+    def forward(self, input, target):
+        """
+        Computes Cross Entropy between logits and class indices.
+
+        Args:
+            input: an input (N, C)
+            target: a target (N) with class indices in the range [0, C)
+
+        Returns:
+            an output (N) if reduction is 'none', otherwise a scalar
+        """
+        return function.cross_entropy(
+            input, target, self.ignore_index, self.reduction, self.inplace
+        )
 
 
 class Dropout(torch.nn.Module):
@@ -203,6 +305,40 @@ class Dropout(torch.nn.Module):
         )
 
 
+class GatedLinear(torch.nn.Module):
+    def __init__(
+        self, in_features, out_features, activation="silu", device=None, dtype=None
+    ):
+        """
+        Applies Gated Linear Transformation to an input. SwiGLU is computed with silu and GEGLU with gelu or gelu_tanh.
+
+        Args:
+            in_features: size of each input sample
+            out_features: size of each output sample
+            activation: activation function applied to a gate, one of silu, gelu and gelu_tanh
+            device: the desired device of returned tensor
+            dtype: the desired data type of returned tensor
+        """
+        super().__init__()
+
+        self.weight = torch.nn.Parameter(
+            torch.empty(2 * out_features, in_features, device=device, dtype=dtype)
+        )
+        self.activation = activation
+
+    def forward(self, input):
+        """
+        Applies Gated Linear Transformation to an input.
+
+        Args:
+            input: an input (*, in_features)
+
+        Returns:
+            an output (*, out_features) which is act(input @ weight[:out_features].T) * (input @ weight[out_features:].T)
+        """
+        return function.gated_linear(input, self.weight, self.activation)
+
+
 class GELU(torch.nn.Module):
     def __init__(self):
         """
@@ -279,6 +415,58 @@ class GroupNorm(torch.nn.Module):
         )
 
 
+class GroupedLinear(torch.nn.Module):
+    def __init__(
+        self,
+        num_groups,
+        in_features,
+        out_features,
+        bias=True,
+        device=None,
+        dtype=None,
+    ):
+        """
+        Applies Linear Transformation to each input of a group with its own weight and bias in a single launch.
+
+        Args:
+            num_groups: number of inputs in a group
+            in_features: size of each input sample
+            out_features: size of each output sample
+            bias: If set to False, the layer will not learn an additive bias
+            device: the desired device of returned tensor
+            dtype: the desired data type of returned tensor
+        """
+        super().__init__()
+
+        ctor_args = {"device": device, "dtype": dtype}
+        self.weight = torch.nn.Parameter(
+            torch.empty(num_groups, out_features, in_features, **ctor_args)
+        )
+
+        if bias:
+            self.bias = torch.nn.Parameter(
+                torch.empty(num_groups, out_features, **ctor_args)
+            )
+        else:
+            self.register_parameter("bias", None)
+
+    def forward(self, inputs):
+        """
+        Applies Linear Transformation to each input of a group.
+
+        Args:
+            inputs: a list of num_groups inputs (*, in_features) whose leading dimensions may differ
+
+        Returns:
+            a list of outputs (*, out_features)
+        """
+        return function.grouped_linear(
+            inputs,
+            list(self.weight),
+            None if self.bias is None else list(self.bias),
+        )
+
+
 class InstanceNorm1d(torch.nn.Module):
     def __init__(
         self,
@@ -521,7 +709,9 @@ class LeakyReLU(torch.nn.Module):
 
 
 class Linear(torch.nn.Module):
-    def __init__(self, in_features, out_features, bias=True, activation=None):
+    def __init__(
+        self, in_features, out_features, bias=True, activation=None, scale=1.0, p=0.0
+    ):
         """
         Applies Linear Transformation to an input.
 
@@ -529,7 +719,9 @@ class Linear(torch.nn.Module):
             in_features: size of each input sample
             out_features: size of each output sample
             bias: If set to False, the layer will not learn an additive bias
-            activation: activation function
+            activation: activation function, one of relu, leaky_relu, gelu, gelu_tanh and silu
+            scale: a value multiplied to an activated output
+            p: probability of an element of a scaled output to be zeroed
         """
         super().__init__()
 
@@ -543,18 +735,55 @@ class Linear(torch.nn.Module):
             self.register_parameter("bias", None)
 
         self.activation = activation
+        self.scale = scale
+        self.p = p
 
-    def forward(self, input):
+    def forward(self, input, residual=None):
         """
         Applies Linear Transformation to an input.
 
         Args:
             input: an input (*, in_features)
+            residual: a residual (*, out_features) added to an output
 
         Returns:
             an output (*, out_features)
         """
-        return function.linear(input, self.weight, self.bias, self.activation)
+        return function.linear(
+            input,
+            self.weight,
+            self.bias,
+            self.activation,
+            self.scale,
+            residual,
+            self.p,
+            self.training,
+        )
+
+
+class LogSoftmax(torch.nn.Module):
+    def __init__(self, dim=None):
+        """
+        Applies the logarithm of Softmax to an input.
+
+        Args:
+            dim: A dimension along which LogSoftmax will be computed
+        """
+        super().__init__()
+
+        self.dim = dim
+
+    def forward(self, input):
+        """
+        Applies the logarithm of Softmax to an input.
+
+        Args:
+            input: an input
+
+        Returns:
+            an output with the same dimension and shape as an input with values in the range [-inf, 0]
+        """
+        return function.log_softmax(input, self.dim)
 
 
 class MaxPool2d(torch.nn.Module):
@@ -582,6 +811,81 @@ class MaxPool2d(torch.nn.Module):
         return operation.MaxPool2d.apply(input, self.kernel_size)
 
 
+class QuantizedLinear(torch.nn.Module):
+    def __init__(
+        self,
+        in_features,
+        out_features,
+        bias=True,
+        activation=None,
+        bits=8,
+        group_size=None,
+        device=None,
+        dtype=None,
+    ):
+        """
+        Applies Linear Transformation with a weight-only quantized weight to an input. The weight is dequantized
+        on the fly, so only inference is supported.
+
+        Args:
+            in_features: size of each input sample
+            out_features: size of each output sample
+            bias: If set to False, the layer will not learn an additive bias
+            activation: activation function
+            bits: number of bits of a quantized weight, 8 or 4 where two values are packed into a byte
+            group_size: number of input features sharing a scale, in_features if None
+            device: the desired device of returned tensor
+            dtype: the desired data type of returned tensor
+        """
+        super().__init__()
+
+        group_size = in_features if group_size is None else group_size
+        assert in_features % group_size == 0
+
+        ctor_args = {"device": device, "dtype": dtype}
+        self.activation = activation
+        self.bits = bits
+        self.group_size = group_size
+
+        self.register_buffer(
+            "weight",
+            torch.empty(
+                out_features,
+                in_features if bits == 8 else in_features // 2,
+                device=device,
+                dtype=torch.int8,
+            ),
+        )
+        self.register_buffer(
+            "weight_scale",
+            torch.empty(out_features, in_features // group_size, **ctor_args),
+        )
+
+        if bias:
+            self.bias = torch.nn.Parameter(torch.empty(out_features, **ctor_args))
+        else:
+            self.register_parameter("bias", None)
+
+    def forward(self, input):
+        """
+        Applies Linear Transformation with a quantized weight to an input.
+
+        Args:
+            input: an input (*, in_features)
+
+        Returns:
+            an output (*, out_features)
+        """
+        return function.quantized_linear(
+            input,
+            self.weight,
+            self.weight_scale,
+            self.bias,
+            self.activation,
+            self.bits,
+        )
+
+
 class ReLU(torch.nn.Module):
     def __init__(self):
         """
@@ -630,6 +934,54 @@ class PReLU(torch.nn.Module):
         return operation.PReLU.apply(input, self.weight)
 
 
+class RMSNorm(torch.nn.Module):
+    def __init__(
+        self,
+        normalized_shape,
+        eps=None,
+        elementwise_affine=True,
+        device=None,
+        dtype=None,
+    ):
+        """
+        Applies Root Mean Square Layer Normalization to an input.
+
+        Args:
+            normalized_shape: input shape from an expected input of size
+            eps: a value added to the denominator for numerical stability, torch.finfo(input.dtype).eps if None
+            elementwise_affine: a boolean value that when set to True, this module has learnable per-element affine
+                                parameters initialized to ones
+            device: the desired device of returned tensor
+            dtype: the desired data type of returned tensor
+        """
+        super().__init__()
+
+        ctor_args = {"device": device, "dtype": dtype}
+        self.normalized_shape = normalized_shape
+        self.eps = eps
+        self.device = device
+        self.dtype = dtype
+
+        if elementwise_affine:
+            self.weight = torch.nn.Parameter(
+                torch.empty(normalized_shape, **ctor_args).fill_(1)
+            )
+        else:
+            self.register_parameter("weight", None)
+
+    def forward(self, input):
+        """
+        Applies Root Mean Square Layer Normalization to an input.
+
+        Args:
+            input: an input
+
+        Returns:
+            an output with the same dimension and shape as an input
+        """
+        return function.rms_norm(input, self.normalized_shape, self.weight, self.eps)
+
+
 class SiLU(torch.nn.Module):
     def __init__(self):
         """
@@ -672,4 +1024,4 @@ class Softmax(torch.nn.Module):
         Returns:
             an output with the same dimension and shape as an input with values in the range [0, 1]
         """
-        return operation.Softmax.apply(input, self.dim)
+        return function.softmax(input, self.dim)
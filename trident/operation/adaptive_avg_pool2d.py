@@ -14,7 +14,7 @@
 
 import torch
 
-from trident import kernel
+from trident import kernel, util
 
 
 class AdaptiveAvgPool2d(torch.autograd.Function):
@@ -22,8 +22,6 @@ class AdaptiveAvgPool2d(torch.autograd.Function):
     def forward(*args, **kwargs):
         x, output_size = args
 
-        assert x.is_cuda and x.is_contiguous()
-
         num_batches, num_channels, num_rows, num_cols = x.shape
 
         assert num_rows == num_cols
@@ -35,12 +33,11 @@ class AdaptiveAvgPool2d(torch.autograd.Function):
             num_channels,
             output_size,
             output_size,
+            device=x.device,
             dtype=x.dtype,
-            device="cuda",
+            memory_format=util.memory_format(x),
         )
 
-        assert y.is_contiguous()
-
         block_size = max(output_size // 2, 1)
         grid = lambda meta: (
             num_batches * num_channels * output_size * output_size // block_size,
@@ -50,10 +47,12 @@ class AdaptiveAvgPool2d(torch.autograd.Function):
             x.stride(0),
             x.stride(1),
             x.stride(2),
+            x.stride(3),
             y,
             y.stride(0),
             y.stride(1),
             y.stride(2),
+            y.stride(3),
             num_channels,
             num_rows,
             num_cols,
@@ -0,0 +1,181 @@
+# Copyright 2023 ⓒ Kakao Brain Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import torch
+import triton
+
+from trident import kernel, util
+
+
+class Attention(torch.autograd.Function):
+    @staticmethod
+    def forward(*args, **kwargs):
+        return Attention.__forward(*args, **kwargs)
+
+    @staticmethod
+    def setup_context(ctx, inputs, output):
+        q, k, v, causal, scale = inputs
+        out, lse = output
+        ctx.save_for_backward(q, k, v, out, lse)
+        ctx.causal = causal
+        ctx.scale = Attention.__get_scale(q, scale)
+        ctx.mark_non_differentiable(lse)
+
+    @staticmethod
+    def backward(ctx, *grad_outputs):
+        return Attention.__backward(
+            grad_outputs[0], *ctx.saved_tensors, ctx.causal, ctx.scale
+        )
+
+    @staticmethod
+    def __forward(q, k, v, causal, scale):
+        assert q.dim() == k.dim() == v.dim() == 4
+        assert k.shape == v.shape and q.shape[-1] == k.shape[-1]
+
+        num_bt, num_hd, sz_q, sz_d = q.shape
+        sz_k = k.shape[2]
+        blk_sz_m, blk_sz_n, blk_sz_d, num_warps = Attention.__get_block_sizes(
+            sz_d, q.element_size()
+        )
+
+        out = torch.empty_like(q, memory_format=torch.contiguous_format)
+        lse = torch.empty(
+            num_bt, num_hd, sz_q, device=q.device, dtype=util.acc_dtype(q.dtype)
+        )
+
+        def grid(meta):
+            return [triton.cdiv(sz_q, blk_sz_m), num_bt * num_hd]
+
+        kernel.Attention.forward[grid](
+            q,
+            *q.stride(),
+            k,
+            *k.stride(),
+            v,
+            *v.stride(),
+            out,
+            *out.stride(),
+            lse,
+            num_hd,
+            sz_q,
+            sz_k,
+            sz_d,
+            Attention.__get_scale(q, scale),
+            causal,
+            blk_sz_m,
+            blk_sz_n,
+            blk_sz_d,
+            num_warps=num_warps,
+        )
+
+        return out, lse
+
+    @staticmethod
+    def __backward(grad_out, q, k, v, out, lse, causal, scale):
+        num_bt, num_hd, sz_q, sz_d = q.shape
+        sz_k = k.shape[2]
+        blk_sz_m, blk_sz_n, blk_sz_d, num_warps = Attention.__get_block_sizes(
+            sz_d, q.element_size()
+        )
+
+        delta = torch.empty_like(lse)
+
+        def grid(meta):
+            return [triton.cdiv(sz_q, blk_sz_m), num_bt * num_hd]
+
+        kernel.Attention.backward_delta[grid](
+            grad_out,
+            *grad_out.stride(),
+            out,
+            *out.stride(),
+            delta,
+            num_hd,
+            sz_q,
+            sz_d,
+            blk_sz_m,
+            blk_sz_d,
+        )
+
+        grad_q = torch.empty_like(q, memory_format=torch.contiguous_format)
+        grad_k = torch.empty_like(k, memory_format=torch.contiguous_format)
+        grad_v = torch.empty_like(v, memory_format=torch.contiguous_format)
+
+        def grid(meta):
+            return [triton.cdiv(sz_k, blk_sz_n), num_bt * num_hd]
+
+        kernel.Attention.backward_key_value[grid](
+            q,
+            *q.stride(),
+            k,
+            *k.stride(),
+            v,
+            *v.stride(),
+            grad_out,
+            *grad_out.stride(),
+            lse,
+            delta,
+            grad_k,
+            grad_v,
+            num_hd,
+            sz_q,
+            sz_k,
+            sz_d,
+            scale,
+            causal,
+            blk_sz_m,
+            blk_sz_n,
+            blk_sz_d,
+            num_warps=num_warps,
+        )
+
+        def grid(meta):
+            return [triton.cdiv(sz_q, blk_sz_m), num_bt * num_hd]
+
+        kernel.Attention.backward_query[grid](
+            q,
+            *q.stride(),
+            k,
+            *k.stride(),
+            v,
+            *v.stride(),
+            grad_out,
+            *grad_out.stride(),
+            lse,
+            delta,
+            grad_q,
+            num_hd,
+            sz_q,
+            sz_k,
+            sz_d,
+            scale,
+            causal,
+            blk_sz_m,
+            blk_sz_n,
+            blk_sz_d,
+            num_warps=num_warps,
+        )
+
+        return grad_q, grad_k, grad_v, None, None
+
+    @staticmethod
+    def __get_block_sizes(sz_d, elem_sz):
+        blk_sz_d = max(triton.next_power_of_2(sz_d), 16)
+        blk_sz = 64 if blk_sz_d <= 64 and elem_sz <= 4 else 32
+
+        return blk_sz, blk_sz, blk_sz_d, 4
+
+    @staticmethod
+    def __get_scale(q, scale):
+        return q.shape[-1] ** -0.5 if scale is None else scale
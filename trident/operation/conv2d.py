@@ -12,74 +12,208 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+
 import torch
 import triton
 
-from trident import kernel
+from trident import kernel, util
 
 
 class Conv2d(torch.autograd.Function):
     @staticmethod
     def forward(*args, **kwargs):
-        return Conv2d.__forward(*args)
+        return Conv2d.__forward(*args, **kwargs)
 
     @staticmethod
     def setup_context(ctx, inputs, output):
-        pass
+        inp, wgt, bis, stride, padding, dilation, groups = inputs
+        ctx.save_for_backward(inp, wgt, bis)
+        ctx.stride = stride
+        ctx.padding = padding
+        ctx.dilation = dilation
+        ctx.groups = groups
+
+    @staticmethod
+    def backward(ctx, *grad_outputs):
+        return Conv2d.__backward(
+            *grad_outputs,
+            *ctx.saved_tensors,
+            ctx.stride,
+            ctx.padding,
+            ctx.dilation,
+            ctx.groups,
+        )
 
     @staticmethod
-    def __forward(inp, wgt, bis):
-        assert inp.is_contiguous() and wgt.is_contiguous()
+    def __forward(inp, wgt, bis, stride, padding, dilation, groups):
+        if inp.dim() == 3:
+            return Conv2d.__forward(
+                inp[None], wgt, bis, stride, padding, dilation, groups
+            )[0]
 
         inp_bt, inp_ch, inp_h, inp_w = inp.shape
         out_ch, wgt_ch, wgt_h, wgt_w = wgt.shape
-        out_h = Conv2d.__get_out_size(inp_h, wgt_h, 1)
-        out_w = Conv2d.__get_out_size(inp_w, wgt_w, 1)
+        str_h, str_w = Conv2d.__pair(stride)
+        pad_h, pad_w = Conv2d.__pair(padding)
+        dil_h, dil_w = Conv2d.__pair(dilation)
+
+        assert inp_ch == wgt_ch * groups and out_ch % groups == 0
 
-        out = torch.zeros(
-            inp_bt, out_ch, out_h, out_w, dtype=torch.float, device="cuda"
+        out_h = Conv2d.__get_out_size(inp_h, wgt_h, str_h, pad_h, dil_h)
+        out_w = Conv2d.__get_out_size(inp_w, wgt_w, str_w, pad_w, dil_w)
+        fmt = util.memory_format(inp)
+        out = torch.empty(
+            inp_bt,
+            out_ch,
+            out_h,
+            out_w,
+            device=inp.device,
+            dtype=inp.dtype,
+            memory_format=fmt,
         )
 
-        assert out.is_contiguous()
+        sz_m = inp_bt * out_h * out_w
+        sz_n = out_ch // groups
 
         def grid(meta):
-            return (
-                inp_bt
-                * out_ch
-                * ((out_h + meta["grp_sz"] - 1) // meta["grp_sz"])
-                * out_w,
-            )
+            return [
+                triton.cdiv(sz_m, meta["blk_sz_m"]),
+                triton.cdiv(sz_n, meta["blk_sz_n"]),
+                groups,
+            ]
 
         kernel.Conv2d.forward[grid](
             inp,
-            inp_ch,
             inp_h,
             inp_w,
-            inp.stride(0),
-            inp.stride(1),
-            inp.stride(2),
+            *inp.stride(),
             wgt,
             wgt_ch,
             wgt_h,
             wgt_w,
-            wgt.stride(0),
-            wgt.stride(1),
+            *wgt.stride(),
             bis,
             out,
-            out_ch,
             out_h,
             out_w,
-            out.stride(0),
-            out.stride(1),
-            out.stride(2),
-            triton.next_power_of_2(wgt_ch),
-            triton.next_power_of_2(wgt_h),
-            triton.next_power_of_2(wgt_w),
-            max(512 // triton.next_power_of_2(wgt_w), 1),
+            *out.stride(),
+            str_h,
+            str_w,
+            pad_h,
+            pad_w,
+            dil_h,
+            dil_w,
+            sz_m,
+            wgt_ch * wgt_h * wgt_w,
+            sz_n,
+            util.autotune_bucket(sz_m),
+            ch_last=fmt == torch.channels_last,
+            dtype=util.dtype(inp.dtype),
         )
 
         return out
 
     @staticmethod
-    def __get_out_size(in_size, wt_size, stride):
-        return ((in_size - wt_size) // stride) + 1
+    def __backward(grad_out, inp, wgt, bis, stride, padding, dilation, groups):
+        if inp.dim() == 3:
+            grad_inp, *grads = Conv2d.__backward(
+                grad_out[None], inp[None], wgt, bis, stride, padding, dilation, groups
+            )
+            return grad_inp[0], *grads
+
+        inp_bt, inp_ch, inp_h, inp_w = inp.shape
+        out_ch, wgt_ch, wgt_h, wgt_w = wgt.shape
+        _, _, out_h, out_w = grad_out.shape
+        str_h, str_w = Conv2d.__pair(stride)
+        pad_h, pad_w = Conv2d.__pair(padding)
+        dil_h, dil_w = Conv2d.__pair(dilation)
+
+        fmt = util.memory_format(inp)
+        grad_inp = torch.empty_like(inp, memory_format=fmt)
+        grad_wgt = torch.empty_like(wgt, memory_format=util.memory_format(wgt))
+        grad_bis = None if bis is None else torch.empty_like(bis)
+
+        sz_m = inp_bt * inp_h * inp_w
+
+        def grid(meta):
+            return [
+                triton.cdiv(sz_m, meta["blk_sz_m"]),
+                triton.cdiv(wgt_ch, meta["blk_sz_n"]),
+                groups,
+            ]
+
+        kernel.Conv2d.backward_input[grid](
+            grad_out,
+            out_h,
+            out_w,
+            *grad_out.stride(),
+            wgt,
+            wgt_h,
+            wgt_w,
+            *wgt.stride(),
+            grad_inp,
+            inp_h,
+            inp_w,
+            *grad_inp.stride(),
+            str_h,
+            str_w,
+            pad_h,
+            pad_w,
+            dil_h,
+            dil_w,
+            sz_m,
+            out_ch // groups * wgt_h * wgt_w,
+            wgt_ch,
+            util.autotune_bucket(sz_m),
+            ch_last=fmt == torch.channels_last,
+            dtype=util.dtype(inp.dtype),
+        )
+
+        sz_m = inp_bt * out_h * out_w
+        sz_k = wgt_ch * wgt_h * wgt_w
+        sz_n = out_ch // groups
+
+        def grid(meta):
+            return [
+                triton.cdiv(sz_n, meta["blk_sz_n"]),
+                triton.cdiv(sz_k, meta["blk_sz_k"]),
+                groups,
+            ]
+
+        kernel.Conv2d.backward_weight[grid](
+            grad_out,
+            out_h,
+            out_w,
+            *grad_out.stride(),
+            inp,
+            inp_h,
+            inp_w,
+            *inp.stride(),
+            grad_wgt,
+            wgt_h,
+            wgt_w,
+            *grad_wgt.stride(),
+            grad_bis,
+            str_h,
+            str_w,
+            pad_h,
+            pad_w,
+            dil_h,
+            dil_w,
+            sz_m,
+            sz_k,
+            sz_n,
+            util.autotune_bucket(sz_m),
+            ch_last=fmt == torch.channels_last,
+            dtype=util.dtype(wgt.dtype),
+        )
+
+        return grad_inp, grad_wgt, grad_bis, None, None, None, None
+
+    @staticmethod
+    def __get_out_size(in_size, wt_size, stride, padding, dilation):
+        return ((in_size + 2 * padding - dilation * (wt_size - 1) - 1) // stride) + 1
+
+    @staticmethod
+    def __pair(x):
+        return (x, x) if isinstance(x, int) else tuple(x)
@@ -0,0 +1,112 @@
+# Copyright 2023 ⓒ Kakao Brain Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import torch
+
+from trident import kernel, util
+
+
+class CrossEntropy(torch.autograd.Function):
+    @staticmethod
+    def forward(*args, **kwargs):
+        return CrossEntropy.__forward(*args, **kwargs)
+
+    @staticmethod
+    def setup_context(ctx, inputs, output):
+        inp, tgt, ignore_index, reduction, inplace = inputs
+        loss, grad = output
+        ctx.save_for_backward(grad)
+        ctx.reduction = reduction
+        ctx.inplace = inplace
+        ctx.used = False
+
+        if grad is not None:
+            ctx.mark_non_differentiable(grad)
+
+    @staticmethod
+    def backward(ctx, *grad_outputs):
+        # The in-place gradient is scaled where it is saved, so it can be used only once.
+        if ctx.inplace and ctx.used:
+            raise RuntimeError(
+                "Trying to backward through an in-place cross entropy a second time."
+            )
+
+        ctx.used = True
+        (grad,) = ctx.saved_tensors
+        return CrossEntropy.__backward(
+            grad_outputs[0], grad, ctx.reduction, ctx.inplace
+        )
+
+    @staticmethod
+    def __forward(inp, tgt, ignore_index, reduction, inplace):
+        assert inp.dim() == 2 and tgt.dim() == 1 and inp.shape[0] == tgt.shape[0]
+        assert reduction in ("none", "mean", "sum")
+
+        num_vec, vec_sz = inp.shape
+        requires_grad = inp.requires_grad
+
+        if inp.stride(1) != 1:
+            inp = inp.contiguous()
+
+        tgt = tgt.contiguous()
+
+        if not requires_grad:
+            grad = None
+        elif inplace:
+            grad = inp
+        else:
+            grad = torch.empty_like(inp)
+
+        loss = torch.empty(num_vec, device=inp.device, dtype=util.acc_dtype(inp.dtype))
+        num_valid = (tgt != ignore_index).sum() if reduction == "mean" else None
+
+        def grid(meta):
+            return [num_vec]
+
+        blk_sz = util.block_size(vec_sz, inp.element_size())
+        num_warps = util.num_warps(vec_sz, inp.element_size(), 4)
+
+        kernel.CrossEntropy.forward[grid](
+            inp,
+            inp.stride(0),
+            vec_sz,
+            tgt,
+            ignore_index,
+            num_valid,
+            loss,
+            grad,
+            0 if grad is None else grad.stride(0),
+            blk_sz,
+            num_warps=num_warps,
+        )
+
+        if reduction == "mean":
+            loss = loss.sum() / num_valid
+        elif reduction == "sum":
+            loss = loss.sum()
+
+        return loss.to(inp.dtype), grad
+
+    @staticmethod
+    def __backward(grad_out, grad, reduction, inplace):
+        if reduction == "none":
+            grad_out = grad_out[:, None]
+
+        if inplace:
+            grad = grad.mul_(grad_out)
+        else:
+            grad = grad * grad_out
+
+        return grad, None, None, None, None
@@ -0,0 +1,141 @@
+# Copyright 2023 ⓒ Kakao Brain Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import torch
+import triton
+
+from trident import kernel, util
+
+
+class GatedLinear(torch.autograd.Function):
+    @staticmethod
+    def forward(*args, **kwargs):
+        return GatedLinear.__forward(*args, **kwargs)
+
+    @staticmethod
+    def setup_context(ctx, inputs, output):
+        inp, wgt, act = inputs
+        ctx.save_for_backward(inp, wgt)
+        ctx.act = act
+
+    @staticmethod
+    def backward(ctx, *grad_outputs):
+        return GatedLinear.__backward(*grad_outputs, *ctx.saved_tensors, ctx.act)
+
+    @staticmethod
+    def __forward(inp, wgt, act):
+        assert inp.shape[-1] == wgt.shape[1]
+        assert wgt.shape[0] % 2 == 0
+        assert act in ("silu", "gelu", "gelu_tanh")
+
+        sh = inp.shape
+        inp = GatedLinear.__view(inp)
+        m, k = inp.shape
+        n = wgt.shape[0] // 2
+        out = torch.empty((m, n), device=inp.device, dtype=inp.dtype)
+
+        def grid(meta):
+            return [triton.cdiv(m, meta["blk_sz_m"]), triton.cdiv(n, meta["blk_sz_n"])]
+
+        kernel.GatedLinear.forward[grid](
+            inp,
+            *inp.stride(),
+            out,
+            wgt,
+            *wgt.stride(),
+            None,
+            None,
+            m,
+            k,
+            n,
+            util.autotune_bucket(m),
+            act=act,
+            dtype=util.dtype(inp.dtype),
+        )
+
+        return out.view(*sh[:-1], n)
+
+    @staticmethod
+    def __backward(grad_out, inp, wgt, act):
+        sh = inp.shape
+        inp = GatedLinear.__view(inp)
+        grad_out = grad_out.reshape(-1, grad_out.shape[-1]).contiguous()
+        m, k = inp.shape
+        n = wgt.shape[0] // 2
+        m_bkt = util.autotune_bucket(m)
+
+        # The gate and up projections are recomputed instead of being kept from the forward.
+        grad_gu = torch.empty((m, 2 * n), device=inp.device, dtype=inp.dtype)
+
+        def grid(meta):
+            return [triton.cdiv(m, meta["blk_sz_m"]), triton.cdiv(n, meta["blk_sz_n"])]
+
+        kernel.GatedLinear.forward[grid](
+            inp,
+            *inp.stride(),
+            None,
+            wgt,
+            *wgt.stride(),
+            grad_out,
+            grad_gu,
+            m,
+            k,
+            n,
+            m_bkt,
+            act=act,
+            dtype=util.dtype(inp.dtype),
+        )
+
+        grad_inp = torch.empty(inp.shape, device=inp.device, dtype=inp.dtype)
+        grad_wgt = torch.empty(wgt.shape, device=wgt.device, dtype=wgt.dtype)
+
+        def grid(meta):
+            return [triton.cdiv(m, meta["blk_sz_m"]), triton.cdiv(k, meta["blk_sz_k"])]
+
+        kernel.Linear.backward_input[grid](
+            grad_gu,
+            wgt,
+            *wgt.stride(),
+            grad_inp,
+            m,
+            2 * n,
+            k,
+            m_bkt,
+            dtype=util.dtype(inp.dtype),
+        )
+
+        def grid(meta):
+            return [
+                triton.cdiv(2 * n, meta["blk_sz_n"]),
+                triton.cdiv(k, meta["blk_sz_k"]),
+            ]
+
+        kernel.Linear.backward_weight[grid](
+            grad_gu,
+            inp,
+            *inp.stride(),
+            grad_wgt,
+            m,
+            2 * n,
+            k,
+            m_bkt,
+            dtype=util.dtype(inp.dtype),
+        )
+
+        return grad_inp.view(sh), grad_wgt, None
+
+    @staticmethod
+    def __view(x):
+        return x.reshape(-1, x.shape[-1])
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import torch
+import triton
 
 from trident import kernel, util
 
@@ -25,15 +26,14 @@ class GroupNorm(torch.autograd.Function):
     @staticmethod
     def setup_context(ctx, inputs, output):
         inp, num_groups, wgt, bis, eps = inputs
-        ctx.save_for_backward(inp, wgt, bis)
+        out, mean, rstd = output
+        ctx.save_for_backward(inp, wgt, bis, mean, rstd)
         ctx.num_groups = num_groups
-        ctx.eps = eps
+        ctx.mark_non_differentiable(mean, rstd)
 
     @staticmethod
     def backward(ctx, *grad_outputs):
-        return GroupNorm.__backward(
-            *grad_outputs, *ctx.saved_tensors, ctx.num_groups, ctx.eps
-        )
+        return GroupNorm.__backward(grad_outputs[0], *ctx.saved_tensors, ctx.num_groups)
 
     @staticmethod
     def __forward(inp, num_groups, wgt, bis, eps):
@@ -41,55 +41,76 @@ class GroupNorm(torch.autograd.Function):
         new_inp = inp.view(bt_sz * num_groups, vec_sz // num_groups)
 
         out = torch.empty_like(new_inp)
+        mean = torch.empty(
+            bt_sz * num_groups, device=inp.device, dtype=util.acc_dtype(inp.dtype)
+        )
+        rstd = torch.empty(
+            bt_sz * num_groups, device=inp.device, dtype=util.acc_dtype(inp.dtype)
+        )
 
         def grid(meta):
             return [bt_sz * num_groups]
 
         kernel.LayerGroupNorm.forward[grid](
             new_inp,
+            None,
             vec_sz // num_groups,
             wgt,
             bis,
             eps,
             out,
+            None,
+            mean,
+            rstd,
             num_groups,
             blk_sz=util.block_size(vec_sz // num_groups, new_inp.element_size()),
-            dtype=util.dtype(new_inp.dtype),
             num_warps=util.num_warps(vec_sz // num_groups, new_inp.element_size()),
         )
 
-        return out.view(bt_sz, vec_sz)
+        return out.view(bt_sz, vec_sz), mean, rstd
 
     @staticmethod
-    def __backward(grad_out, inp, wgt, bis, num_groups, eps):
+    def __backward(grad_out, inp, wgt, bis, mean, rstd, num_groups):
         bt_sz, vec_sz = inp.shape
-        new_inp = inp.view(bt_sz * num_groups, vec_sz // num_groups)
+        num_vec = bt_sz * num_groups
+        grp_sz = vec_sz // num_groups
+        new_inp = inp.view(num_vec, grp_sz)
+        deterministic = torch.are_deterministic_algorithms_enabled()
+        vec_per_pid = triton.cdiv(num_vec, min(num_vec, 256)) if deterministic else 1
+        num_stg = triton.cdiv(num_vec, vec_per_pid)
 
         grad_inp = torch.empty_like(inp)
-        grad_wgt = None if wgt is None else torch.zeros_like(wgt)
-        grad_bis = None if bis is None else torch.zeros_like(bis)
+        stg_grad_wgt = util.make_staging(wgt, num_stg, deterministic)
+        stg_grad_bis = util.make_staging(bis, num_stg, deterministic)
 
         def grid(meta):
-            return [bt_sz * num_groups]
+            return [num_stg]
 
         # TODO: Create a tensor in a kernel after a bug of Triton is fixed.
-        wgt = torch.zeros(vec_sz, device="cuda").fill_(1) if wgt is None else wgt
+        wgt = torch.zeros(vec_sz, device=inp.device).fill_(1) if wgt is None else wgt
 
         kernel.LayerGroupNorm.backward[grid](
             grad_out,
             new_inp,
             grad_inp,
-            vec_sz // num_groups,
+            num_vec,
+            grp_sz,
             wgt,
-            grad_wgt,
-            grad_bis,
-            eps,
+            stg_grad_wgt,
+            stg_grad_bis,
+            None,
+            mean,
+            rstd,
             num_groups,
-            blk_sz=util.block_size(vec_sz // num_groups, inp.element_size()),
-            dtype=util.dtype(inp.dtype),
-            num_warps=util.num_warps(vec_sz // num_groups, inp.element_size()),
+            vec_per_pid,
+            blk_sz=util.block_size(grp_sz, inp.element_size()),
+            deterministic=deterministic,
+            num_warps=util.num_warps(grp_sz, inp.element_size()),
         )
 
+        grad_wgt = util.reduce_staging(stg_grad_wgt, wgt, deterministic)
+        grad_bis = util.reduce_staging(stg_grad_bis, bis, deterministic)
+
         return (
             grad_inp,
             None,
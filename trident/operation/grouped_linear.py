@@ -0,0 +1,145 @@
+# Copyright 2023 ⓒ Kakao Brain Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import torch
+import triton
+
+from trident import kernel, util
+
+
+class GroupedLinear(torch.autograd.Function):
+    @staticmethod
+    def forward(*args, **kwargs):
+        return GroupedLinear.__forward(*args, **kwargs)
+
+    @staticmethod
+    def setup_context(ctx, inputs, output):
+        ctx.save_for_backward(*inputs[1:])
+        ctx.num_grp = inputs[0]
+
+    @staticmethod
+    def backward(ctx, *grad_outputs):
+        return GroupedLinear.__backward(grad_outputs, ctx.saved_tensors, ctx.num_grp)
+
+    @staticmethod
+    def __forward(num_grp, *args):
+        inps, wgts, biss = GroupedLinear.__split(args, num_grp)
+
+        for inp, wgt, bis in zip(inps, wgts, biss):
+            assert inp.shape[-1] == wgt.shape[1]
+            assert inp.dtype == inps[0].dtype and wgt.dtype == inps[0].dtype
+
+            if bis is not None:
+                assert bis.dtype == wgt.dtype and bis.is_contiguous()
+                assert bis.shape == wgt.shape[:1]
+
+        outs = [
+            torch.empty((*inp.shape[:-1], wgt.shape[0]), **GroupedLinear.__ctor(inp))
+            for inp, wgt in zip(inps, wgts)
+        ]
+        GroupedLinear.__launch(
+            [GroupedLinear.__view(inp) for inp in inps],
+            wgts,
+            biss,
+            [GroupedLinear.__view(out) for out in outs],
+        )
+
+        return tuple(outs)
+
+    @staticmethod
+    def __backward(grad_outs, tensors, num_grp):
+        inps, wgts, biss = GroupedLinear.__split(tensors, num_grp)
+        grad_outs = [GroupedLinear.__view(grad_out) for grad_out in grad_outs]
+        grad_inps = [
+            torch.empty(inp.shape, **GroupedLinear.__ctor(inp)) for inp in inps
+        ]
+        grad_wgts = [
+            torch.empty(wgt.shape, **GroupedLinear.__ctor(wgt)) for wgt in wgts
+        ]
+        inps = [GroupedLinear.__view(inp) for inp in inps]
+
+        GroupedLinear.__launch(
+            grad_outs,
+            [wgt.t() for wgt in wgts],
+            [None] * num_grp,
+            [GroupedLinear.__view(grad_inp) for grad_inp in grad_inps],
+        )
+        GroupedLinear.__launch(
+            [grad_out.t() for grad_out in grad_outs],
+            [inp.t() for inp in inps],
+            [None] * num_grp,
+            grad_wgts,
+        )
+
+        grad_biss = [
+            None if bis is None else grad_out.sum(0).to(bis.dtype)
+            for grad_out, bis in zip(grad_outs, biss)
+        ]
+
+        return None, *grad_inps, *grad_wgts, *grad_biss
+
+    @staticmethod
+    def __launch(inps, wgts, biss, outs):
+        device = inps[0].device
+        num_grp = len(inps)
+        # Pointers, sizes and strides of every group are packed into one tensor and copied once.
+        args = torch.tensor(
+            [
+                [
+                    inp.data_ptr(),
+                    wgt.data_ptr(),
+                    0 if bis is None else bis.data_ptr(),
+                    out.data_ptr(),
+                    *inp.shape,
+                    wgt.shape[0],
+                    *inp.stride(),
+                    *wgt.stride(),
+                ]
+                for inp, wgt, bis, out in zip(inps, wgts, biss, outs)
+            ],
+            dtype=torch.int64,
+            pin_memory=True,
+        ).to(device, non_blocking=True)
+        sz_m_max = max(inp.shape[0] for inp in inps)
+        num_sms = util.num_sms(device)
+
+        def grid(meta):
+            num_tiles = sum(
+                triton.cdiv(inp.shape[0], meta["blk_sz_m"])
+                * triton.cdiv(wgt.shape[0], meta["blk_sz_n"])
+                for inp, wgt in zip(inps, wgts)
+            )
+            return [max(1, min(num_tiles, num_sms))]
+
+        kernel.GroupedLinear.forward[grid](
+            args,
+            num_grp,
+            util.autotune_bucket(sz_m_max),
+            max(inp.shape[1] for inp in inps),
+            max(wgt.shape[0] for wgt in wgts),
+            dtype=util.dtype(inps[0].dtype),
+        )
+
+    @staticmethod
+    def __ctor(x):
+        return {"device": x.device, "dtype": x.dtype}
+
+    @staticmethod
+    def __split(args, num_grp):
+        return args[:num_grp], args[num_grp : 2 * num_grp], args[2 * num_grp :]
+
+    @staticmethod
+    def __view(x):
+        return x.reshape(-1, x.shape[-1])
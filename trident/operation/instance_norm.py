@@ -69,8 +69,6 @@ class InstanceNorm(torch.autograd.Function):
 
     @staticmethod
     def __forward(inp, run_mean, run_var, wgt, bis, eps):
-        assert inp.is_contiguous()
-
         num_bt, num_ch, vec_sz = inp.shape
         out = torch.empty_like(inp)
 
@@ -79,6 +77,7 @@ class InstanceNorm(torch.autograd.Function):
 
         kernel.InstanceNorm.forward[grid](
             inp,
+            *inp.stride(),
             num_ch,
             vec_sz,
             run_mean,
@@ -87,8 +86,8 @@ class InstanceNorm(torch.autograd.Function):
             bis,
             eps,
             out,
+            *out.stride(),
             util.block_size(vec_sz, inp.element_size()),
-            util.dtype(inp.dtype),
             num_warps=util.num_warps(vec_sz, inp.element_size(), 4),
         )
 
@@ -116,8 +115,11 @@ class InstanceNorm(torch.autograd.Function):
 
         kernel.InstanceNorm.backward[grid](
             grad_out,
+            *grad_out.stride(),
             inp,
+            *inp.stride(),
             grad_inp,
+            *grad_inp.stride(),
             num_ch,
             vec_sz,
             wgt,
@@ -171,21 +173,21 @@ class InstanceNorm(torch.autograd.Function):
             return
 
         num_bt, num_ch, vec_sz = inp.shape
-        mean = torch.zeros_like(run_mean)
-        var = torch.zeros_like(run_var)
+        mean = torch.zeros_like(run_mean, dtype=util.acc_dtype(run_mean.dtype))
+        var = torch.zeros_like(run_var, dtype=util.acc_dtype(run_var.dtype))
 
         def grid(meta):
             return [num_bt * num_ch]
 
         kernel.InstanceNorm.mean_var[grid](
             inp,
+            *inp.stride(),
             num_bt,
             num_ch,
             vec_sz,
             mean,
             var,
             util.block_size(vec_sz, inp.element_size()),
-            util.dtype(inp.dtype),
         )
 
         def grid(meta):
@@ -15,6 +15,7 @@
 import functools
 
 import torch
+import triton
 
 from trident import kernel, util
 
@@ -26,81 +27,95 @@ class LayerNorm(torch.autograd.Function):
 
     @staticmethod
     def setup_context(ctx, inputs, output):
-        inp, norm_sh, wgt, bis, eps = inputs
-        ctx.save_for_backward(inp, wgt, bis)
+        inp, norm_sh, wgt, bis, eps, res = inputs
+        out, res_out, mean, rstd = output
+        ctx.save_for_backward(inp if res is None else res_out, wgt, bis, mean, rstd)
         ctx.norm_sh = norm_sh
-        ctx.eps = eps
+        ctx.mark_non_differentiable(mean, rstd)
 
     @staticmethod
     def backward(ctx, *grad_outputs):
-        return LayerNorm.__backward(
-            *grad_outputs, *ctx.saved_tensors, ctx.norm_sh, ctx.eps
-        )
+        grad_out, grad_res, _, _ = grad_outputs
+        return LayerNorm.__backward(grad_out, grad_res, *ctx.saved_tensors, ctx.norm_sh)
 
     @staticmethod
-    def __forward(inp, norm_sh, wgt, bis, eps):
+    def __forward(inp, norm_sh, wgt, bis, eps, res):
         vec_sz = LayerNorm.__get_vec_sz(norm_sh)
         num_vec = inp.numel() // vec_sz
 
         out = torch.empty_like(inp)
+        res_out = None if res is None else torch.empty_like(inp)
+        mean = torch.empty(num_vec, device=inp.device, dtype=util.acc_dtype(inp.dtype))
+        rstd = torch.empty(num_vec, device=inp.device, dtype=util.acc_dtype(inp.dtype))
 
         def grid(meta):
             return [num_vec]
 
         kernel.LayerGroupNorm.forward[grid](
             inp,
+            res,
             vec_sz,
             wgt,
             bis,
             eps,
             out,
+            res_out,
+            mean,
+            rstd,
             1,
             blk_sz=util.block_size(vec_sz, inp.element_size()),
-            dtype=util.dtype(inp.dtype),
             num_warps=util.num_warps(vec_sz, inp.element_size()),
         )
 
-        return out
+        return out, res_out, mean, rstd
 
     @staticmethod
-    def __backward(grad_out, inp, wgt, bis, norm_sh, eps):
+    def __backward(grad_out, grad_res, inp, wgt, bis, mean, rstd, norm_sh):
         vec_sz = LayerNorm.__get_vec_sz(norm_sh)
         num_vec = inp.numel() // vec_sz
+        deterministic = torch.are_deterministic_algorithms_enabled()
+        vec_per_pid = triton.cdiv(num_vec, min(num_vec, 256)) if deterministic else 1
+        num_stg = triton.cdiv(num_vec, vec_per_pid)
 
         grad_inp = torch.empty_like(inp)
-        grad_wgt = None if wgt is None else torch.zeros_like(wgt)
-        grad_bis = None if bis is None else torch.zeros_like(bis)
+        stg_grad_wgt = util.make_staging(wgt, num_stg, deterministic)
+        stg_grad_bis = util.make_staging(bis, num_stg, deterministic)
 
         def grid(meta):
-            return [num_vec]
+            return [num_stg]
 
         # TODO: Create a tensor in a kernel after a bug of Triton is fixed.
-        wgt = torch.zeros(vec_sz, device="cuda").fill_(1) if wgt is None else wgt
+        wgt = torch.zeros(vec_sz, device=inp.device).fill_(1) if wgt is None else wgt
 
         kernel.LayerGroupNorm.backward[grid](
             grad_out,
             inp,
             grad_inp,
+            num_vec,
             vec_sz,
             wgt,
-            grad_wgt,
-            grad_bis,
-            eps,
+            stg_grad_wgt,
+            stg_grad_bis,
+            grad_res,
+            mean,
+            rstd,
             1,
+            vec_per_pid,
             blk_sz=util.block_size(vec_sz, inp.element_size()),
-            dtype=util.dtype(inp.dtype),
+            deterministic=deterministic,
             num_warps=util.num_warps(vec_sz, inp.element_size()),
         )
 
+        grad_wgt = util.reduce_staging(stg_grad_wgt, wgt, deterministic)
+        grad_bis = util.reduce_staging(stg_grad_bis, bis, deterministic)
+
         return (
             grad_inp,
             None,
             grad_wgt,
             grad_bis,
             None,
-            None,
-            None,
-            None,
+            None if grad_res is None else grad_inp,
         )
 
     @staticmethod
@@ -25,19 +25,34 @@ class Linear(torch.autograd.Function):
 
     @staticmethod
     def setup_context(ctx, inputs, output):
-        inp, wgt, bis, act = inputs
-        ctx.save_for_backward(inp, wgt, bis, output)
+        inp, wgt, bis, act, scale, res, p = inputs
+        out, pre, seed = output
+
+        if pre is not None:
+            ctx.mark_non_differentiable(pre)
+
+        ctx.save_for_backward(inp, wgt, bis, out if pre is None else pre)
         ctx.act = act
+        ctx.scale = scale
+        ctx.res = res is not None
+        ctx.p = p
+        ctx.seed = seed
 
     @staticmethod
     def backward(ctx, *grad_outputs):
-        return Linear.__backward(*grad_outputs, *ctx.saved_tensors, ctx.act)
+        return Linear.__backward(
+            grad_outputs[0],
+            *ctx.saved_tensors,
+            ctx.act,
+            ctx.scale,
+            ctx.res,
+            ctx.p,
+            ctx.seed,
+        )
 
     @staticmethod
-    def __forward(inp, wgt, bis, act):
-        assert inp.is_contiguous()
-        assert wgt.is_contiguous()
-        assert inp.shape[1] == wgt.shape[1]
+    def __forward(inp, wgt, bis, act, scale, res, p):
+        assert inp.shape[-1] == wgt.shape[1]
 
         if bis is not None:
             assert bis.is_contiguous()
@@ -48,22 +63,86 @@ class Linear(torch.autograd.Function):
 
         ctor_args = {"device": inp.device, "dtype": inp.dtype}
 
+        sh = inp.shape
+        inp = Linear.__view(inp)
         m, k = inp.shape
         n, _ = wgt.shape
-        grid = lambda meta: (
-            triton.cdiv(m, meta["blk_sz_m"]),
-            triton.cdiv(n, meta["blk_sz_n"]),
-        )
         y = torch.empty((m, n), **ctor_args)
 
+        m_bkt = util.autotune_bucket(m)
+
+        if res is not None:
+            assert res.shape == (*sh[:-1], n)
+            res = res.reshape(m, n)
+            res_st_m, res_st_n = res.stride()
+        else:
+            res_st_m = res_st_n = 0
+
+        # The input of the activation is kept when the output can't be used to compute the gradient.
+        if act in ("gelu", "gelu_tanh", "silu") or (
+            act and (res is not None or p > 0 or scale != 1.0)
+        ):
+            pre = torch.empty((m, n), **ctor_args)
+        else:
+            pre = None
+
+        seed = torch.random.seed() if p > 0 else 0
+
+        # Skinny inputs may split k across programs which accumulate into a workspace, and the autotuner benchmarks
+        # those configs against the ones that loop over all of k in a single program.
+        if m_bkt <= 64:
+            wsp = torch.empty(
+                (m, n), device=inp.device, dtype=util.acc_dtype(inp.dtype)
+            )
+            lck = torch.empty(
+                triton.cdiv(m, 16) * triton.cdiv(n, 64),
+                device=inp.device,
+                dtype=torch.int32,
+            )
+        else:
+            wsp = lck = None
+
+        def grid(meta):
+            return [
+                triton.cdiv(m, meta["blk_sz_m"]),
+                triton.cdiv(n, meta["blk_sz_n"]),
+                meta["split_k"],
+            ]
+
         kernel.Linear.forward[grid](
-            inp, y, wgt, bis, bis_st, m, k, n, act=act, dtype=util.dtype(inp.dtype)
+            inp,
+            *inp.stride(),
+            y,
+            wgt,
+            *wgt.stride(),
+            bis,
+            bis_st,
+            res,
+            res_st_m,
+            res_st_n,
+            pre,
+            wsp,
+            lck,
+            scale,
+            p,
+            seed,
+            m,
+            k,
+            n,
+            m_bkt,
+            act=act,
+            dtype=util.dtype(inp.dtype),
         )
 
-        return y
+        return y.view(*sh[:-1], n), pre, seed
 
     @staticmethod
-    def __backward(grad_out, inp, wgt, bis, out, act):
+    def __backward(grad_out, inp, wgt, bis, out, act, scale, res, p, seed):
+        sh = inp.shape
+        inp = Linear.__view(inp)
+        grad_res = grad_out if res else None
+        grad_out = grad_out.reshape(-1, grad_out.shape[-1]).contiguous()
+        out = out.view(-1, out.shape[-1])
         m, k = inp.shape
         n, _ = wgt.shape
 
@@ -82,30 +161,53 @@ class Linear(torch.autograd.Function):
             grad_bis,
             m,
             n,
+            scale,
+            p,
+            seed,
             act=act,
             blk_sz=util.block_size(n, grad_act.element_size()),
+            dtype=util.dtype(grad_act.dtype),
             num_warps=util.num_warps(n, grad_act.element_size()),
         )
 
-        def grid(meta):
-            return [
-                triton.cdiv(max(m, n), meta["blk_sz_m"]),
-                triton.cdiv(k, meta["blk_sz_k"]),
-            ]
+        grad_inp = torch.empty(inp.shape, **ctor_args)
+        grad_wgt = torch.empty(wgt.shape, device=wgt.device, dtype=wgt.dtype)
+        m_bkt = util.autotune_bucket(m)
 
-        grad_inp = torch.empty_like(inp)
-        grad_wgt = torch.empty_like(wgt)
+        def grid(meta):
+            return [triton.cdiv(m, meta["blk_sz_m"]), triton.cdiv(k, meta["blk_sz_k"])]
 
-        kernel.Linear.backward[grid](
+        kernel.Linear.backward_input[grid](
             grad_act,
             wgt,
-            inp,
+            *wgt.stride(),
             grad_inp,
+            m,
+            n,
+            k,
+            m_bkt,
+            dtype=util.dtype(inp.dtype),
+        )
+
+        def grid(meta):
+            return [triton.cdiv(n, meta["blk_sz_n"]), triton.cdiv(k, meta["blk_sz_k"])]
+
+        kernel.Linear.backward_weight[grid](
+            grad_act,
+            inp,
+            *inp.stride(),
             grad_wgt,
             m,
             n,
             k,
+            m_bkt,
             dtype=util.dtype(inp.dtype),
         )
 
-        return grad_inp, grad_wgt, grad_bis, None
+        return grad_inp.view(sh), grad_wgt, grad_bis, None, None, grad_res, None
+
+    @staticmethod
+    def __view(x):
+        # The kernels take a row and a column stride, so this is a view whenever the leading dimensions can be
+        # merged. Otherwise reshape copies, as the rows can't be addressed with a single stride.
+        return x.reshape(-1, x.shape[-1])
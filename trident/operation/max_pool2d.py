@@ -15,7 +15,7 @@
 import torch
 import triton
 
-from trident import kernel, math
+from trident import kernel, math, util
 
 
 class MaxPool2d(torch.autograd.Function):
@@ -29,15 +29,19 @@ class MaxPool2d(torch.autograd.Function):
 
     @staticmethod
     def __forward(inp, knl_sz):
-        assert inp.is_contiguous()
-
         inp_bt, inp_ch, inp_h, inp_w = inp.shape
         out_h = MaxPool2d.__get_out_size(inp_h, knl_sz)
         out_w = MaxPool2d.__get_out_size(inp_w, knl_sz)
 
-        out = torch.empty(inp_bt, inp_ch, out_h, out_w, dtype=inp.dtype, device="cuda")
-
-        assert out.is_contiguous()
+        out = torch.empty(
+            inp_bt,
+            inp_ch,
+            out_h,
+            out_w,
+            device=inp.device,
+            dtype=inp.dtype,
+            memory_format=util.memory_format(inp),
+        )
 
         grid = lambda meta: (
             inp_bt * inp_ch * out_h * triton.cdiv(out_w, meta["grp_sz"]),
@@ -55,12 +59,14 @@ class MaxPool2d(torch.autograd.Function):
             inp.stride(0),
             inp.stride(1),
             inp.stride(2),
+            inp.stride(3),
             out,
             out_h,
             out_w,
             out.stride(0),
             out.stride(1),
             out.stride(2),
+            out.stride(3),
             knl_sz,
             triton.next_power_of_2(knl_sz),
             grp_sz,
@@ -0,0 +1,74 @@
+# Copyright 2023 ⓒ Kakao Brain Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import torch
+import triton
+
+from trident import kernel, util
+
+
+class QuantizedLinear(torch.autograd.Function):
+    @staticmethod
+    def forward(*args, **kwargs):
+        return QuantizedLinear.__forward(*args, **kwargs)
+
+    @staticmethod
+    def setup_context(ctx, inputs, output):
+        pass
+
+    @staticmethod
+    def backward(ctx, *grad_outputs):
+        raise RuntimeError("QuantizedLinear only supports inference.")
+
+    @staticmethod
+    def __forward(inp, wgt, scl, bis, act, bits):
+        assert bits in (4, 8)
+        assert wgt.dtype == torch.int8 and wgt.is_contiguous()
+        assert scl.is_contiguous()
+
+        k = inp.shape[-1]
+        n = wgt.shape[0]
+        assert wgt.shape[1] == (k if bits == 8 else k // 2)
+        assert k % scl.shape[1] == 0
+
+        if bis is not None:
+            assert bis.is_contiguous() and bis.shape == (n,)
+
+        sh = inp.shape
+        inp = inp.reshape(-1, k)
+        m = inp.shape[0]
+        out = torch.empty((m, n), device=inp.device, dtype=inp.dtype)
+
+        def grid(meta):
+            return [triton.cdiv(m, meta["blk_sz_m"]), triton.cdiv(n, meta["blk_sz_n"])]
+
+        kernel.QuantizedLinear.forward[grid](
+            inp,
+            *inp.stride(),
+            out,
+            wgt,
+            scl,
+            bis,
+            m,
+            k,
+            n,
+            util.autotune_bucket(m),
+            k // scl.shape[1],
+            act=act,
+            bits=bits,
+            dtype=util.dtype(inp.dtype),
+        )
+
+        return out.view(*sh[:-1], n)
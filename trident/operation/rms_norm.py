@@ -0,0 +1,104 @@
+# Copyright 2023 ⓒ Kakao Brain Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import functools
+
+import torch
+import triton
+
+from trident import kernel, util
+
+
+class RMSNorm(torch.autograd.Function):
+    @staticmethod
+    def forward(*args, **kwargs):
+        return RMSNorm.__forward(*args, **kwargs)
+
+    @staticmethod
+    def setup_context(ctx, inputs, output):
+        inp, norm_sh, wgt, eps = inputs
+        out, rstd = output
+        ctx.save_for_backward(inp, wgt, rstd)
+        ctx.norm_sh = norm_sh
+        ctx.mark_non_differentiable(rstd)
+
+    @staticmethod
+    def backward(ctx, *grad_outputs):
+        return RMSNorm.__backward(grad_outputs[0], *ctx.saved_tensors, ctx.norm_sh)
+
+    @staticmethod
+    def __forward(inp, norm_sh, wgt, eps):
+        vec_sz = RMSNorm.__get_vec_sz(norm_sh)
+        num_vec = inp.numel() // vec_sz
+        eps = torch.finfo(inp.dtype).eps if eps is None else eps
+
+        inp = inp.contiguous()
+        out = torch.empty_like(inp)
+        rstd = torch.empty(num_vec, device=inp.device, dtype=util.acc_dtype(inp.dtype))
+
+        def grid(meta):
+            return [num_vec]
+
+        kernel.RMSNorm.forward[grid](
+            inp,
+            vec_sz,
+            wgt,
+            eps,
+            out,
+            rstd,
+            blk_sz=util.block_size(vec_sz, inp.element_size()),
+            num_warps=util.num_warps(vec_sz, inp.element_size()),
+        )
+
+        return out, rstd
+
+    @staticmethod
+    def __backward(grad_out, inp, wgt, rstd, norm_sh):
+        vec_sz = RMSNorm.__get_vec_sz(norm_sh)
+        num_vec = inp.numel() // vec_sz
+        deterministic = torch.are_deterministic_algorithms_enabled()
+        vec_per_pid = triton.cdiv(num_vec, min(num_vec, 256)) if deterministic else 1
+        num_stg = triton.cdiv(num_vec, vec_per_pid)
+
+        inp = inp.contiguous()
+        grad_out = grad_out.contiguous()
+        grad_inp = torch.empty_like(inp)
+        stg_grad_wgt = util.make_staging(wgt, num_stg, deterministic)
+
+        def grid(meta):
+            return [num_stg]
+
+        kernel.RMSNorm.backward[grid](
+            grad_out,
+            inp,
+            grad_inp,
+            num_vec,
+            vec_sz,
+            wgt,
+            stg_grad_wgt,
+            rstd,
+            vec_per_pid,
+            blk_sz=util.block_size(vec_sz, inp.element_size()),
+            deterministic=deterministic,
+            num_warps=util.num_warps(vec_sz, inp.element_size()),
+        )
+
+        grad_wgt = util.reduce_staging(stg_grad_wgt, wgt, deterministic)
+
+        return grad_inp, None, grad_wgt, None
+
+    @staticmethod
+    def __get_vec_sz(sh):
+        return functools.reduce(lambda x, y: x * y, sh)
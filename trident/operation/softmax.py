@@ -13,9 +13,8 @@
 # limitations under the License.
 
 import torch
-import triton
 
-from trident import kernel, math, util
+from trident import kernel, util
 
 
 class Softmax(torch.autograd.Function):
@@ -25,42 +24,117 @@ class Softmax(torch.autograd.Function):
 
     @staticmethod
     def setup_context(ctx, inputs, output):
+        inp, dim, scale, mask, causal, log = inputs
         ctx.save_for_backward(output)
+        ctx.dim = Softmax.__get_dim(inp, dim)
+        ctx.scale = scale
+        ctx.log = log
 
     @staticmethod
     def backward(ctx, *grad_outputs):
-        return Softmax.__backward(*grad_outputs, *ctx.saved_tensors)
+        return Softmax.__backward(
+            *grad_outputs, *ctx.saved_tensors, ctx.dim, ctx.scale, ctx.log
+        )
 
     @staticmethod
-    def __forward(inp, axis):
-        assert inp.is_contiguous()
-        assert axis == 1
+    def __forward(inp, dim, scale, mask, causal, log):
+        dim = Softmax.__get_dim(inp, dim)
 
-        num_vec, vec_sz = inp.shape
+        if causal:
+            assert inp.dim() >= 2 and dim == inp.dim() - 1
+
+        if mask is not None:
+            mask_view = Softmax.__view(mask.expand(inp.shape), dim)
+            mask_st = mask_view.stride()
+        else:
+            mask_view = None
+            mask_st = (0, 0, 0, 0)
+
+        inp_view = Softmax.__view(inp, dim)
+        out_view = torch.empty(inp_view.shape, device=inp.device, dtype=inp.dtype)
+        sz0, sz1, sz2, vec_sz = inp_view.shape
 
         def grid(meta):
-            return [num_vec]
+            return [sz0 * sz1 * sz2]
 
-        out = torch.empty_like(inp)
         blk_sz = util.block_size(vec_sz, inp.element_size())
         num_warps = util.num_warps(vec_sz, inp.element_size(), 4)
 
-        kernel.Softmax.forward[grid](inp, vec_sz, out, blk_sz, num_warps=num_warps)
+        kernel.Softmax.forward[grid](
+            inp_view,
+            *inp_view.stride(),
+            sz1,
+            sz2,
+            vec_sz,
+            out_view,
+            *out_view.stride(),
+            scale,
+            mask_view,
+            *mask_st,
+            mask is not None and mask.dtype == torch.bool,
+            causal,
+            log,
+            blk_sz,
+            num_warps=num_warps,
+        )
+
+        return Softmax.__unview(out_view, inp.shape, dim)
+
+    @staticmethod
+    def __backward(grad_out, out, dim, scale, log):
+        grad_out_view = Softmax.__view(grad_out, dim)
+        out_view = Softmax.__view(out, dim)
+        grad_inp_view = torch.empty(out_view.shape, device=out.device, dtype=out.dtype)
+        sz0, sz1, sz2, vec_sz = out_view.shape
+
+        def grid(meta):
+            return [sz0 * sz1 * sz2]
+
+        blk_sz = util.block_size(vec_sz, out.element_size())
+        num_warps = util.num_warps(vec_sz, out.element_size(), 4)
+
+        kernel.Softmax.backward[grid](
+            grad_out_view,
+            *grad_out_view.stride(),
+            out_view,
+            *out_view.stride(),
+            sz1,
+            sz2,
+            vec_sz,
+            grad_inp_view,
+            *grad_inp_view.stride(),
+            scale,
+            log,
+            blk_sz,
+            num_warps=num_warps,
+        )
+
+        grad_inp = Softmax.__unview(grad_inp_view, out.shape, dim)
+
+        return grad_inp, None, None, None, None, None
+
+    @staticmethod
+    def __get_dim(inp, dim):
+        if dim is None:
+            dim = 0 if inp.dim() in (0, 1, 3) else 1
 
-        return out
+        return dim % max(inp.dim(), 1)
 
     @staticmethod
-    def __backward(grad_out, out):
-        assert grad_out.is_contiguous() and out.is_contiguous()
+    def __view(x, dim):
+        x = x.movedim(dim, -1) if x.dim() > 0 else x.view(1)
 
-        num_vec, vec_sz = out.shape
+        while x.dim() < 4:
+            x = x.unsqueeze(0)
 
-        def grid(meta):
-            return [num_vec]
+        return x.flatten(0, x.dim() - 4)
 
-        grad_inp = torch.empty_like(out)
-        blk_sz = max(triton.next_power_of_2(vec_sz), 16)
+    @staticmethod
+    def __unview(x, sh, dim):
+        if len(sh) == 0:
+            return x.view(sh)
 
-        kernel.Softmax.backward[grid](grad_out, out, vec_sz, grad_inp, blk_sz)
+        sh = list(sh)
+        sh.append(sh.pop(dim))
 
-        return grad_inp, None
+        return x.view(sh).movedim(-1, dim)
@@ -0,0 +1,161 @@
+# Copyright 2023 ⓒ Kakao Brain Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import hashlib
+import inspect
+import json
+import os
+
+import torch
+import triton
+
+
+def autotune_cache_path():
+    return os.environ.get(
+        "TRIDENT_AUTOTUNE_CACHE",
+        os.path.join(os.path.expanduser("~"), ".cache", "trident", "autotune"),
+    )
+
+
+def autotune_cache_tag(fn):
+    while not isinstance(fn, triton.runtime.JITFunction) and hasattr(fn, "fn"):
+        fn = fn.fn
+
+    if isinstance(fn, triton.runtime.JITFunction):
+        src_hash = fn.cache_key
+    elif fn is None:
+        src_hash = ""
+    else:
+        src_hash = hashlib.sha256(inspect.getsource(fn).encode()).hexdigest()
+
+    tag = f"{triton.__version__}-{src_hash[:16]}"
+    salt = os.environ.get("TRIDENT_AUTOTUNE_CACHE_INVALIDATE", "")
+
+    # Invalidating starts a fresh tag instead of deleting entries that other processes share,
+    # so they retune only once for each value.
+    return tag if salt in ("", "0") else f"{tag}-{salt}"
+
+
+def autotune_cache_dir(name, tag):
+    return os.path.join(autotune_cache_path(), name, tag)
+
+
+def read_autotune_cache(name, tag):
+    entries = []
+
+    try:
+        file_names = sorted(os.listdir(autotune_cache_dir(name, tag)))
+    except OSError:
+        return entries
+
+    for file_name in file_names:
+        if not file_name.endswith(".json"):
+            continue
+
+        try:
+            with open(os.path.join(autotune_cache_dir(name, tag), file_name)) as f:
+                entries.append(json.load(f))
+        except (OSError, ValueError):
+            pass
+
+    return entries
+
+
+def write_autotune_cache(name, tag, dev, key, config):
+    path = autotune_cache_dir(name, tag)
+    file_name = hashlib.sha256(f"{dev}/{key}".encode()).hexdigest()
+    entry = {
+        "device": dev,
+        "key": key,
+        "kwargs": config.kwargs,
+        "num_warps": config.num_warps,
+        "num_stages": config.num_stages,
+    }
+
+    try:
+        os.makedirs(path, exist_ok=True)
+
+        with open(os.path.join(path, f"{file_name}.{os.getpid()}"), "w") as f:
+            json.dump(entry, f, indent=2)
+
+        os.replace(
+            os.path.join(path, f"{file_name}.{os.getpid()}"),
+            os.path.join(path, f"{file_name}.json"),
+        )
+    except OSError:
+        pass
+
+
+def device_name(device=None):
+    if device is None:
+        return torch.cuda.get_device_name() if torch.cuda.is_available() else "cpu"
+
+    if device.type == "cuda":
+        return torch.cuda.get_device_name(device)
+
+    return device.type
+
+
+class AutotuneCache(dict):
+    def __init__(self, name, configs, tuner=None):
+        super().__init__()
+
+        self.name = name
+        self.tag = autotune_cache_tag(tuner)
+        self.tuner = tuner
+
+        for entry in read_autotune_cache(name, self.tag):
+            for config in configs:
+                if (
+                    config.kwargs == entry["kwargs"]
+                    and config.num_warps == entry["num_warps"]
+                    and config.num_stages == entry["num_stages"]
+                ):
+                    super().__setitem__((entry["device"], entry["key"]), config)
+                    break
+
+    def __contains__(self, key):
+        return super().__contains__((self.__device_name(), str(key)))
+
+    def __getitem__(self, key):
+        return super().__getitem__((self.__device_name(), str(key)))
+
+    def __setitem__(self, key, config):
+        dev = self.__device_name()
+        super().__setitem__((dev, str(key)), config)
+        write_autotune_cache(self.name, self.tag, dev, str(key), config)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def __device_name(self):
+        for arg in (getattr(self.tuner, "nargs", None) or {}).values():
+            if isinstance(arg, torch.Tensor):
+                return device_name(arg.device)
+
+        return device_name()
+
+
+def load_autotune_cache(kernel):
+    for cls_name, cls in vars(kernel).items():
+        if not isinstance(cls, type):
+            continue
+
+        for fn_name, fn in vars(cls).items():
+            if isinstance(fn, staticmethod):
+                fn = fn.__func__
+
+            if isinstance(fn, triton.runtime.Autotuner):
+                fn.cache = AutotuneCache(f"{cls_name}.{fn_name}", fn.configs, fn)
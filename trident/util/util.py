@@ -15,7 +15,9 @@
 import torch
 import triton
 
-from trident import math, module
+from trident import function, kernel, math, module
+
+autotune_buckets = []
 
 
 def fill(inp, val):
@@ -28,14 +30,30 @@ def dtype(inp):
         return triton.language.float32
     if inp == torch.float16:
         return triton.language.float16
+    if inp == torch.bfloat16:
+        return triton.language.bfloat16
+    if inp == torch.float64:
+        return triton.language.float64
     else:
         raise NotImplementedError(inp)
 
 
+def acc_dtype(inp):
+    return torch.float64 if inp == torch.float64 else torch.float32
+
+
 def shared_memory_size_per_block():
     return 64 * 1024
 
 
+def autotune_bucket(sz):
+    for bkt in autotune_buckets:
+        if sz <= bkt:
+            return bkt
+
+    return triton.next_power_of_2(sz)
+
+
 def block_size(num_elem, elem_sz):
     return min(
         triton.next_power_of_2(num_elem),
@@ -43,6 +61,109 @@ def block_size(num_elem, elem_sz):
     )
 
 
+def memory_format(inp):
+    if inp.dim() == 4 and not inp.is_contiguous():
+        if inp.is_contiguous(memory_format=torch.channels_last):
+            return torch.channels_last
+
+    return torch.contiguous_format
+
+
+def make_staging(x, num_stg, deterministic):
+    if x is None:
+        return None
+
+    if deterministic:
+        return torch.zeros(
+            num_stg, x.numel(), device=x.device, dtype=acc_dtype(x.dtype)
+        )
+
+    return torch.zeros(x.shape, device=x.device, dtype=acc_dtype(x.dtype))
+
+
+def reduce_staging(stg, x, deterministic):
+    if stg is None:
+        return None
+
+    if not deterministic:
+        return stg.to(x.dtype)
+
+    num_stg, vec_sz = stg.shape
+    out = torch.empty_like(x)
+
+    def grid(meta):
+        return [vec_sz]
+
+    kernel.sum[grid](
+        out,
+        stg,
+        num_stg,
+        vec_sz,
+        0,
+        block_size(num_stg, stg.element_size()),
+        dtype(out.dtype),
+    )
+
+    return out
+
+
+def num_sms(device):
+    return torch.cuda.get_device_properties(device).multi_processor_count
+
+
+def quantize(wgt, bits=8, grp_sz=None):
+    n, k = wgt.shape
+    grp_sz = k if grp_sz is None else grp_sz
+    max_qnt = 2 ** (bits - 1) - 1
+    assert bits in (4, 8) and k % grp_sz == 0 and (bits == 8 or k % 2 == 0)
+
+    wgt = wgt.detach().float().view(n, k // grp_sz, grp_sz)
+    scl = wgt.abs().amax(2, keepdim=True).clamp(min=1e-12) / max_qnt
+    qnt = torch.round(wgt / scl).clamp(-max_qnt - 1, max_qnt).to(torch.int8).view(n, k)
+
+    if bits == 4:
+        qnt = (qnt[:, 0::2] & 0xF) | (qnt[:, 1::2] << 4)
+
+    return qnt, scl.view(n, k // grp_sz)
+
+
+def quantize_module(mod, bits=8, group_size=None):
+    if not isinstance(mod, (torch.nn.Linear, module.Linear)):
+        return None
+
+    if getattr(mod, "scale", 1.0) != 1.0 or getattr(mod, "p", 0.0) > 0.0:
+        return None
+
+    out_features, in_features = mod.weight.shape
+    qnt_mod = module.QuantizedLinear(
+        in_features,
+        out_features,
+        mod.bias is not None,
+        getattr(mod, "activation", None),
+        bits,
+        group_size,
+        mod.weight.device,
+        mod.weight.dtype,
+    )
+
+    qnt, scl = quantize(mod.weight, bits, qnt_mod.group_size)
+    qnt_mod.weight.copy_(qnt)
+    qnt_mod.weight_scale.copy_(scl)
+
+    if mod.bias is not None:
+        qnt_mod.bias.data.copy_(mod.bias.detach())
+
+    return qnt_mod
+
+
+def quantize_model(model, bits=8, group_size=None):
+    for name, child in model.named_children():
+        if other := quantize_module(child, bits, group_size):
+            setattr(model, name, other)
+        else:
+            quantize_model(child, bits, group_size)
+
+
 def optimize_module(mod):
     opt_mod = None
 
@@ -64,6 +185,10 @@ def optimize_module(mod):
         opt_mod = module.LayerNorm(
             mod.normalized_shape, mod.eps, mod.elementwise_affine
         )
+    elif isinstance(mod, torch.nn.LogSoftmax):
+        opt_mod = module.LogSoftmax(mod.dim)
+    elif hasattr(torch.nn, "RMSNorm") and isinstance(mod, torch.nn.RMSNorm):
+        opt_mod = module.RMSNorm(mod.normalized_shape, mod.eps, mod.elementwise_affine)
     elif isinstance(mod, torch.nn.Softmax):
         opt_mod = module.Softmax(mod.dim)
 
@@ -92,3 +217,19 @@ def num_warps(num_elem, elem_sz, corr=1):
 def zero(inp):
     with torch.no_grad():
         return inp.zero_()
+
+
+def set_autotune_buckets(buckets):
+    autotune_buckets.clear()
+    autotune_buckets.extend(sorted(buckets))
+
+
+def warm_up_linear(shapes, dtype=torch.float32, device="cuda", backward=True):
+    for m, k, n in shapes:
+        ctor_args = {"device": device, "dtype": dtype, "requires_grad": backward}
+        inp = torch.randn(m, k, **ctor_args)
+        wgt = torch.randn(n, k, **ctor_args)
+        out = function.linear(inp, wgt)
+
+        if backward:
+            out.backward(torch.ones_like(out))